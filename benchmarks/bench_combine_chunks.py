@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pydub accumulation vs. streamed chunk combining.
+
+Builds books of 50, 500 and 2000 synthetic chunk WAVs and combines them:
+
+  pydub   - combined += AudioSegment.from_wav(chunk) (the old combine_chunks);
+            every addition copies the whole accumulated buffer
+  stream  - append_files() into a sink, each chunk copied once
+
+Both write a WAV so only assembly is timed. With --encode the streamed
+path pipes into ffmpeg (MP3) like combine_chunks does now, and pydub
+exports MP3 as before. The per-chunk time should stay flat for "stream"
+and grow with book length for "pydub".
+
+Usage:
+    python benchmarks/bench_combine_chunks.py
+    python benchmarks/bench_combine_chunks.py --sizes 50 500 --chunk-seconds 20 --encode
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from audio_sink import AudioSink, FFmpegPipeSink, append_files  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def make_chunks(workdir: Path, count: int, seconds: float) -> list:
+    rng = np.random.default_rng(0)
+    audio = (0.1 * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+    paths = []
+    for i in range(count):
+        path = workdir / f"chunk_{i:04d}.wav"
+        sf.write(str(path), audio, SAMPLE_RATE)
+        paths.append(path)
+    return paths
+
+
+def run_pydub(paths: list, out: Path, encode: bool) -> float:
+    from pydub import AudioSegment
+
+    start = time.perf_counter()
+    combined = AudioSegment.empty()
+    for p in paths:
+        combined += AudioSegment.from_wav(str(p))
+    if encode:
+        combined.export(str(out.with_suffix(".mp3")), format="mp3", bitrate="128k")
+    else:
+        combined.export(str(out), format="wav")
+    return time.perf_counter() - start
+
+
+def run_stream(paths: list, out: Path, encode: bool) -> float:
+    start = time.perf_counter()
+    if encode:
+        args = ["-f", "mp3", "-b:a", "128k", str(out.with_suffix(".mp3"))]
+        with FFmpegPipeSink(args, SAMPLE_RATE) as sink:
+            append_files(sink, paths)
+    else:
+        with AudioSink(out) as sink:
+            append_files(sink, paths)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--chunk-seconds", type=float, default=5.0)
+    parser.add_argument("--encode", action="store_true", help="Encode MP3 via ffmpeg")
+    parser.add_argument("--skip-pydub", action="store_true")
+    args = parser.parse_args()
+
+    methods = [("stream", run_stream)]
+    if not args.skip_pydub:
+        try:
+            import pydub  # noqa: F401
+            methods.insert(0, ("pydub", run_pydub))
+        except ImportError:
+            print("[!] pydub not installed - timing the streamed path only")
+
+    print(f"{'chunks':>7} {'method':<7} {'seconds':>9} {'ms/chunk':>9}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            workdir = Path(tmp)
+            paths = make_chunks(workdir, size, args.chunk_seconds)
+            for name, fn in methods:
+                seconds = fn(paths, workdir / f"{name}.wav", args.encode)
+                print(f"{size:>7} {name:<7} {seconds:>9.2f} {1000 * seconds / size:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
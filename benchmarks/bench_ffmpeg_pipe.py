@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: combined.wav + ffmpeg vs. PCM piped into ffmpeg.
+
+Writes synthetic chapter WAVs, then encodes them to AAC/M4B both ways:
+
+  file  - concatenate the chapters into temp/combined.wav, run ffmpeg on it
+          (the old _save_audiobook path)
+  pipe  - stream the chapters into ffmpeg's stdin with FFmpegPipeSink
+
+and reports wall time and peak scratch disk (bytes written besides the
+chapter files and the output).
+
+Usage:
+    python benchmarks/bench_ffmpeg_pipe.py --minutes 60 --chapters 20
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from audio_sink import AudioSink, FFmpegPipeSink  # noqa: E402
+
+SAMPLE_RATE = 24000
+FFMPEG_ARGS = ["-map", "0:a", "-c:a", "aac", "-b:a", "64k"]
+
+
+def make_chapters(workdir: Path, minutes: float, chapters: int) -> list:
+    rng = np.random.default_rng(0)
+    frames = int(minutes * 60 * SAMPLE_RATE / chapters)
+    paths = []
+    for i in range(chapters):
+        path = workdir / f"chapter_{i:03d}.wav"
+        with AudioSink(path, SAMPLE_RATE) as sink:
+            for start in range(0, frames, SAMPLE_RATE * 60):
+                n = min(SAMPLE_RATE * 60, frames - start)
+                sink.write((0.1 * rng.standard_normal(n)).astype(np.float32))
+        paths.append(path)
+    return paths
+
+
+def run_file(paths: list, workdir: Path) -> dict:
+    start = time.perf_counter()
+    combined = workdir / "combined.wav"
+    parts = [sf.read(str(p))[0] for p in paths]
+    sf.write(str(combined), np.concatenate(parts), SAMPLE_RATE)
+    scratch = combined.stat().st_size
+    del parts
+    out = workdir / "file.m4b"
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", str(combined)] + FFMPEG_ARGS + [str(out)],
+        check=True,
+    )
+    combined.unlink()
+    return {"seconds": time.perf_counter() - start, "scratch_bytes": scratch}
+
+
+def run_pipe(paths: list, workdir: Path) -> dict:
+    start = time.perf_counter()
+    out = workdir / "pipe.m4b"
+    with FFmpegPipeSink(FFMPEG_ARGS + [str(out)], SAMPLE_RATE) as encoder:
+        for p in paths:
+            encoder.append_file(p)
+    if encoder.returncode != 0:
+        raise RuntimeError(encoder.error)
+    return {"seconds": time.perf_counter() - start, "scratch_bytes": 0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=30, help="Total audio length")
+    parser.add_argument("--chapters", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        print(f"[*] Writing {args.minutes:g} min of audio in {args.chapters} chapters...")
+        paths = make_chapters(workdir, args.minutes, args.chapters)
+
+        for name, fn in (("file", run_file), ("pipe", run_pipe)):
+            result = fn(paths, workdir)
+            print(
+                f"[+] {name:<5} {result['seconds']:7.2f}s  "
+                f"scratch {result['scratch_bytes'] / 1024 ** 2:8.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HTML-to-text extraction of EPUB spine items per backend.
+
+Takes the (X)HTML documents of an EPUB given with --epub, or builds a
+synthetic omnibus of --megabytes of XHTML chapters, and extracts text with:
+
+  baseline  - BeautifulSoup/html.parser, one item after another (the old path)
+  <backend> - each installed html_text backend, one item after another
+  auto/N    - html_text.html_to_texts on N processes
+
+and checks every variant produces the same text as "baseline" (the regex
+fallback is only expected to be close).
+
+Usage:
+    python benchmarks/bench_html_extraction.py
+    python benchmarks/bench_html_extraction.py --epub book.epub --workers 4
+"""
+
+import argparse
+import random
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import html_text  # noqa: E402
+
+WORDS = (
+    "the house stood at the end of a long road and nobody had lived there "
+    "for years although the lamps were still lit every evening by someone"
+).split()
+
+
+def make_chapter(rng: random.Random, paragraphs: int) -> str:
+    body = []
+    for _ in range(paragraphs):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(30, 80))]
+        words.insert(rng.randrange(len(words)), '<em>“indeed”</em> &amp;')
+        words.append('<a href="notes.xhtml#n1"><sup>1</sup></a>')
+        body.append(f'<p class="txt">{" ".join(words)}</p>')
+    return (
+        "<?xml version='1.0' encoding='utf-8'?>\n"
+        '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>Chapter</title>'
+        '<style>p { margin: 0 }</style></head><body>\n<!-- page 1 -->\n'
+        '<h1>Chapter</h1>\n' + "\n".join(body) + '\n<script>void 0;</script></body></html>'
+    )
+
+
+def synthetic_book(megabytes: float, seed: int = 0):
+    rng = random.Random(seed)
+    docs, size = [], 0
+    while size < megabytes * 1024 * 1024:
+        doc = make_chapter(rng, rng.randint(100, 400))
+        docs.append(doc)
+        size += len(doc)
+    return docs
+
+
+def epub_documents(path: str):
+    with zipfile.ZipFile(path) as z:
+        return [
+            z.read(name).decode("utf-8", errors="ignore")
+            for name in z.namelist()
+            if name.lower().endswith((".html", ".xhtml", ".htm"))
+        ]
+
+
+def baseline(html: str) -> str:
+    """The pre-backend extraction (mlx_tts_engine._clean_html)."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    for t in soup(["script", "style"]):
+        t.decompose()
+    return " ".join(soup.get_text().split())
+
+
+def timed(fn, docs, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(docs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--epub", help="EPUB to take the documents from")
+    parser.add_argument("--megabytes", type=float, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    docs = epub_documents(args.epub) if args.epub else synthetic_book(args.megabytes)
+    print(f"[*] {len(docs)} documents, {sum(len(d) for d in docs) / 1024 ** 2:.1f} MB of markup")
+    print(f"[*] Backends: {', '.join(html_text.available_backends())}")
+
+    variants = []
+    if html_text.BS4_AVAILABLE:
+        variants.append(("baseline", lambda ds: [baseline(d) for d in ds]))
+    for name in html_text.available_backends():
+        variants.append((name, lambda ds, name=name: [html_text.html_to_text(d, name) for d in ds]))
+    variants.append((f"auto/{args.workers}", lambda ds: html_text.html_to_texts(ds, workers=args.workers)))
+
+    baseline_time, expected = None, None
+    for name, fn in variants:
+        seconds, result = timed(fn, docs, args.repeat)
+        if expected is None:
+            baseline_time, expected = seconds, result
+        same = "same output" if result == expected else "output differs"
+        print(f"[+] {name:<10} {seconds:7.3f}s  {baseline_time / seconds:5.1f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
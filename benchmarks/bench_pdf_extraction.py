@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PDF text extraction per backend, serial and in parallel.
+
+Takes the PDF given with --pdf, or writes a synthetic text-only PDF of
+--pages pages with PyMuPDF, and extracts every page with:
+
+  baseline   - PyPDF2 page by page, text built with += (the old _extract_pdf)
+  <backend>  - each installed pdf_text backend in one process
+  <backend>/N - pdf_text.extract_pages on N worker processes
+
+Backends lay text out differently, so outputs are compared by word
+count against the serial run of the same backend.
+
+Usage:
+    python benchmarks/bench_pdf_extraction.py
+    python benchmarks/bench_pdf_extraction.py --pdf book.pdf --workers 4
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import pdf_text  # noqa: E402
+
+WORDS = (
+    "the house stood at the end of a long road and nobody had lived there "
+    "for years although the lamps were still lit every evening by someone"
+).split()
+
+
+def make_pdf(path: Path, pages: int, seed: int = 0):
+    rng = random.Random(seed)
+    doc = pdf_text.fitz.open()
+    for _ in range(pages):
+        lines = (" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(45))
+        doc.new_page().insert_text((50, 60), "\n".join(lines), fontsize=9)
+    doc.save(str(path))
+
+
+def baseline(path: str) -> str:
+    """The pre-backend extraction (QwenAudiobookConverter._extract_pdf)."""
+    import PyPDF2
+    text = ""
+    with open(path, "rb") as f:
+        for page in PyPDF2.PdfReader(f).pages:
+            page_text = page.extract_text()
+            if page_text.strip():
+                text += f"\n\n{page_text}"
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", help="PDF to extract")
+    parser.add_argument("--pages", type=int, default=900)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.pdf
+        if not path:
+            path = str(Path(tmp) / "synthetic.pdf")
+            make_pdf(Path(path), args.pages)
+        print(f"[*] {path}: {pdf_text.get_backend().page_count(path)} pages")
+        print(f"[*] Backends: {', '.join(pdf_text.available_backends())}")
+
+        variants = []
+        if pdf_text.PYPDF2_AVAILABLE:
+            variants.append(("baseline", None, lambda: baseline(path)))
+        for name in pdf_text.available_backends():
+            variants.append((name, name, lambda name=name: pdf_text.extract_text(path, name, workers=1)))
+            variants.append((f"{name}/{args.workers}", name,
+                             lambda name=name: pdf_text.extract_text(path, name, workers=args.workers)))
+
+        baseline_time, serial_words = None, {}
+        for label, backend, fn in variants:
+            start = time.perf_counter()
+            words = len(fn().split())
+            seconds = time.perf_counter() - start
+            baseline_time = baseline_time or seconds
+            check = ""
+            if backend is not None:
+                expected = serial_words.setdefault(backend, words)
+                check = "same words" if words == expected else "WORD COUNT DIFFERS"
+            print(f"[+] {label:<12} {seconds:7.2f}s  {baseline_time / seconds:5.1f}x  {words:8,} words  {check}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: chained text-cleaning passes vs. the fused TextNormalizer.
+
+Builds a synthetic book of --megabytes of prose sprinkled with curly
+quotes, dashes, ellipses, footnote markers and spaced-capital headings,
+then cleans it with:
+
+  chained - the old apply_text_cleaning: spaced capitals, footnotes,
+            whitespace, five str.replace calls, whitespace again
+  fused   - TextNormalizer: a replacement table plus one combined regex
+  fused/N - TextNormalizer.clean() split across N processes
+
+and checks every variant produces the same text as "chained".
+
+Usage:
+    python benchmarks/bench_text_cleaning.py
+    python benchmarks/bench_text_cleaning.py --megabytes 8 --workers 4
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from text_normalizer import TextNormalizer  # noqa: E402
+
+WORDS = (
+    "the house stood at the end of a long road and nobody had lived there "
+    "for years although the lamps were still lit every evening by someone"
+).split()
+DECORATIONS = ["“Well,”", "‘no’", "—", "–", "wait…", "note*", "†", "¹", "claim.* †"]
+
+
+def make_book(megabytes: float, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts, size = [], 0
+    while size < megabytes * 1024 * 1024:
+        if rng.random() < 0.01:
+            piece = "\n\nC H A P T E R " + " ".join(rng.choice("ABCDEFG") for _ in range(3)) + "\n\n"
+        else:
+            words = [rng.choice(WORDS) for _ in range(rng.randint(8, 20))]
+            if rng.random() < 0.5:
+                words.insert(rng.randrange(len(words)), rng.choice(DECORATIONS))
+            piece = " ".join(words).capitalize() + ".  "
+        parts.append(piece)
+        size += len(piece)
+    return "".join(parts)
+
+
+def chained(text: str) -> str:
+    """The pre-fusion cleaning chain (mlx_tts_engine.apply_text_cleaning)."""
+    def fix_word(match):
+        chars = match.group(0).replace(' ', '')
+        return chars[0] + chars[1:].lower() if len(chars) >= 2 else chars
+    text = re.sub(r'\b([A-Z]\s+){2,}[A-Z]+\b', fix_word, text)
+    markers = r'[*†‡§¶‖¹²³⁴⁵⁶⁷⁸⁹⁰]+'
+    text = re.sub(r'\s*' + markers + r'\s*', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = text.replace('—', ' - ')
+    text = text.replace('–', ' - ')
+    text = text.replace('“', '"').replace('”', '"')
+    text = text.replace('‘', "'").replace('’', "'")
+    text = text.replace('…', '...')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def timed(fn, text: str, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--megabytes", type=float, default=4)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = make_book(args.megabytes)
+    print(f"[*] Book: {len(text) / 1024 ** 2:.1f} MB")
+    normalizer = TextNormalizer()
+
+    variants = [
+        ("chained", chained),
+        ("fused", normalizer),
+        (f"fused/{args.workers}", lambda t: normalizer.clean(t, workers=args.workers)),
+    ]
+    baseline_time, expected = None, None
+    for name, fn in variants:
+        seconds, result = timed(fn, text, args.repeat)
+        if expected is None:
+            baseline_time, expected = seconds, result
+        same = "same output" if result == expected else "OUTPUT DIFFERS"
+        print(f"[+] {name:<10} {seconds:7.3f}s  {baseline_time / seconds:5.1f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
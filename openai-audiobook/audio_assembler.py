@@ -13,6 +13,10 @@ from pathlib import Path
 from typing import List, Optional, Dict
 import shutil
 
+import soundfile as sf
+
+from parallel_encode import encode_segments, encoded_duration, segment_duration
+
 
 @dataclass
 class ChapterMarker:
@@ -70,7 +74,19 @@ class AudioAssembler:
             )
 
     def get_audio_duration(self, audio_path: str) -> float:
-        """Get duration of an audio file in seconds using FFprobe."""
+        """
+        Get duration of an audio file in seconds.
+
+        Reads the file header with soundfile (no decoding); falls back to
+        FFprobe for formats libsndfile cannot open.
+        """
+        try:
+            info = sf.info(audio_path)
+            if info.frames > 0:
+                return info.frames / info.samplerate
+        except Exception:
+            pass
+
         try:
             result = subprocess.run(
                 [
@@ -109,11 +125,7 @@ class AudioAssembler:
 
         # Create concat file list
         concat_file = self.temp_dir / "concat_list.txt"
-        with open(concat_file, 'w', encoding='utf-8') as f:
-            for audio_path in audio_files:
-                # Escape single quotes in path
-                safe_path = audio_path.replace("'", "'\\''")
-                f.write(f"file '{safe_path}'\n")
+        self._write_concat_list(audio_files, concat_file)
 
         # Use FFmpeg concat demuxer
         cmd = [
@@ -136,23 +148,104 @@ class AudioAssembler:
             print(f"[!] Concatenation failed: {e}")
             return False
 
+    def _write_concat_list(
+        self,
+        audio_files: List[str],
+        concat_file: Path,
+        durations: Optional[List[float]] = None
+    ) -> None:
+        """Write a file list for the FFmpeg concat demuxer (with durations if given)."""
+        with open(concat_file, 'w', encoding='utf-8') as f:
+            for i, audio_path in enumerate(audio_files):
+                # Escape single quotes in path
+                safe_path = str(audio_path).replace("'", "'\\''")
+                f.write(f"file '{safe_path}'\n")
+                if durations is not None:
+                    f.write(f"duration {durations[i]:.6f}\n")
+
+    def _encoded_duration(self, src: str, encoded: Path) -> float:
+        """Length of a separately encoded chapter, from its source sample count.
+
+        Sources libsndfile cannot open fall back to probing the encoded piece.
+        """
+        try:
+            info = sf.info(src)
+            if info.frames > 0:
+                return encoded_duration(info.frames, info.samplerate)
+        except Exception:
+            pass
+        return segment_duration(encoded)
+
+    def measure_encode_speed(
+        self,
+        source_format: str = "mp3",
+        bitrate: str = "128k",
+        seconds: float = 30.0
+    ) -> Optional[float]:
+        """
+        Time the final AAC encode on a short synthetic clip.
+
+        Args:
+            source_format: Format the chapter audio is in ("mp3" or "pcm")
+            bitrate: AAC bitrate of the final encode
+            seconds: Length of the test clip
+
+        Returns:
+            Encode speed as a multiple of real time, or None on failure
+        """
+        import time
+        import numpy as np
+
+        sample = self.temp_dir / "encode_probe.wav"
+        rng = np.random.default_rng(0)
+        sf.write(str(sample), 0.1 * rng.standard_normal(int(seconds * 24000)), 24000)
+        source = sample
+        try:
+            if source_format == "mp3":
+                source = self.temp_dir / "encode_probe.mp3"
+                subprocess.run(
+                    ["ffmpeg", "-y", "-i", str(sample), "-b:a", "128k", str(source)],
+                    capture_output=True, check=True
+                )
+            start = time.perf_counter()
+            subprocess.run(
+                ["ffmpeg", "-y", "-i", str(source), "-c:a", "aac", "-b:a", bitrate,
+                 str(self.temp_dir / "encode_probe.m4a")],
+                capture_output=True, check=True
+            )
+            return seconds / max(time.perf_counter() - start, 1e-6)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        finally:
+            for name in ("encode_probe.wav", "encode_probe.mp3", "encode_probe.m4a"):
+                (self.temp_dir / name).unlink(missing_ok=True)
+
     def create_m4b(
         self,
         audio_files: List[AudioSegment],
         output_path: str,
         metadata: Dict[str, str],
         cover_path: Optional[str] = None,
-        bitrate: str = "128k"
+        bitrate: str = "128k",
+        workers: int = 1,
+        copy_audio: bool = False
     ) -> bool:
         """
         Create M4B audiobook with chapters and metadata.
 
+        The segments are read through the concat demuxer and encoded once.
+        With workers > 1 each chapter is encoded to AAC in its own ffmpeg
+        process, and the pieces are joined with ``-c copy``. With copy_audio
+        the segments are already AAC and are muxed without re-encoding.
+
         Args:
             audio_files: List of AudioSegment objects with chapter info
             output_path: Output M4B file path
             metadata: Dict with title, author, album, etc.
             cover_path: Optional cover image path
             bitrate: Audio bitrate (e.g., "128k")
+            workers: Number of chapters to encode concurrently
+            copy_audio: Segments are AAC; mux them as-is (bitrate is ignored)
 
         Returns:
             True if successful
@@ -160,14 +253,30 @@ class AudioAssembler:
         if not audio_files:
             return False
 
-        # Step 1: Concatenate all audio files
-        concat_output = self.temp_dir / "combined.mp3"
         audio_paths = [seg.path for seg in audio_files]
-
-        print("[*] Concatenating audio files...")
-        if not self.concatenate_audio(audio_paths, str(concat_output)):
-            print("[!] Failed to concatenate audio files")
-            return False
+        parallel = workers > 1 and len(audio_files) > 1 and not copy_audio
+        concat_input = self.temp_dir / "concat_list.txt"
+
+        # Step 1: List the audio files in order (encoding them chapter by
+        # chapter first in parallel mode); ffmpeg reads them as one stream
+        if parallel:
+            print(f"[*] Encoding {len(audio_paths)} chapters to AAC ({workers} workers)...")
+            try:
+                encoded = encode_segments(audio_paths, self.temp_dir / "aac", bitrate, workers)
+                # Chapter times are the encoded pieces' lengths, AAC priming and
+                # padding included; the concat list pins the same durations
+                for seg, src, path in zip(audio_files, audio_paths, encoded):
+                    seg.duration = self._encoded_duration(src, path)
+            except RuntimeError as e:
+                print(f"[!] Failed to encode chapters: {e}")
+                return False
+            # Absolute paths: the concat demuxer resolves relative ones against the list file
+            self._write_concat_list(
+                [str(p.resolve()) for p in encoded], concat_input,
+                [seg.duration for seg in audio_files]
+            )
+        else:
+            self._write_concat_list([str(Path(p).resolve()) for p in audio_paths], concat_input)
 
         # Step 2: Calculate chapter timestamps
         chapters = []
@@ -194,7 +303,8 @@ class AudioAssembler:
         # Note: All inputs must come before mapping options
         cmd = [
             "ffmpeg", "-y",
-            "-i", str(concat_output),
+            "-f", "concat", "-safe", "0",
+            "-i", str(concat_input),
             "-i", str(metadata_file),
         ]
 
@@ -217,12 +327,18 @@ class AudioAssembler:
                 "-disposition:v:0", "attached_pic",
             ])
 
-        # Audio encoding
-        cmd.extend([
-            "-c:a", "aac",
-            "-b:a", bitrate,
-            output_path
-        ])
+        # Audio encoding (skipped when the audio is already AAC)
+        if copy_audio:
+            # ADTS streams from the API need the MP4-style AAC header
+            cmd.extend(["-c:a", "copy", "-bsf:a", "aac_adtstoasc", output_path])
+        elif parallel:
+            cmd.extend(["-c:a", "copy", output_path])
+        else:
+            cmd.extend([
+                "-c:a", "aac",
+                "-b:a", bitrate,
+                output_path
+            ])
 
         print("[*] Creating M4B with chapters...")
         try:
@@ -301,7 +417,8 @@ def assemble_audiobook(
     output_path: str,
     metadata: Dict[str, str],
     cover_path: Optional[str] = None,
-    bitrate: str = "128k"
+    bitrate: str = "128k",
+    workers: int = 1
 ) -> bool:
     """
     Convenience function to assemble an audiobook from chapter files.
@@ -314,6 +431,7 @@ def assemble_audiobook(
         metadata: Book metadata (title, author, etc.)
         cover_path: Optional cover image path
         bitrate: Audio bitrate
+        workers: Chapters to encode concurrently (1 = single encode)
 
     Returns:
         True if successful
@@ -347,7 +465,8 @@ def assemble_audiobook(
             output_path,
             metadata,
             cover_path,
-            bitrate
+            bitrate,
+            workers
         )
         return result
     finally:
@@ -26,10 +26,11 @@ from tqdm import tqdm
 from epub_parser import EPUBParser, ParsedBook, Chapter
 from pdf_parser import PDFParser
 from chunker import TokenAwareChunker, count_tokens
-from tts_client import TTSClient, AVAILABLE_VOICES
+from tts_client import TTSClient, AVAILABLE_VOICES, audio_extension
 from audio_assembler import AudioAssembler, AudioSegment
 from cost_estimator import CostEstimator, CostEstimate
 from progress import ProgressManager, ConversionState
+from phrase_cache import PhraseCache
 
 # Supported file formats
 SUPPORTED_FORMATS = ['.epub', '.pdf']
@@ -39,6 +40,15 @@ SUPPORTED_FORMATS = ['.epub', '.pdf']
 DEFAULT_VOICE = "coral"
 DEFAULT_BITRATE = "128k"
 DEFAULT_CHUNK_PAUSE = 2.5  # seconds between chapters
+DEFAULT_SOURCE_FORMAT = "mp3"
+
+# Audio requested from the API, and how it becomes the final M4B
+SOURCE_FORMATS = {
+    "mp3": "MP3 from the API, decoded and re-encoded to AAC (2 lossy encodes)",
+    "pcm": "lossless PCM from the API, encoded once to AAC (1 lossy encode)",
+    "aac": "AAC from the API, muxed into the M4B as-is (1 lossy encode, no re-encode)",
+}
+NARRATION_WPM = 150  # for estimating audio length before conversion
 
 
 class AudiobookConverter:
@@ -52,7 +62,8 @@ class AudiobookConverter:
         voice: str = DEFAULT_VOICE,
         instructions: Optional[str] = None,
         dry_run: bool = False,
-        ocr_enabled: bool = True
+        ocr_enabled: bool = True,
+        source_format: Optional[str] = None
     ):
         self.input_path = Path(input_path)
         self.config_path = config_path
@@ -60,6 +71,7 @@ class AudiobookConverter:
         self.instructions = instructions
         self.dry_run = dry_run
         self.ocr_enabled = ocr_enabled
+        self.source_format = source_format
 
         # Detect file format
         self.file_format = self.input_path.suffix.lower()
@@ -90,10 +102,15 @@ class AudiobookConverter:
         if self.file_format == '.epub':
             self.parser = EPUBParser(str(self.input_path))
         else:  # .pdf
-            self.parser = PDFParser(str(self.input_path), ocr_enabled=ocr_enabled)
+            self.parser = PDFParser(
+                str(self.input_path),
+                ocr_enabled=ocr_enabled,
+                ocr_workers=self.config.get('pdf', {}).get('ocr_workers', PDFParser.OCR_WORKERS)
+            )
 
         self.chunker = TokenAwareChunker(max_tokens=1500)
         self.tts_client: Optional[TTSClient] = None
+        self.phrase_cache: Optional[PhraseCache] = None
         self.assembler: Optional[AudioAssembler] = None
         self.cost_estimator = CostEstimator()
 
@@ -128,6 +145,15 @@ class AudiobookConverter:
         self.output_format = output_config.get('format', 'm4b')
         self.bitrate = output_config.get('bitrate', DEFAULT_BITRATE)
         self.embed_cover = output_config.get('embed_cover', True)
+        self.encode_workers = output_config.get('encode_workers', 1)
+        if not self.source_format:
+            self.source_format = output_config.get('source_format', DEFAULT_SOURCE_FORMAT)
+        if self.source_format not in SOURCE_FORMATS:
+            raise ValueError(
+                f"Unknown source_format '{self.source_format}'. "
+                f"Supported: {', '.join(SOURCE_FORMATS)}"
+            )
+        self.audio_ext = audio_extension(self.source_format)
 
         # Conversion settings
         conv_config = self.config.get('conversion', {})
@@ -218,6 +244,7 @@ class AudiobookConverter:
         if self.dry_run:
             print("\n[DRY RUN] Stopping before conversion.")
             self._show_chapter_list(book)
+            self._show_encode_plan(book)
             return None
 
         # Step 3: Confirm with user
@@ -232,7 +259,13 @@ class AudiobookConverter:
         self.tts_client = TTSClient(
             voice=self.voice,
             instructions=self.instructions,
-            response_format="mp3"
+            response_format=self.source_format
+        )
+        self.phrase_cache = PhraseCache(
+            voice=self.tts_client.voice,
+            model=self.tts_client.model,
+            instructions=self.tts_client.instructions,
+            response_format=self.tts_client.response_format
         )
         self.assembler = AudioAssembler(self.temp_dir)
 
@@ -267,7 +300,10 @@ class AudiobookConverter:
             print("  [*] Generating intro...")
             intro_path = self._generate_audio("_intro", self.intro_text)
             if intro_path:
-                progress_mgr.mark_chapter_complete("_intro", intro_path, len(self.intro_text))
+                progress_mgr.mark_chapter_complete(
+                    "_intro", intro_path, len(self.intro_text),
+                    self.assembler.get_audio_duration(intro_path)
+                )
                 chapter_audio_files["_intro"] = intro_path
                 chapter_titles["_intro"] = "Introduction"
         elif state.get_cached_audio("_intro"):
@@ -282,7 +318,10 @@ class AudiobookConverter:
             print("  [*] Generating title announcement...")
             title_path = self._generate_audio("_title", self.title_announcement)
             if title_path:
-                progress_mgr.mark_chapter_complete("_title", title_path, len(self.title_announcement))
+                progress_mgr.mark_chapter_complete(
+                    "_title", title_path, len(self.title_announcement),
+                    self.assembler.get_audio_duration(title_path)
+                )
                 chapter_audio_files["_title"] = title_path
                 chapter_titles["_title"] = "Title"
         elif state.get_cached_audio("_title"):
@@ -311,7 +350,10 @@ class AudiobookConverter:
             # Generate chapter audio
             chapter_path = self._generate_chapter_audio(chapter, i + 1, len(book.chapters))
             if chapter_path:
-                progress_mgr.mark_chapter_complete(chapter.id, chapter_path, chapter.char_count)
+                progress_mgr.mark_chapter_complete(
+                    chapter.id, chapter_path, chapter.char_count,
+                    self.assembler.get_audio_duration(chapter_path)
+                )
                 chapter_audio_files[chapter.id] = chapter_path
                 chapter_titles[chapter.id] = chapter.title
                 chapter_order.append(chapter.id)
@@ -323,7 +365,10 @@ class AudiobookConverter:
             print("  [*] Generating outro...")
             outro_path = self._generate_audio("_outro", self.outro_text)
             if outro_path:
-                progress_mgr.mark_chapter_complete("_outro", outro_path, len(self.outro_text))
+                progress_mgr.mark_chapter_complete(
+                    "_outro", outro_path, len(self.outro_text),
+                    self.assembler.get_audio_duration(outro_path)
+                )
                 chapter_audio_files["_outro"] = outro_path
                 chapter_titles["_outro"] = "Closing"
         elif state.get_cached_audio("_outro"):
@@ -362,6 +407,7 @@ class AudiobookConverter:
 
             segments.append(AudioSegment(
                 path=chapter_audio_files[chapter_id],
+                duration=state.chapter_durations.get(chapter_id, 0.0),
                 chapter_id=chapter_id,
                 chapter_title=chapter_titles.get(chapter_id, chapter_id)
             ))
@@ -372,7 +418,9 @@ class AudiobookConverter:
             str(output_path),
             metadata,
             str(cover_path) if cover_path else None,
-            self.bitrate
+            self.bitrate,
+            self.encode_workers,
+            copy_audio=self.source_format == "aac"
         )
 
         if success:
@@ -386,6 +434,11 @@ class AudiobookConverter:
             print("=" * 60)
             print(f"Output: {output_path}")
             print(f"Size: {output_path.stat().st_size / (1024*1024):.1f} MB")
+            if self.phrase_cache.hits:
+                print(
+                    f"Phrase cache: {self.phrase_cache.hits} reused "
+                    f"({self.phrase_cache.characters_saved:,} characters not re-billed)"
+                )
             print("=" * 60)
 
             return str(output_path)
@@ -395,12 +448,21 @@ class AudiobookConverter:
 
     def _generate_audio(self, segment_id: str, text: str) -> Optional[str]:
         """Generate audio for a text segment."""
-        output_path = self.temp_dir / f"{segment_id}.mp3"
+        output_path = self.temp_dir / f"{segment_id}.{self.audio_ext}"
 
-        if self.tts_client.generate_speech(text, output_path):
+        if self._generate_phrase(text, output_path):
             return str(output_path)
         return None
 
+    def _generate_phrase(self, text: str, output_path: Path) -> bool:
+        """Generate a short recurring phrase, reusing audio from earlier books."""
+        if self.phrase_cache.fetch(text, output_path):
+            return True
+        if self.tts_client.generate_speech(text, output_path):
+            self.phrase_cache.store(text, output_path)
+            return True
+        return False
+
     def _generate_chapter_audio(
         self,
         chapter: Chapter,
@@ -419,9 +481,12 @@ class AudiobookConverter:
         # Generate audio for each chunk
         chunk_files = []
         for i, chunk in enumerate(chunks):
-            chunk_path = self.temp_dir / f"{chapter.id}_chunk_{i:04d}.mp3"
+            chunk_path = self.temp_dir / f"{chapter.id}_chunk_{i:04d}.{self.audio_ext}"
 
-            success = self.tts_client.generate_speech(chunk, chunk_path)
+            if i == 0 and self.announce_chapters:
+                success = self._generate_phrase(chunk, chunk_path)
+            else:
+                success = self.tts_client.generate_speech(chunk, chunk_path)
             if success:
                 chunk_files.append(str(chunk_path))
             else:
@@ -432,7 +497,7 @@ class AudiobookConverter:
             return None
 
         # Concatenate chunks into chapter audio
-        chapter_path = self.temp_dir / f"{chapter.id}.mp3"
+        chapter_path = self.temp_dir / f"{chapter.id}.{self.audio_ext}"
         if self.assembler.concatenate_audio(chunk_files, str(chapter_path)):
             # Clean up chunk files
             for f in chunk_files:
@@ -452,6 +517,33 @@ class AudiobookConverter:
         print(f"Total: {len(book.chapters)} chapters, {book.total_words:,} words")
 
 
+    def _show_encode_plan(self, book: ParsedBook) -> None:
+        """Display how the M4B will be encoded, with an encode-time estimate."""
+        audio_minutes = book.total_words / NARRATION_WPM
+        print("\nEncoding:")
+        print("-" * 50)
+        print(f"  Source:   {self.source_format} - {SOURCE_FORMATS[self.source_format]}")
+        if self.source_format == "aac":
+            print("  Output:   AAC at the API's bitrate (stream copy)")
+            print("  Encode:   none (remux only)")
+        else:
+            print(f"  Output:   AAC {self.bitrate}")
+            try:
+                speed = AudioAssembler(self.temp_dir).measure_encode_speed(self.source_format, self.bitrate)
+            except RuntimeError:
+                speed = None
+            if speed:
+                workers = max(1, self.encode_workers)
+                minutes = audio_minutes / speed / workers
+                print(
+                    f"  Encode:   ~{minutes:.1f} min for ~{audio_minutes / 60:.1f} h of audio "
+                    f"({speed:.0f}x real time measured, {workers} worker(s))"
+                )
+            else:
+                print("  Encode:   unknown (FFmpeg not available)")
+        print("-" * 50)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -504,6 +596,12 @@ Examples:
         action="store_true",
         help="Disable OCR for PDF files (faster but may miss scanned pages)"
     )
+    parser.add_argument(
+        "--source-format",
+        choices=list(SOURCE_FORMATS),
+        help="Audio format requested from the API (default: config or mp3). "
+             "pcm and aac avoid the MP3-to-AAC transcode"
+    )
     parser.add_argument(
         "--list-chapters",
         action="store_true",
@@ -559,7 +657,8 @@ Examples:
         voice=args.voice,
         instructions=args.instructions,
         dry_run=args.dry_run,
-        ocr_enabled=not args.no_ocr
+        ocr_enabled=not args.no_ocr,
+        source_format=args.source_format
     )
 
     result = converter.convert()
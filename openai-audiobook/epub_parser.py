@@ -17,6 +17,8 @@ import ebooklib
 from ebooklib import epub
 from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
 
+from text_cleaner import get_cleaner
+
 # Suppress XML parsed as HTML warning (common with EPUB content)
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
@@ -287,57 +289,7 @@ class EPUBParser:
 
     def _clean_text(self, text: str, options: Dict) -> str:
         """Apply text cleaning based on options."""
-        if options.get('fix_spaced_capitals', False):
-            text = self._fix_spaced_capitals(text)
-
-        if options.get('remove_footnotes', False):
-            text = self._remove_footnotes(text)
-
-        if options.get('normalize_special_chars', False):
-            text = self._normalize_special_chars(text)
-
-        return text
-
-    def _fix_spaced_capitals(self, text: str) -> str:
-        """Fix spaced capital letters like 'A H OUSE' -> 'A House'."""
-        # Pattern: sequence of single capitals separated by spaces
-        pattern = r'\b([A-Z])\s+([A-Z])\s+([A-Z](?:\s+[A-Z])*)\b'
-
-        def fix_match(m):
-            letters = m.group(0).replace(' ', '')
-            return letters.title()
-
-        return re.sub(pattern, fix_match, text)
-
-    def _remove_footnotes(self, text: str) -> str:
-        """Remove footnote markers."""
-        # Remove common footnote markers
-        markers = ['*', '†', '‡', '§', '¶', '‖', '**', '***']
-        for marker in markers:
-            text = text.replace(marker, '')
-
-        # Remove numbered footnote references like [1], [2], etc.
-        text = re.sub(r'\[\d+\]', '', text)
-
-        # Clean up extra spaces
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
-
-    def _normalize_special_chars(self, text: str) -> str:
-        """Normalize special Unicode characters."""
-        replacements = {
-            '—': ' - ',  # em-dash
-            '–': ' - ',  # en-dash
-            '"': '"',    # curly double quote left
-            '"': '"',    # curly double quote right
-            ''': "'",    # curly single quote left
-            ''': "'",    # curly single quote right
-            '…': '...',  # ellipsis
-            '\u00a0': ' ',  # non-breaking space
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text
+        return get_cleaner(options)(text)
 
     def _format_chapter_title(self, title: str, item_id: str) -> str:
         """Format chapter title for announcement."""
@@ -0,0 +1,81 @@
+"""
+Persistent cache of OCR results for rendered PDF pages.
+
+Every OCR'd page is a paid Vision API request. Results are kept under
+``cache/ocr/`` keyed by a hash of the rendered page image and every
+setting that affects the answer (model, prompt, token limit), so
+re-parsing a PDF - or resuming an interrupted parse - only pays for pages
+that have not been read before. Each result is written as soon as it
+arrives.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / "cache" / "ocr"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class OCRCache:
+    """Size-bounded LRU cache of page OCR text. Safe to use from threads."""
+
+    def __init__(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.fingerprint = json.dumps([model, prompt, max_tokens])
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, image: bytes) -> Path:
+        h = hashlib.sha256(self.fingerprint.encode('utf-8'))
+        h.update(b"\0")
+        h.update(image)
+        return self.cache_dir / f"{h.hexdigest()}.txt"
+
+    def get(self, image: bytes) -> Optional[str]:
+        """Cached OCR text for a rendered page image, or None on a miss."""
+        path = self._path(image)
+        try:
+            text = path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        os.utime(path)
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, image: bytes, text: str) -> None:
+        """Store the OCR text for a rendered page image."""
+        path = self._path(image)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_text(text, encoding='utf-8')
+        os.replace(tmp, path)
+
+    def evict(self) -> None:
+        """Drop least recently used entries until the cache fits max_bytes."""
+        entries = sorted(
+            (e for e in os.scandir(self.cache_dir) if e.name.endswith(".txt")),
+            key=lambda e: e.stat().st_mtime
+        )
+        size = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            if size <= self.max_bytes:
+                break
+            size -= entry.stat().st_size
+            Path(entry.path).unlink(missing_ok=True)
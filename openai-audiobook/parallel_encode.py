@@ -0,0 +1,67 @@
+"""
+Parallel per-chapter AAC encoding for M4B output.
+
+Same approach as src/parallel_encode.py, kept here so this converter stays
+self-contained. Each chapter is encoded to its own ``.m4a`` in a separate
+ffmpeg process and the pieces are joined with the concat demuxer and
+``-c copy``. Every piece carries its own encoder priming and padding, so
+chapter markers (and the concat list) must use ``encoded_duration`` of each
+piece rather than the chapter's PCM length.
+"""
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+# ffmpeg's native AAC encoder: 1024-sample frames, one frame of priming
+AAC_FRAME = 1024
+AAC_PRIMING = 1024
+
+
+def gain_args(gain_db: float) -> List[str]:
+    """ffmpeg audio filter arguments for a fixed gain (none for 0 dB)."""
+    return ["-af", f"volume={gain_db:.2f}dB"] if gain_db else []
+
+
+def encode_segment(src: str, dest: Path, bitrate: str, gain_db: float = 0.0) -> Path:
+    """Encode one audio file to AAC in an .m4a container."""
+    result = subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", str(src), "-vn"]
+        + gain_args(gain_db) + ["-c:a", "aac", "-b:a", bitrate, str(dest)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed on {Path(src).name}: {result.stderr.strip()}")
+    return dest
+
+
+def encode_segments(
+    paths: List[str], out_dir: Path, bitrate: str, workers: int, gain_db: float = 0.0,
+) -> List[Path]:
+    """Encode every file concurrently; return the .m4a paths in input order."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    dests = [out_dir / f"segment_{i:04d}.m4a" for i in range(len(paths))]
+    # Threads only wait on the ffmpeg processes, which do the actual work
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(lambda args: encode_segment(*args, bitrate, gain_db), zip(paths, dests)))
+
+
+def encoded_duration(frames: int, sample_rate: int) -> float:
+    """Length of a frames-long file once encoded to AAC, priming and padding included."""
+    packets = -(-(frames + AAC_PRIMING) // AAC_FRAME)
+    return packets * AAC_FRAME / sample_rate
+
+
+def segment_duration(path: Path) -> float:
+    """Duration of an encoded segment as the concat demuxer sees it (ffprobe)."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+         "-of", "default=noprint_wrappers=1:nokey=1", str(path)],
+        capture_output=True, text=True
+    )
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        raise RuntimeError(f"ffprobe failed on {Path(path).name}: {result.stderr.strip()}")
@@ -11,6 +11,7 @@ import base64
 import io
 import os
 import re
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -19,6 +20,9 @@ import fitz  # PyMuPDF
 
 from openai import OpenAI
 
+from ocr_cache import OCRCache
+from text_cleaner import get_cleaner
+
 
 # Reuse data structures from epub_parser for compatibility
 @dataclass
@@ -75,12 +79,22 @@ class PDFParser:
     # OCR settings
     OCR_MODEL = "gpt-4o-mini"
     OCR_MAX_TOKENS = 4096
+    OCR_DPI = 150  # balance of quality and size
+    OCR_WORKERS = 4  # concurrent Vision API requests
+    OCR_PROMPT = (
+        "Extract all the text from this book page. "
+        "Maintain paragraph structure. "
+        "Do not include page numbers, headers, or footers. "
+        "Only output the extracted text, nothing else."
+    )
 
     def __init__(
         self,
         pdf_path: str,
         openai_api_key: Optional[str] = None,
-        ocr_enabled: bool = True
+        ocr_enabled: bool = True,
+        ocr_workers: int = OCR_WORKERS,
+        ocr_cache: bool = True
     ):
         """
         Initialize PDF parser.
@@ -89,6 +103,8 @@ class PDFParser:
             pdf_path: Path to PDF file
             openai_api_key: OpenAI API key for OCR (defaults to OPENAI_API_KEY env)
             ocr_enabled: Whether to use OCR for problematic pages
+            ocr_workers: OCR requests in flight at once
+            ocr_cache: Reuse OCR results of previously seen page images
         """
         self.pdf_path = Path(pdf_path)
         if not self.pdf_path.exists():
@@ -105,6 +121,11 @@ class PDFParser:
                 print("[!] Warning: No OpenAI API key found. OCR will be disabled.")
                 self.ocr_enabled = False
 
+        self.ocr_workers = max(1, ocr_workers)
+        self.ocr_cache: Optional[OCRCache] = None
+        if self.ocr_enabled and ocr_cache:
+            self.ocr_cache = OCRCache(self.OCR_MODEL, self.OCR_PROMPT, self.OCR_MAX_TOKENS)
+
         # Statistics
         self.pages_direct = 0
         self.pages_ocr = 0
@@ -144,28 +165,61 @@ class PDFParser:
 
             print(f"[*] Extracting text from {total_pages} pages...")
 
-            for page_num in range(total_pages):
-                page_idx = page_num + 1  # 1-indexed for user display
-
-                # Apply include/exclude filters
-                if include_pages is not None and page_idx not in include_pages:
-                    continue
-                if exclude_pages is not None and page_idx in exclude_pages:
-                    continue
-
-                page = doc[page_num]
-                result = self._extract_page_text(page, page_num)
-
-                if result.text.strip():
-                    page_texts[page_num] = result
-
-                # Progress indicator
-                if (page_num + 1) % 10 == 0:
-                    print(f"      Processed {page_num + 1}/{total_pages} pages...")
+            # Pages are rendered on this thread (a fitz document is not
+            # thread-safe); only the OCR requests run concurrently
+            ocr_jobs = {}  # future -> (page_num, direct_text)
+            with ThreadPoolExecutor(max_workers=self.ocr_workers) as ocr_pool:
+                for page_num in range(total_pages):
+                    page_idx = page_num + 1  # 1-indexed for user display
+
+                    # Apply include/exclude filters
+                    if include_pages is not None and page_idx not in include_pages:
+                        continue
+                    if exclude_pages is not None and page_idx in exclude_pages:
+                        continue
+
+                    page = doc[page_num]
+                    direct_text = page.get_text("text")
+
+                    if not self._needs_ocr(direct_text, page):
+                        self.pages_direct += 1
+                        self._keep_page(page_texts, PageExtractionResult(
+                            page_num=page_num,
+                            text=direct_text,
+                            method="direct",
+                            confidence=1.0
+                        ))
+                    elif self.ocr_enabled and self.openai_client:
+                        # Bound the rendered pages waiting for a request slot
+                        while len(ocr_jobs) >= self.ocr_workers * 2:
+                            self._collect_ocr(ocr_jobs, page_texts, FIRST_COMPLETED)
+                        image = self._render_page(page)
+                        cached = self.ocr_cache.get(image) if self.ocr_cache else None
+                        if cached is not None:
+                            self._keep_page(page_texts, self._ocr_result(page_num, direct_text, cached))
+                        else:
+                            future = ocr_pool.submit(self._ocr_image, image, page_num)
+                            ocr_jobs[future] = (page_num, direct_text)
+                    else:
+                        self._keep_page(page_texts, self._ocr_result(page_num, direct_text, None))
+
+                    # Progress indicator
+                    if (page_num + 1) % 10 == 0:
+                        print(f"      Processed {page_num + 1}/{total_pages} pages...")
+
+                if ocr_jobs:
+                    print(f"      Waiting for {len(ocr_jobs)} OCR requests...")
+                    self._collect_ocr(ocr_jobs, page_texts, ALL_COMPLETED)
+
+            page_texts = dict(sorted(page_texts.items()))
+            if self.ocr_cache:
+                self.ocr_cache.evict()
 
             # Print extraction statistics
             print(f"      Direct extraction: {self.pages_direct} pages")
             print(f"      OCR extraction: {self.pages_ocr} pages")
+            if self.ocr_cache and self.ocr_cache.hits:
+                print(f"      OCR cache: {self.ocr_cache.hits} pages reused")
             if self.pages_failed > 0:
                 print(f"      Failed: {self.pages_failed} pages")
 
@@ -196,41 +250,28 @@ class PDFParser:
             language=language
         )
 
-    def _extract_page_text(
+    def _keep_page(self, page_texts: Dict[int, PageExtractionResult], result: PageExtractionResult) -> None:
+        if result.text.strip():
+            page_texts[result.page_num] = result
+
+    def _ocr_result(
         self,
-        page: fitz.Page,
-        page_num: int
+        page_num: int,
+        direct_text: str,
+        ocr_text: Optional[str]
     ) -> PageExtractionResult:
         """
-        Extract text from a single page, using OCR if needed.
+        Result for a page that needed OCR, falling back to the direct text.
         """
-        # First, try direct text extraction
-        direct_text = page.get_text("text")
-
-        # Check if extraction quality is acceptable
-        needs_ocr = self._needs_ocr(direct_text, page)
-
-        if not needs_ocr:
-            self.pages_direct += 1
+        if ocr_text:
+            self.pages_ocr += 1
             return PageExtractionResult(
                 page_num=page_num,
-                text=direct_text,
-                method="direct",
-                confidence=1.0
+                text=ocr_text,
+                method="ocr",
+                confidence=0.9
             )
 
-        # Try OCR if enabled
-        if self.ocr_enabled and self.openai_client:
-            ocr_text = self._ocr_page(page, page_num)
-            if ocr_text:
-                self.pages_ocr += 1
-                return PageExtractionResult(
-                    page_num=page_num,
-                    text=ocr_text,
-                    method="ocr",
-                    confidence=0.9
-                )
-
         # Fallback to whatever we got from direct extraction
         if direct_text.strip():
             self.pages_direct += 1
@@ -249,6 +290,13 @@ class PDFParser:
             confidence=0.0
         )
 
+    def _collect_ocr(self, jobs: Dict, page_texts: Dict[int, PageExtractionResult], return_when) -> None:
+        """Wait for OCR requests and keep the finished pages."""
+        done, _ = wait(jobs, return_when=return_when)
+        for future in done:
+            page_num, direct_text = jobs.pop(future)
+            self._keep_page(page_texts, self._ocr_result(page_num, direct_text, future.result()))
+
     def _needs_ocr(self, text: str, page: fitz.Page) -> bool:
         """
         Determine if a page needs OCR based on text quality.
@@ -321,19 +369,16 @@ class PDFParser:
         score = normal_ratio - garbled_penalty + common_bonus
         return max(0.0, min(1.0, score))
 
-    def _ocr_page(self, page: fitz.Page, page_num: int) -> Optional[str]:
+    def _render_page(self, page: fitz.Page) -> bytes:
+        """Render a page to PNG bytes for OCR."""
+        mat = fitz.Matrix(self.OCR_DPI / 72, self.OCR_DPI / 72)
+        return page.get_pixmap(matrix=mat).tobytes("png")
+
+    def _ocr_image(self, img_bytes: bytes, page_num: int) -> Optional[str]:
         """
-        Use OpenAI Vision API to OCR a page.
+        Use OpenAI Vision API to OCR a rendered page. Runs on the OCR pool.
         """
         try:
-            # Render page to image
-            # Using 150 DPI for balance of quality and size
-            mat = fitz.Matrix(150/72, 150/72)  # 150 DPI
-            pix = page.get_pixmap(matrix=mat)
-
-            # Convert to PNG bytes
-            img_bytes = pix.tobytes("png")
-
             # Encode to base64
             img_base64 = base64.b64encode(img_bytes).decode("utf-8")
 
@@ -347,12 +392,7 @@ class PDFParser:
                         "content": [
                             {
                                 "type": "text",
-                                "text": (
-                                    "Extract all the text from this book page. "
-                                    "Maintain paragraph structure. "
-                                    "Do not include page numbers, headers, or footers. "
-                                    "Only output the extracted text, nothing else."
-                                )
+                                "text": self.OCR_PROMPT
                             },
                             {
                                 "type": "image_url",
@@ -366,7 +406,11 @@ class PDFParser:
                 ]
             )
 
-            return response.choices[0].message.content
+            text = response.choices[0].message.content
+            if text and self.ocr_cache:
+                # Stored right away so an interrupted parse keeps it
+                self.ocr_cache.put(img_bytes, text)
+            return text
 
         except Exception as e:
             print(f"      [!] OCR failed for page {page_num + 1}: {e}")
@@ -598,65 +642,14 @@ class PDFParser:
 
     def _clean_text(self, text: str, options: Dict) -> str:
         """Apply text cleaning based on options."""
-        if options.get('fix_spaced_capitals', False):
-            text = self._fix_spaced_capitals(text)
-
-        if options.get('remove_footnotes', False):
-            text = self._remove_footnotes(text)
-
-        if options.get('normalize_special_chars', False):
-            text = self._normalize_special_chars(text)
-
+        # Line-based fixes first: footnote removal collapses newlines
         if options.get('remove_page_numbers', True):
             text = self._remove_page_numbers(text)
 
         if options.get('fix_hyphenation', True):
             text = self._fix_hyphenation(text)
 
-        return text
-
-    def _fix_spaced_capitals(self, text: str) -> str:
-        """Fix spaced capital letters like 'T H E' -> 'THE'."""
-        pattern = r'\b([A-Z])\s+([A-Z])\s+([A-Z](?:\s+[A-Z])*)\b'
-
-        def fix_match(m):
-            letters = m.group(0).replace(' ', '')
-            return letters.title()
-
-        return re.sub(pattern, fix_match, text)
-
-    def _remove_footnotes(self, text: str) -> str:
-        """Remove footnote markers and references."""
-        # Remove superscript-style markers
-        text = re.sub(r'\[\d+\]', '', text)
-        text = re.sub(r'\d+\s*$', '', text, flags=re.MULTILINE)
-
-        # Remove common footnote symbols
-        for marker in ['*', '†', '‡', '§', '¶', '‖']:
-            text = text.replace(marker, '')
-
-        return re.sub(r'\s+', ' ', text).strip()
-
-    def _normalize_special_chars(self, text: str) -> str:
-        """Normalize special Unicode characters."""
-        replacements = {
-            '—': ' - ',
-            '–': ' - ',
-            '"': '"',
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '…': '...',
-            '\u00a0': ' ',
-            'ﬁ': 'fi',
-            'ﬂ': 'fl',
-            'ﬀ': 'ff',
-            'ﬃ': 'ffi',
-            'ﬄ': 'ffl',
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text
+        return get_cleaner(options, pdf=True)(text)
 
     def _remove_page_numbers(self, text: str) -> str:
         """Remove standalone page numbers."""
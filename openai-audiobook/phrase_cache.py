@@ -0,0 +1,87 @@
+"""
+Cross-book cache for short, repeated phrases.
+
+Chapter announcements, intro/outro text and title lines are often identical
+across books narrated with the same voice. Their API responses are kept under
+``cache/phrases/`` keyed by the normalized phrase and every setting that
+affects the audio, so each phrase is only paid for once.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+from tts_client import audio_extension
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / "cache" / "phrases"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def normalize_phrase(text: str) -> str:
+    """Canonical form of a phrase for cache keys."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class PhraseCache:
+    """Size-bounded LRU cache of synthesized phrase audio files."""
+
+    def __init__(
+        self,
+        voice: str,
+        model: str,
+        instructions: Optional[str] = None,
+        response_format: str = "mp3",
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.fingerprint = json.dumps([voice, model, instructions or "", response_format])
+        self.ext = audio_extension(response_format)
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.characters_saved = 0
+
+    def _path(self, text: str) -> Path:
+        blob = f"{self.fingerprint}\0{normalize_phrase(text)}"
+        key = hashlib.sha256(blob.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.{self.ext}"
+
+    def fetch(self, text: str, output_path: Path) -> bool:
+        """Copy the cached audio for text to output_path; False on a miss."""
+        path = self._path(text)
+        if not path.exists():
+            self.misses += 1
+            return False
+        shutil.copyfile(path, output_path)
+        os.utime(path)
+        self.hits += 1
+        self.characters_saved += len(text)
+        return True
+
+    def store(self, text: str, audio_path: Path) -> None:
+        """Add freshly generated audio for text, evicting old entries if needed."""
+        path = self._path(text)
+        tmp = path.with_name(path.name + '.tmp')
+        shutil.copyfile(audio_path, tmp)
+        os.replace(tmp, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(
+            (e for e in os.scandir(self.cache_dir) if e.name.endswith(f".{self.ext}")),
+            key=lambda e: e.stat().st_mtime
+        )
+        size = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            if size <= self.max_bytes:
+                break
+            size -= entry.stat().st_size
+            Path(entry.path).unlink(missing_ok=True)
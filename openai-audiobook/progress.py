@@ -29,6 +29,7 @@ class ConversionState:
     chapters_total: int = 0
     chapters_completed: List[str] = field(default_factory=list)
     chapter_audio_files: Dict[str, str] = field(default_factory=dict)
+    chapter_durations: Dict[str, float] = field(default_factory=dict)  # seconds
 
     # Timing and metadata
     started_at: str = field(default_factory=lambda: datetime.now().isoformat())
@@ -57,12 +58,15 @@ class ConversionState:
         self,
         chapter_id: str,
         audio_path: str,
-        characters: int = 0
+        characters: int = 0,
+        duration: float = 0.0
     ) -> None:
         """Mark a chapter as completed and record its audio file."""
         if chapter_id not in self.chapters_completed:
             self.chapters_completed.append(chapter_id)
         self.chapter_audio_files[chapter_id] = audio_path
+        if duration:
+            self.chapter_durations[chapter_id] = duration
         self.characters_processed += characters
         self.updated_at = datetime.now().isoformat()
 
@@ -150,11 +154,12 @@ class ProgressManager:
         self,
         chapter_id: str,
         audio_path: str,
-        characters: int = 0
+        characters: int = 0,
+        duration: float = 0.0
     ) -> None:
         """Mark chapter complete and save checkpoint."""
         if self.state:
-            self.state.mark_chapter_complete(chapter_id, audio_path, characters)
+            self.state.mark_chapter_complete(chapter_id, audio_path, characters, duration)
             self.save()
 
     def mark_completed(self) -> None:
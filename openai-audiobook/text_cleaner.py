@@ -0,0 +1,115 @@
+"""
+Compiled text cleaning shared by the EPUB and PDF parsers.
+
+Both parsers used to run their own chain of ``re.sub`` / ``str.replace``
+passes over every chapter, recompiling patterns each time. ``TextCleaner``
+compiles the enabled rules once: spaced capitals, footnote references and
+whitespace are alternatives of one regex pass, and special characters go
+through a replacement table (each entry skipped when its character is
+absent, which is faster than ``str.translate`` on non-ASCII text).
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict
+
+SPECIAL_CHARS = {
+    '—': ' - ',   # em-dash
+    '–': ' - ',   # en-dash
+    '“': '"',     # curly double quote left
+    '”': '"',     # curly double quote right
+    '‘': "'",     # curly single quote left
+    '’': "'",     # curly single quote right
+    '…': '...',   # ellipsis
+    '\u00a0': ' ',  # non-breaking space
+}
+LIGATURES = {
+    'ﬁ': 'fi',
+    'ﬂ': 'fl',
+    'ﬀ': 'ff',
+    'ﬃ': 'ffi',
+    'ﬄ': 'ffl',
+}
+FOOTNOTE_SYMBOLS = '*†‡§¶‖'
+_HAS_SPACE = re.compile(r'\s')
+
+
+class TextCleaner:
+    """Cleaning rules compiled once; call it on a chapter's text."""
+
+    def __init__(
+        self,
+        fix_spaced_capitals: bool = False,
+        remove_footnotes: bool = False,
+        normalize_special_chars: bool = False,
+        pdf: bool = False
+    ):
+        """
+        Args:
+            fix_spaced_capitals: 'T H E' -> 'The'
+            remove_footnotes: Drop footnote symbols and [n] references and
+                collapse whitespace (PDFs: also numbers ending a line)
+            normalize_special_chars: Dashes, curly quotes, ellipsis, NBSP
+                (PDFs: also ligatures)
+            pdf: Use the PDF variants of the rules
+        """
+        chars = {}
+        if normalize_special_chars:
+            chars.update(SPECIAL_CHARS)
+            if pdf:
+                chars.update(LIGATURES)
+        self._chars = tuple(chars.items())
+
+        rules, first = [], ''
+        if fix_spaced_capitals:
+            rules.append(r'(?P<caps>\b[A-Z]\s+[A-Z]\s+[A-Z](?:\s+[A-Z])*\b)')
+            first += 'A-Z'
+        if remove_footnotes:
+            symbols = re.escape(FOOTNOTE_SYMBOLS)
+            refs = r'\[\d+\]|[' + symbols + ']'
+            if pdf:
+                # A number ending a line, possibly followed by [n] references
+                refs += r'|\d+(?=(?:[^\S\n]*\[\d+\])*[^\S\n]*$)'
+            # Removed text takes adjacent whitespace with it, a whole run of
+            # whitespace-separated references at once; see _replace
+            rules.append(r'(?P<note>(?:\s*(?:' + refs + r'))+\s*)')
+            # Single spaces are already normal and are left alone
+            rules.append(r'\s{2,}|[^\S ]')
+            first += r'\s\[\d' + symbols
+        self._pattern = (
+            re.compile(f"(?=[{first}])(?:{'|'.join(rules)})", re.MULTILINE) if rules else None
+        )
+        self._strip = remove_footnotes
+
+    def _replace(self, match: re.Match) -> str:
+        text = match.group(0)
+        if match.lastgroup == 'caps':
+            text = text.replace(' ', '').title()
+            return re.sub(r'\s+', ' ', text) if self._strip else text
+        if match.lastgroup == 'note':
+            # What whitespace collapsing would leave after deleting the marker
+            return ' ' if _HAS_SPACE.search(text) else ''
+        return ' '
+
+    def __call__(self, text: str) -> str:
+        for char, replacement in self._chars:
+            if char in text:
+                text = text.replace(char, replacement)
+        if self._pattern is not None:
+            text = self._pattern.sub(self._replace, text)
+        return text.strip() if self._strip else text
+
+
+@lru_cache(maxsize=8)
+def _cached_cleaner(caps: bool, footnotes: bool, chars: bool, pdf: bool) -> TextCleaner:
+    return TextCleaner(caps, footnotes, chars, pdf)
+
+
+def get_cleaner(options: Dict, pdf: bool = False) -> TextCleaner:
+    """Shared cleaner for a text_cleaning options dict."""
+    return _cached_cleaner(
+        bool(options.get('fix_spaced_capitals', False)),
+        bool(options.get('remove_footnotes', False)),
+        bool(options.get('normalize_special_chars', False)),
+        pdf
+    )
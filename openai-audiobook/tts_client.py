@@ -10,6 +10,8 @@ import time
 from pathlib import Path
 from typing import Optional, Literal
 
+import numpy as np
+import soundfile as sf
 from openai import OpenAI, APIError, RateLimitError, APIConnectionError
 
 
@@ -25,6 +27,10 @@ RECOMMENDED_VOICES = ["coral", "onyx", "echo", "marin", "cedar"]
 # Output formats
 OUTPUT_FORMATS = ["mp3", "opus", "aac", "flac", "wav", "pcm"]
 
+# Raw "pcm" responses are 24 kHz, 16-bit signed little-endian, mono.
+# They are saved with a WAV header so ffmpeg/soundfile can read them.
+PCM_SAMPLE_RATE = 24000
+
 # Default settings
 DEFAULT_MODEL = "gpt-4o-mini-tts"
 DEFAULT_VOICE = "coral"
@@ -115,7 +121,10 @@ class TTSClient:
                 with self.client.audio.speech.with_streaming_response.create(
                     **params
                 ) as response:
-                    response.stream_to_file(str(output_path))
+                    if self.response_format == "pcm":
+                        self._stream_pcm_to_wav(response, output_path)
+                    else:
+                        response.stream_to_file(str(output_path))
 
                 return True
 
@@ -144,6 +153,20 @@ class TTSClient:
 
         return False
 
+    def _stream_pcm_to_wav(self, response, output_path: Path) -> None:
+        """Write a raw PCM response to a WAV file as it arrives."""
+        pending = b""
+        with sf.SoundFile(
+            str(output_path), "w",
+            samplerate=PCM_SAMPLE_RATE, channels=1, subtype="PCM_16"
+        ) as f:
+            for data in response.iter_bytes():
+                pending += data
+                usable = len(pending) - len(pending) % 2
+                if usable:
+                    f.write(np.frombuffer(pending[:usable], dtype="<i2"))
+                    pending = pending[usable:]
+
     def generate_speech_batch(
         self,
         chunks: list,
@@ -167,7 +190,7 @@ class TTSClient:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         results = []
-        ext = self.response_format
+        ext = audio_extension(self.response_format)
 
         for i, chunk in enumerate(chunks):
             output_path = output_dir / f"{prefix}_{i:04d}.{ext}"
@@ -185,6 +208,11 @@ class TTSClient:
         return results
 
 
+def audio_extension(response_format: str) -> str:
+    """File extension used for audio saved in the given response format."""
+    return "wav" if response_format == "pcm" else response_format
+
+
 def create_client(
     voice: str = DEFAULT_VOICE,
     instructions: Optional[str] = None,
@@ -0,0 +1,170 @@
+"""
+Streaming chunk post-processing: silence trim, seam crossfades, peak ceiling.
+
+Synthesized chunks used to be butted together as-is, each with whatever
+leading/trailing silence the model produced, and levels were left to a
+separate ffmpeg filter pass over the finished book. ``ChunkPostProcessor``
+sits in front of any ``AudioSink`` and treats every write as one chunk:
+
+* leading and trailing silence is trimmed with a framewise RMS threshold
+  (``keep_ms`` of it is kept so sentences still breathe),
+* a chunk whose peak exceeds ``peak_ceiling_db`` is turned down to it
+  (quieter chunks are never boosted, so relative levels are kept),
+* consecutive chunks overlap by ``crossfade_ms`` with an equal-power fade.
+
+Only the current chunk and the held-back crossfade tail are in memory, so
+this runs inline while the book is written. Chunks keep their dtype: int16
+audio is trimmed by slicing and only the samples a gain or crossfade
+actually changes go through float, so untouched int16 samples reach an
+int16 sink without being requantized or dithered again.
+"""
+
+from typing import Optional
+
+import numpy as np
+import soundfile as sf
+
+
+def trim_silence(
+    audio: np.ndarray, sample_rate: int, threshold_db: float = -50.0,
+    keep_ms: float = 150.0, frame_ms: float = 10.0,
+) -> np.ndarray:
+    """Drop leading/trailing frames whose RMS is below threshold_db (dBFS).
+
+    Works on float or int16 audio and returns a slice of the input.
+    """
+    hop = max(1, int(sample_rate * frame_ms / 1000))
+    n = len(audio) // hop
+    if n == 0:
+        return audio
+    frames = audio[:n * hop].reshape(n, hop)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    threshold = 10 ** (threshold_db / 20)
+    if audio.dtype == np.int16:
+        threshold *= 32768
+    loud = np.flatnonzero(rms > threshold)
+    if len(loud) == 0:
+        return audio[:0]
+    keep = int(sample_rate * keep_ms / 1000)
+    start = max(0, loud[0] * hop - keep)
+    end = min(len(audio), (loud[-1] + 1) * hop + keep)
+    return audio[start:end]
+
+
+def _to_float(audio: np.ndarray) -> np.ndarray:
+    if audio.dtype == np.int16:
+        return np.multiply(audio, 1.0 / 32768, dtype=np.float32)
+    return np.asarray(audio, dtype=np.float32)
+
+
+def limit_peak(audio: np.ndarray, ceiling_db: float = -1.0) -> np.ndarray:
+    """Scale audio down so its peak is at most ceiling_db; never boosts.
+
+    Audio already under the ceiling is returned as is (int16 stays int16);
+    scaled audio is float32.
+    """
+    peak = float(np.max(np.abs(_to_float(audio)))) if len(audio) else 0.0
+    ceiling = 10 ** (ceiling_db / 20)
+    if peak <= ceiling:
+        return audio
+    return _to_float(audio) * np.float32(ceiling / peak)
+
+
+class ChunkPostProcessor:
+    """Trim, peak-limit and crossfade chunks on their way into a sink.
+
+    Each ``write`` is one chunk. Pass ``None`` for a setting to skip that
+    step. ``write_silence`` and ``close`` flush the held-back tail first, so
+    explicit pauses are never crossfaded into. Use as a context manager.
+    """
+
+    def __init__(
+        self, sink, trim_db: Optional[float] = -50.0, keep_ms: float = 150.0,
+        crossfade_ms: Optional[float] = 15.0, peak_ceiling_db: Optional[float] = -1.0,
+    ):
+        self.sink = sink
+        self.trim_db = trim_db
+        self.keep_ms = keep_ms
+        self.crossfade_ms = crossfade_ms
+        self.peak_ceiling_db = peak_ceiling_db
+        self._tail: Optional[np.ndarray] = None
+        self._sr: Optional[int] = None
+
+    def __enter__(self) -> 'ChunkPostProcessor':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def sample_rate(self) -> Optional[int]:
+        return self.sink.sample_rate
+
+    @property
+    def frames(self) -> int:
+        return self.sink.frames + (len(self._tail) if self._tail is not None else 0)
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+    def process(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Trim and peak-limit one chunk (no crossfade)."""
+        if audio.dtype != np.int16:
+            audio = np.asarray(audio, dtype=np.float32)
+        if self.trim_db is not None:
+            audio = trim_silence(audio, sample_rate, self.trim_db, self.keep_ms)
+        if self.peak_ceiling_db is not None:
+            audio = limit_peak(audio, self.peak_ceiling_db)
+        return audio
+
+    def write(self, audio: np.ndarray, sample_rate: Optional[int] = None):
+        sr = sample_rate or self.sink.sample_rate
+        if not sr:
+            raise ValueError("sample_rate required for the first write")
+        self._sr = sr
+        audio = self.process(audio, sr)
+        if len(audio) == 0:
+            return
+        fade = int(sr * self.crossfade_ms / 1000) if self.crossfade_ms else 0
+        if self._tail is not None:
+            n = min(fade, len(self._tail), len(audio))
+            if n:
+                # Equal power: cos^2 + sin^2 = 1 keeps the seam's energy flat
+                t = np.linspace(0.0, np.pi / 2, n, dtype=np.float32)
+                head = _to_float(self._tail[-n:]) * np.cos(t) + _to_float(audio[:n]) * np.sin(t)
+                # Written apart from the rest so only the overlap is requantized
+                self.sink.write(self._tail[:-n], sr)
+                self.sink.write(head, sr)
+                audio = audio[n:]
+            else:
+                self.sink.write(self._tail, sr)
+            self._tail = None
+        if fade and len(audio) > fade:
+            self.sink.write(audio[:-fade], sr)
+            self._tail = audio[-fade:]
+        elif fade:
+            self._tail = audio
+        else:
+            self.sink.write(audio, sr)
+
+    def flush(self):
+        """Write the held-back crossfade tail."""
+        if self._tail is not None:
+            self.sink.write(self._tail, self._sr)
+            self._tail = None
+
+    def write_silence(self, seconds: float):
+        self.flush()
+        self.sink.write_silence(seconds)
+
+    def append_file(self, path, block_frames: int = 0) -> int:
+        """Read one chunk file and write it as a single chunk; return frames read."""
+        dtype = getattr(self.sink, 'dtype', np.dtype('float32'))
+        audio, sr = sf.read(str(path), dtype=np.dtype(dtype).name)
+        self.write(audio, sr)
+        return len(audio)
+
+    def close(self):
+        self.flush()
+        self.sink.close()
@@ -0,0 +1,200 @@
+"""
+Streaming audio writer with constant memory use.
+
+Audiobook output used to be built by collecting every chunk (or every
+chapter) in a list and calling ``np.concatenate`` before ``sf.write``, so
+peak memory grew with the length of the book. ``AudioSink`` keeps the output
+file open and appends each piece as soon as it is final; only one chunk is in
+memory at a time.
+
+``FFmpegPipeSink`` has the same interface but feeds 16-bit PCM into an
+ffmpeg process's stdin, so encoding needs no intermediate WAV on disk.
+
+Sinks created with ``dtype="int16"`` keep audio as 16-bit integers: float
+input is dithered and quantized once by ``to_int16`` on the way in, and
+files are read back as int16, so nothing is requantized (or widened to
+float) between the model and the encoder.
+
+A ``meter`` (e.g. ``loudness.LoudnessMeter``) passed to a sink sees every
+write, so measurements need no second pass over the file.
+"""
+
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+BLOCK_FRAMES = 1 << 18
+SAMPLE_DTYPES = ("float32", "int16")
+
+_dither_rng = np.random.default_rng()
+
+
+def to_int16(audio: np.ndarray, dither: bool = True) -> np.ndarray:
+    """Quantize float audio to int16 with TPDF dither; int16 passes through."""
+    if audio.dtype == np.int16:
+        return audio
+    scaled = np.asarray(audio, dtype=np.float32) * 32767
+    if dither:
+        # Triangular dither of +-1 LSB decorrelates the rounding error
+        scaled += _dither_rng.random(len(scaled), dtype=np.float32)
+        scaled -= _dither_rng.random(len(scaled), dtype=np.float32)
+    return np.clip(np.rint(scaled), -32768, 32767).astype(np.int16)
+
+
+def audio_info(path) -> Tuple[float, int]:
+    """Duration (seconds) and sample rate read from the file header only."""
+    info = sf.info(str(path))
+    return info.frames / info.samplerate, info.samplerate
+
+
+class AudioSink:
+    """Append mono audio to a file as it is produced.
+
+    The file is opened on the first write, so the sample rate can come from
+    the first synthesized chunk. Use as a context manager.
+    """
+
+    def __init__(
+        self, path, sample_rate: Optional[int] = None, subtype: Optional[str] = None,
+        dtype: str = "float32", meter=None,
+    ):
+        if dtype not in SAMPLE_DTYPES:
+            raise ValueError(f"dtype must be one of {SAMPLE_DTYPES}, got {dtype!r}")
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self.dtype = np.dtype(dtype)
+        self.subtype = subtype or ("PCM_16" if dtype == "int16" else None)
+        self.meter = meter
+        self.frames = 0
+        self._file: Optional[sf.SoundFile] = None
+
+    def __enter__(self) -> 'AudioSink':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def duration(self) -> float:
+        """Seconds written so far."""
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+    def _open(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = sf.SoundFile(
+            str(self.path), 'w', samplerate=sample_rate, channels=1, subtype=self.subtype
+        )
+
+    def write(self, audio: np.ndarray, sample_rate: Optional[int] = None):
+        """Append audio; sample_rate is only needed for the first write."""
+        if self._file is None:
+            sr = sample_rate or self.sample_rate
+            if not sr:
+                raise ValueError("sample_rate required for the first write")
+            self._open(sr)
+        elif sample_rate and sample_rate != self.sample_rate:
+            raise ValueError(f"sample rate changed from {self.sample_rate} to {sample_rate}")
+        if self.meter is not None:
+            self.meter.add(audio, self.sample_rate)
+        if self.dtype == np.int16:
+            audio = to_int16(audio)
+        self._file.write(audio)
+        self.frames += len(audio)
+
+    def write_silence(self, seconds: float):
+        """Append silence (requires the sample rate to be known)."""
+        if not self.sample_rate:
+            raise ValueError("sample rate unknown")
+        self.write(np.zeros(int(seconds * self.sample_rate), dtype=self.dtype))
+
+    def append_file(self, path, block_frames: int = BLOCK_FRAMES) -> int:
+        """Stream another audio file into the sink block by block; return frames."""
+        info = sf.info(str(path))
+        written = 0
+        for block in sf.blocks(str(path), blocksize=block_frames, dtype=self.dtype.name):
+            self.write(block, info.samplerate)
+            written += len(block)
+        return written
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def append_files(sink: AudioSink, paths, block_frames: int = BLOCK_FRAMES) -> List[int]:
+    """Append each file to sink in order; return indices of unreadable files.
+
+    Every file is copied once in blocks, so combining is linear in the total
+    length, unlike repeated concatenation. A file that fails partway may
+    leave the blocks read before the error in the sink.
+    """
+    failed = []
+    for i, path in enumerate(paths):
+        try:
+            sf.info(str(path))
+            sink.append_file(path, block_frames)
+        except Exception:
+            failed.append(i)
+    return failed
+
+
+class FFmpegPipeSink(AudioSink):
+    """Stream mono PCM into ffmpeg's stdin instead of a file.
+
+    ``output_args`` is everything after the PCM input: extra inputs (metadata,
+    cover), maps, codec options and the output path. Check ``returncode``
+    (and ``error``) after closing.
+    """
+
+    def __init__(
+        self, output_args: List[str], sample_rate: int, ffmpeg: str = "ffmpeg",
+        dtype: str = "float32",
+    ):
+        super().__init__(path="pipe:0", sample_rate=sample_rate, dtype=dtype)
+        self.cmd = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "s16le", "-ar", str(sample_rate), "-ac", "1", "-i", "pipe:0",
+        ] + list(output_args)
+        self.returncode: Optional[int] = None
+        self.error = ""
+        self._proc: Optional[subprocess.Popen] = None
+        self._stderr = None
+
+    def _open(self, sample_rate: int):
+        # stderr goes to a temp file so a chatty ffmpeg can never block on it
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(self.cmd, stdin=subprocess.PIPE, stderr=self._stderr)
+        self._file = self._proc.stdin
+
+    def write(self, audio: np.ndarray, sample_rate: Optional[int] = None):
+        if self._file is None:
+            self._open(self.sample_rate)
+        elif sample_rate and sample_rate != self.sample_rate:
+            raise ValueError(f"sample rate changed from {self.sample_rate} to {sample_rate}")
+        # Float sinks keep the old plain rounding; int16 sinks dither float input
+        pcm = to_int16(audio, dither=self.dtype == np.int16).astype('<i2', copy=False)
+        try:
+            self._file.write(pcm.tobytes())
+        except BrokenPipeError:
+            # ffmpeg exited early; the error is reported by close()
+            return
+        self.frames += len(audio)
+
+    def close(self):
+        if self._proc is None:
+            return
+        try:
+            self._file.close()
+        except BrokenPipeError:
+            pass
+        self.returncode = self._proc.wait()
+        self._stderr.seek(0)
+        self.error = self._stderr.read().decode('utf-8', errors='replace').strip()
+        self._stderr.close()
+        self._proc = self._file = None
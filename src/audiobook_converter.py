@@ -1,28 +1,29 @@
 import os
-import shutil
 import logging
-import hashlib
 import argparse
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
 import time
 import sys
 import zipfile
 import xml.etree.ElementTree as ET
-from html import unescape
 import re
 from datetime import datetime
 import numpy as np
-import PyPDF2
 import ebooklib
 from ebooklib import epub
-from pydub import AudioSegment
-from pydub.exceptions import CouldntDecodeError
 import torch
 import soundfile as sf
-import whisper
 from qwen_tts import Qwen3TTSModel
+from audio_post import ChunkPostProcessor
+from audio_sink import FFmpegPipeSink, append_files
+from chunk_cache import ChunkAudioCache
+from html_text import html_to_text, html_to_texts
+from pdf_text import extract_pages, get_backend as get_pdf_backend
+from transcript_cache import load_cached_transcript, load_whisper_model, save_cached_transcript
+from voice_prompt_cache import VoicePromptCache, hash_file
 
 # Fix Windows console encoding for emoji/unicode
 if sys.platform == 'win32':
@@ -56,10 +57,16 @@ VOICE_CLONE_USE_XVECTOR_ONLY = False
 BOOKS_FOLDER = "book_to_convert"  # Input folder
 AUDIOBOOKS_FOLDER = "audiobooks"  # Output folder
 CHUNK_SIZE_WORDS = 1500  # Increased to reduce number of chunks and speed up processing
-MAX_WORKERS = 1  # Keep at 1 to avoid rate limiting
+MAX_WORKERS = 1  # Synthesis processes (--workers); 1 = single in-process model
 AUDIO_FORMAT = "mp3"
 AUDIO_BITRATE = "128k"
-MIN_DELAY_BETWEEN_CHUNKS = 1  # Reduced delay
+CACHE_MAX_SIZE_GB = 5  # Chunk audio cache limit (least recently used evicted first)
+
+# Chunk post-processing while combining (off by default; None disables a step)
+POSTPROCESS = False
+TRIM_SILENCE_DB = -50.0  # trim chunk edges quieter than this (dBFS)
+CROSSFADE_MS = 15  # equal-power crossfade at chunk seams
+PEAK_CEILING_DB = -1.0  # turn down chunks peaking above this (dBFS); never boosts
 
 # Optional imports with fallbacks
 try:
@@ -74,12 +81,6 @@ try:
 except ImportError:
     DOC_AVAILABLE = False
 
-try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
-
 
 def get_device_and_dtype():
     """Auto-detect best device and dtype for model inference.
@@ -98,21 +99,78 @@ def get_device_and_dtype():
         return "cpu", torch.float32
 
 
+# Per-process converter used by --workers synthesis processes
+_WORKER_CONVERTER = None
+
+
+def _init_worker(voice_mode: str, voice_clone_ref_audio: Optional[str], voice_clone_ref_text: str, num_threads: int):
+    """Process-pool initializer: pin this worker's thread share and load the model."""
+    global _WORKER_CONVERTER
+    torch.set_num_threads(num_threads)
+    _WORKER_CONVERTER = QwenAudiobookConverter.for_worker(
+        voice_mode, voice_clone_ref_audio, voice_clone_ref_text
+    )
+
+
+def _process_chunk_in_worker(args: Tuple[int, str]) -> Tuple[bool, int, int]:
+    """Synthesize one chunk in a worker process; return (success, cache hits, cache misses)."""
+    cache = _WORKER_CONVERTER.chunk_cache
+    hits, misses = cache.hits, cache.misses
+    ok = _WORKER_CONVERTER.process_chunk_with_retry(args)
+    return ok, cache.hits - hits, cache.misses - misses
+
+
 class QwenAudiobookConverter:
     """Audiobook converter using Qwen Voice API"""
 
-    def __init__(self, voice_mode: str = "custom_voice", voice_clone_ref_audio: Optional[str] = None):
+    def __init__(
+        self,
+        voice_mode: str = "custom_voice",
+        voice_clone_ref_audio: Optional[str] = None,
+        workers: int = MAX_WORKERS,
+        voice_clone_ref_text: str = "",
+    ):
         self.voice_mode = voice_mode
         self.voice_clone_ref_audio = voice_clone_ref_audio
-        self.voice_clone_ref_text = ""
+        self.voice_clone_ref_text = voice_clone_ref_text
+        self.workers = max(1, workers)
+        self._executor = None
+        self._ref_audio_hash = None
         self.setup_logging()
         self.setup_directories()
+        self.chunk_cache = ChunkAudioCache(max_bytes=int(CACHE_MAX_SIZE_GB * 1024 ** 3))
         self.validate_configuration()
         self.model = None
         self.whisper_model = None
+        self.voice_prompts = None
         self.device = None
         self.dtype = None
-        self.init_model()
+        # With several workers each process loads its own model; this one only coordinates
+        self.init_model(load_tts=self.workers == 1)
+
+    @classmethod
+    def for_worker(
+        cls, voice_mode: str, voice_clone_ref_audio: Optional[str], voice_clone_ref_text: str
+    ) -> 'QwenAudiobookConverter':
+        """Minimal converter for a synthesis process: model, voice prompts, chunk cache.
+
+        Workers run on the CPU so several of them never load the model onto one
+        GPU. Logging, directories, validation and transcription are left to the
+        parent, which has already done them.
+        """
+        self = cls.__new__(cls)
+        self.voice_mode = voice_mode
+        self.voice_clone_ref_audio = voice_clone_ref_audio
+        self.voice_clone_ref_text = voice_clone_ref_text
+        self.workers = 1
+        self._executor = None
+        self._ref_audio_hash = None
+        self.logger = logging.getLogger(__name__)
+        self.chunk_cache = ChunkAudioCache(max_bytes=int(CACHE_MAX_SIZE_GB * 1024 ** 3))
+        self.whisper_model = None
+        self.device, self.dtype = "cpu", torch.float32
+        self.load_tts_model()
+        return self
 
     def setup_logging(self):
         """Setup logging configuration"""
@@ -134,11 +192,22 @@ class QwenAudiobookConverter:
             Path(directory).mkdir(parents=True, exist_ok=True)
 
     def transcribe_audio(self, audio_path: str) -> str:
-        """Transcribe audio file using Whisper"""
+        """Transcribe audio file using Whisper, reusing cached transcripts"""
         try:
+            cached = load_cached_transcript(audio_path)
+            if cached:
+                self.logger.info(f"Using cached transcript for {audio_path}")
+                return cached
+
+            if self.whisper_model is None:
+                print("[INFO] Loading Whisper model for transcription...")
+                self.whisper_model = load_whisper_model()
+                print("[OK] Whisper model loaded")
+
             self.logger.info(f"Transcribing audio: {audio_path}")
             result = self.whisper_model.transcribe(audio_path)
             transcribed_text = result["text"].strip()
+            save_cached_transcript(audio_path, transcribed_text)
             self.logger.info(f"Transcription complete: {transcribed_text[:100]}...")
             return transcribed_text
         except Exception as e:
@@ -162,7 +231,7 @@ class QwenAudiobookConverter:
             # Transcribe the audio if client is available (will be done after init)
             # For now, we'll transcribe it in init_qwen_client if needed
 
-    def init_model(self):
+    def init_model(self, load_tts: bool = True):
         """Initialize Qwen3-TTS model directly with auto device detection"""
         try:
             # Detect device and dtype
@@ -170,24 +239,12 @@ class QwenAudiobookConverter:
             self.logger.info(f"Using device: {self.device}, dtype: {self.dtype}")
             print(f"[INFO] Detected device: {self.device}")
 
-            # Load Whisper model for transcription
-            print("[INFO] Loading Whisper model for transcription...")
-            self.whisper_model = whisper.load_model("base")
-            print("[OK] Whisper model loaded")
-
             # Load Qwen3-TTS model
-            print(f"[INFO] Loading Qwen3-TTS model ({MODEL_ID})...")
-            print("[INFO] This may take a few minutes on first run (downloading ~6GB model)...")
-            self.model = Qwen3TTSModel.from_pretrained(
-                MODEL_ID,
-                device_map=self.device,
-                torch_dtype=self.dtype
-            )
-            self.logger.info("Qwen3-TTS model loaded successfully")
-            print("[OK] Qwen3-TTS model loaded")
+            if load_tts:
+                self.load_tts_model()
 
-            # If voice clone mode, transcribe the reference audio
-            if self.voice_mode == "voice_clone" and self.voice_clone_ref_audio:
+            # If voice clone mode, transcribe the reference audio (once, in the parent)
+            if self.voice_mode == "voice_clone" and self.voice_clone_ref_audio and not self.voice_clone_ref_text:
                 print("[INFO] Transcribing reference audio for voice cloning...")
                 self.voice_clone_ref_text = self.transcribe_audio(self.voice_clone_ref_audio)
                 print(f"[OK] Transcription: {self.voice_clone_ref_text[:100]}...")
@@ -203,14 +260,26 @@ class QwenAudiobookConverter:
             traceback.print_exc()
             sys.exit(1)
 
+    def load_tts_model(self):
+        """Load Qwen3-TTS on self.device and set up the voice prompt cache"""
+        print(f"[INFO] Loading Qwen3-TTS model ({MODEL_ID})...")
+        print("[INFO] This may take a few minutes on first run (downloading ~6GB model)...")
+        self.model = Qwen3TTSModel.from_pretrained(
+            MODEL_ID,
+            device_map=self.device,
+            torch_dtype=self.dtype
+        )
+        self.logger.info("Qwen3-TTS model loaded successfully")
+        print("[OK] Qwen3-TTS model loaded")
+        self.voice_prompts = VoicePromptCache(self.model, MODEL_ID, device=self.device)
+
     def generate_chunk_via_qwen(self, text: str, chunk_num: int) -> Optional[str]:
         """Generate audio chunk using Qwen model"""
         try:
             # Check cache first
-            cache_path = self.get_cache_path(text)
-            if cache_path.exists():
-                output_path = Path("chunks") / f"chunk_{chunk_num:04d}.wav"
-                shutil.copy2(cache_path, output_path)
+            output_path = Path("chunks") / f"chunk_{chunk_num:04d}.wav"
+            cache_key = self.get_cache_key(text)
+            if self.chunk_cache.get(cache_key, output_path):
                 self.logger.debug(f"Using cached audio for chunk {chunk_num}")
                 return str(output_path)
 
@@ -226,11 +295,10 @@ class QwenAudiobookConverter:
                 raise RuntimeError("Model returned empty audio")
 
             # Save audio to output path
-            output_path = Path("chunks") / f"chunk_{chunk_num:04d}.wav"
             sf.write(str(output_path), audio_array, sample_rate)
 
             # Cache the result
-            shutil.copy2(output_path, cache_path)
+            self.chunk_cache.put(cache_key, audio_array, sample_rate)
 
             self.logger.debug(f"Chunk {chunk_num} generated successfully")
             return str(output_path)
@@ -267,25 +335,38 @@ class QwenAudiobookConverter:
         if not self.voice_clone_ref_text:
             raise ValueError("Reference text is required for voice cloning. Transcription may have failed.")
 
-        wavs, sr = self.model.generate_voice_clone(
-            text=text,
-            language=VOICE_CLONE_LANGUAGE,
-            ref_audio=self.voice_clone_ref_audio,
-            ref_text=self.voice_clone_ref_text,
+        prompt = self.voice_prompts.get(
+            self.voice_clone_ref_audio,
+            self.voice_clone_ref_text,
             x_vector_only_mode=VOICE_CLONE_USE_XVECTOR_ONLY,
-            max_new_tokens=2048,
-            non_streaming_mode=True
         )
+        if prompt is not None:
+            wavs, sr = self.model.generate_voice_clone(
+                text=text,
+                language=VOICE_CLONE_LANGUAGE,
+                voice_clone_prompt=prompt,
+                max_new_tokens=2048,
+                non_streaming_mode=True
+            )
+            saved = self.voice_prompts.record_use()
+            self.logger.info(f"Voice prompt reused: saved {saved:.2f}s "
+                             f"({self.voice_prompts.total_saved:.1f}s total)")
+        else:
+            wavs, sr = self.model.generate_voice_clone(
+                text=text,
+                language=VOICE_CLONE_LANGUAGE,
+                ref_audio=self.voice_clone_ref_audio,
+                ref_text=self.voice_clone_ref_text,
+                x_vector_only_mode=VOICE_CLONE_USE_XVECTOR_ONLY,
+                max_new_tokens=2048,
+                non_streaming_mode=True
+            )
         return wavs[0], sr
 
     def process_chunk_with_retry(self, args: Tuple[int, str]) -> bool:
-        """Process chunk with retry logic and rate limiting"""
+        """Process chunk with retry logic"""
         chunk_num, text = args
 
-        # Small delay between chunks to avoid rate limiting (only if not first chunk)
-        if chunk_num > 1:
-            time.sleep(MIN_DELAY_BETWEEN_CHUNKS)
-
         for attempt in range(MAX_RETRIES):
             try:
                 result = self.generate_chunk_via_qwen(text, chunk_num)
@@ -304,11 +385,25 @@ class QwenAudiobookConverter:
         self.logger.error(f"Chunk {chunk_num} failed after {MAX_RETRIES} attempts")
         return False
 
-    def get_cache_path(self, text: str) -> Path:
-        """Get cache path for text chunk"""
-        content = f"{text}_{self.voice_mode}_{CUSTOM_VOICE_SPEAKER if self.voice_mode == 'custom_voice' else Path(self.voice_clone_ref_audio).name if self.voice_clone_ref_audio else ''}"
-        hash_obj = hashlib.md5(content.encode())
-        return Path("cache/audio_chunks") / f"{hash_obj.hexdigest()}.wav"
+    def get_cache_key(self, text: str) -> str:
+        """Cache key covering every parameter that affects a chunk's audio"""
+        params = {"text": text, "voice_mode": self.voice_mode, "model": MODEL_ID}
+        if self.voice_mode == "custom_voice":
+            params.update(
+                speaker=CUSTOM_VOICE_SPEAKER,
+                language=CUSTOM_VOICE_LANGUAGE,
+                instruct=CUSTOM_VOICE_INSTRUCT,
+            )
+        elif self.voice_mode == "voice_clone":
+            if self._ref_audio_hash is None:
+                self._ref_audio_hash = hash_file(self.voice_clone_ref_audio)
+            params.update(
+                language=VOICE_CLONE_LANGUAGE,
+                ref_audio=self._ref_audio_hash,
+                ref_text=self.voice_clone_ref_text,
+                x_vector_only=VOICE_CLONE_USE_XVECTOR_ONLY,
+            )
+        return ChunkAudioCache.key(**params)
 
     def extract_text_from_epub(self, file_path: Path) -> str:
         """Extract text from EPUB with fallback methods"""
@@ -333,7 +428,7 @@ class QwenAudiobookConverter:
     def _extract_epub_ebooklib(self, file_path: Path) -> str:
         """Extract using ebooklib"""
         book = epub.read_epub(str(file_path))
-        text_parts = []
+        contents = []
 
         for item_id, linear in book.spine:
             try:
@@ -343,28 +438,24 @@ class QwenAudiobookConverter:
                     if content:
                         if isinstance(content, bytes):
                             content = content.decode('utf-8', errors='ignore')
-                        clean_text = self._clean_html(str(content))
-                        if clean_text.strip():
-                            text_parts.append(clean_text)
+                        contents.append(str(content))
             except Exception:
                 continue
 
-        return '\n\n'.join(text_parts)
+        # Spine items are converted on several processes for large books
+        return '\n\n'.join(t for t in html_to_texts(contents) if t.strip())
 
     def _extract_epub_zipfile(self, file_path: Path) -> str:
         """Extract using zipfile parsing"""
-        text_parts = []
+        contents = []
         with zipfile.ZipFile(file_path, 'r') as epub_zip:
             for file_name in epub_zip.namelist():
                 if file_name.lower().endswith(('.html', '.xhtml', '.htm')):
                     try:
-                        content = epub_zip.read(file_name).decode('utf-8', errors='ignore')
-                        clean_text = self._clean_html(content)
-                        if clean_text.strip():
-                            text_parts.append(clean_text)
+                        contents.append(epub_zip.read(file_name).decode('utf-8', errors='ignore'))
                     except Exception:
                         continue
-        return '\n\n'.join(text_parts)
+        return '\n\n'.join(t for t in html_to_texts(contents) if t.strip())
 
     def _extract_epub_manual(self, file_path: Path) -> str:
         """Manual extraction fallback"""
@@ -384,28 +475,7 @@ class QwenAudiobookConverter:
 
     def _clean_html(self, html_content: str) -> str:
         """Clean HTML content"""
-        if not html_content:
-            return ""
-
-        if BS4_AVAILABLE:
-            try:
-                soup = BeautifulSoup(html_content, 'html.parser')
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                text = soup.get_text()
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                return ' '.join(chunk for chunk in chunks if chunk)
-            except Exception:
-                pass
-
-        # Fallback regex cleaning
-        html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<[^>]+>', ' ', html_content)
-        html_content = unescape(html_content)
-        html_content = re.sub(r'\s+', ' ', html_content)
-        return html_content.strip()
+        return html_to_text(html_content)
 
     def extract_text_from_file(self, file_path: Path) -> str:
         """Extract text from various file formats"""
@@ -436,24 +506,14 @@ class QwenAudiobookConverter:
 
     def _extract_pdf(self, file_path: Path) -> str:
         """Extract from PDF"""
-        text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            total_pages = len(pdf_reader.pages)
-            self.logger.info(f"PDF has {total_pages} pages")
-            
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text.strip():
-                        text += f"\n\n{page_text}"
-                    if page_num % 10 == 0:
-                        self.logger.debug(f"Extracted {page_num}/{total_pages} pages")
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract page {page_num}: {e}")
-                    continue
-            
-            self.logger.info(f"Extracted text from {total_pages} pages, {len(text)} characters total")
+        # Page ranges are extracted in worker processes and joined once
+        pages = extract_pages(file_path)
+        self.logger.info(f"PDF has {len(pages)} pages ({get_pdf_backend().name})")
+        empty = sum(1 for page_text in pages if not page_text.strip())
+        if empty:
+            self.logger.debug(f"{empty} pages without text")
+        text = "\n\n".join(page_text for page_text in pages if page_text.strip())
+        self.logger.info(f"Extracted text from {len(pages)} pages, {len(text)} characters total")
         return self._clean_text(text)
 
     def _extract_docx(self, file_path: Path) -> str:
@@ -525,38 +585,57 @@ class QwenAudiobookConverter:
     def combine_chunks(self, total_chunks: int, output_path: Path, results: Optional[Dict[int, bool]] = None) -> bool:
         """Combine audio chunks into final audiobook"""
         try:
-            combined = AudioSegment.empty()
-            successful = 0
             missing_chunks = []
+            chunk_ids = []
+            chunk_files = []
 
             for i in range(1, total_chunks + 1):
                 # Skip chunks that failed if we have results tracking
                 if results is not None and not results.get(i, False):
                     missing_chunks.append(i)
                     continue
-                    
+
                 chunk_file = Path("chunks") / f"chunk_{i:04d}.wav"
                 if chunk_file.exists():
-                    try:
-                        chunk_audio = AudioSegment.from_wav(str(chunk_file))
-                        combined += chunk_audio
-                        successful += 1
-                        if successful % 10 == 0:
-                            self.logger.info(f"Combined {successful} chunks")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load chunk {i}: {e}")
-                        missing_chunks.append(i)
+                    chunk_ids.append(i)
+                    chunk_files.append(chunk_file)
                 else:
                     self.logger.warning(f"Chunk file not found: {chunk_file}")
                     missing_chunks.append(i)
 
+            sample_rate = None
+            for chunk_file in chunk_files:
+                try:
+                    sample_rate = sf.info(str(chunk_file)).samplerate
+                    break
+                except Exception:
+                    continue
+            if sample_rate is None:
+                raise RuntimeError("No valid chunks found")
+
+            # Stream every chunk once into the encoder (linear in book length),
+            # optionally trimming, leveling and crossfading on the way
+            args = ["-f", AUDIO_FORMAT, "-b:a", AUDIO_BITRATE, str(output_path)]
+            encoder = FFmpegPipeSink(args, sample_rate)
+            sink = ChunkPostProcessor(
+                encoder, trim_db=TRIM_SILENCE_DB, crossfade_ms=CROSSFADE_MS, peak_ceiling_db=PEAK_CEILING_DB
+            ) if POSTPROCESS else encoder
+            with sink:
+                failed = append_files(sink, chunk_files)
+            for k in failed:
+                self.logger.warning(f"Failed to load chunk {chunk_ids[k]}")
+                missing_chunks.append(chunk_ids[k])
+            successful = len(chunk_files) - len(failed)
+
             if successful == 0:
                 raise RuntimeError("No valid chunks found")
+            if encoder.returncode != 0:
+                raise RuntimeError(f"ffmpeg failed: {encoder.error}")
 
             if missing_chunks:
+                missing_chunks.sort()
                 self.logger.warning(f"Missing chunks: {missing_chunks}")
 
-            combined.export(str(output_path), format=AUDIO_FORMAT, bitrate=AUDIO_BITRATE)
             self.logger.info(f"Audiobook saved: {output_path} ({successful}/{total_chunks} chunks)")
             print(f"[INFO] Saved audiobook: {output_path.name} ({successful}/{total_chunks} chunks)")
             if missing_chunks:
@@ -570,9 +649,8 @@ class QwenAudiobookConverter:
             return False
 
     def cleanup_chunks(self):
-        """Remove temporary chunk files and cache"""
+        """Remove temporary chunk files (the audio cache persists across runs)"""
         try:
-            # Clean up chunks folder
             chunk_count = 0
             for chunk_file in Path("chunks").glob("chunk_*.wav"):
                 try:
@@ -580,21 +658,10 @@ class QwenAudiobookConverter:
                     chunk_count += 1
                 except Exception as e:
                     self.logger.warning(f"Failed to delete {chunk_file}: {e}")
-            
-            # Clean up cache folder
-            cache_count = 0
-            cache_dir = Path("cache/audio_chunks")
-            if cache_dir.exists():
-                for cache_file in cache_dir.glob("*.wav"):
-                    try:
-                        cache_file.unlink()
-                        cache_count += 1
-                    except Exception as e:
-                        self.logger.warning(f"Failed to delete cache file {cache_file}: {e}")
-            
-            if chunk_count > 0 or cache_count > 0:
-                self.logger.info(f"Cleaned up {chunk_count} chunk files and {cache_count} cache files")
-                print(f"[INFO] Cleaned up {chunk_count} chunk files and {cache_count} cache files")
+
+            if chunk_count > 0:
+                self.logger.info(f"Cleaned up {chunk_count} chunk files")
+                print(f"[INFO] Cleaned up {chunk_count} chunk files")
         except Exception as e:
             self.logger.warning(f"Cleanup failed: {e}")
 
@@ -627,7 +694,7 @@ class QwenAudiobookConverter:
             print(f"[INFO] Processing {total_chunks} chunks via Qwen API...")
             print(f"[INFO] Estimated time: ~{total_chunks * 4} minutes (4 min per chunk)")
 
-            # Process chunks - process in order to ensure correct naming
+            # Process chunks - numbered so they can be combined in order
             chunk_args = [(i + 1, chunk) for i, chunk in enumerate(chunks)]
 
             print(f"\n{'=' * 50}")
@@ -636,30 +703,37 @@ class QwenAudiobookConverter:
 
             # Track results by chunk number
             results = {}  # chunk_num -> success (bool)
-            
-            # Process chunks sequentially to ensure correct order and naming
-            # This ensures chunks are named 1, 2, 3, 4... in order
-            for chunk_num, chunk_text in chunk_args:
-                try:
-                    result = self.process_chunk_with_retry((chunk_num, chunk_text))
-                    results[chunk_num] = result
+
+            if self.workers > 1:
+                results = self._process_chunks_parallel(chunk_args, total_chunks)
+            else:
+                # Sequential path: chunks are named 1, 2, 3, 4... in order
+                for chunk_num, chunk_text in chunk_args:
+                    try:
+                        result = self.process_chunk_with_retry((chunk_num, chunk_text))
+                        results[chunk_num] = result
                     
-                    if result:
-                        print(f"[OK] Chunk {chunk_num:3d}/{total_chunks} completed")
-                        self.logger.info(f"+ Chunk {chunk_num}/{total_chunks} completed")
-                    else:
-                        print(f"[FAIL] Chunk {chunk_num:3d}/{total_chunks} FAILED")
-                        self.logger.error(f"- Chunk {chunk_num}/{total_chunks} failed")
+                        if result:
+                            print(f"[OK] Chunk {chunk_num:3d}/{total_chunks} completed")
+                            self.logger.info(f"+ Chunk {chunk_num}/{total_chunks} completed")
+                        else:
+                            print(f"[FAIL] Chunk {chunk_num:3d}/{total_chunks} FAILED")
+                            self.logger.error(f"- Chunk {chunk_num}/{total_chunks} failed")
                         
-                except Exception as e:
-                    results[chunk_num] = False
-                    print(f"[ERROR] Chunk {chunk_num:3d}/{total_chunks} ERROR: {e}")
-                    self.logger.error(f"- Chunk {chunk_num}/{total_chunks} error: {e}")
+                    except Exception as e:
+                        results[chunk_num] = False
+                        print(f"[ERROR] Chunk {chunk_num:3d}/{total_chunks} ERROR: {e}")
+                        self.logger.error(f"- Chunk {chunk_num}/{total_chunks} error: {e}")
 
             successful_chunks = sum(1 for v in results.values() if v)
             print(f"\n{'=' * 50}")
             print(f"CHUNK PROCESSING COMPLETE")
             print(f"Successful: {successful_chunks}/{total_chunks}")
+            cache_stats = self.chunk_cache.stats()
+            if cache_stats['hits'] or cache_stats['misses']:
+                print(f"Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                      f"({cache_stats['hit_rate']:.0%}), {cache_stats['size_mb']} MB")
+                self.logger.info(f"Chunk cache stats: {cache_stats}")
             print(f"{'=' * 50}")
             self.logger.info(f"Qwen processing completed: {successful_chunks}/{total_chunks} chunks")
 
@@ -696,6 +770,51 @@ class QwenAudiobookConverter:
             self.cleanup_chunks()
             return False
 
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker pool once; each worker loads its own model."""
+        if self._executor is None:
+            threads = max(1, (os.cpu_count() or 1) // self.workers)
+            print(f"[INFO] Starting {self.workers} synthesis workers ({threads} threads each)...")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.voice_mode, self.voice_clone_ref_audio, self.voice_clone_ref_text, threads),
+            )
+        return self._executor
+
+    def shutdown_workers(self):
+        """Stop the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _process_chunks_parallel(self, chunk_args: List[Tuple[int, str]], total_chunks: int) -> Dict[int, bool]:
+        """Shard chunks across worker processes; results are keyed by chunk number."""
+        executor = self._get_executor()
+        futures = {executor.submit(_process_chunk_in_worker, args): args[0] for args in chunk_args}
+        results = {}
+        for future in as_completed(futures):
+            chunk_num = futures[future]
+            try:
+                ok, hits, misses = future.result()
+                results[chunk_num] = ok
+                # Lookups happen in the workers; count them in the parent's stats
+                self.chunk_cache.hits += hits
+                self.chunk_cache.misses += misses
+            except Exception as e:
+                results[chunk_num] = False
+                self.logger.error(f"- Chunk {chunk_num}/{total_chunks} worker error: {e}")
+            if results[chunk_num]:
+                print(f"[OK] Chunk {chunk_num:3d}/{total_chunks} completed ({len(results)}/{total_chunks} done)")
+                self.logger.info(f"+ Chunk {chunk_num}/{total_chunks} completed")
+            else:
+                print(f"[FAIL] Chunk {chunk_num:3d}/{total_chunks} FAILED")
+                self.logger.error(f"- Chunk {chunk_num}/{total_chunks} failed")
+        # Workers wrote the new entries; pick up the cache's size from disk
+        self.chunk_cache.refresh_size()
+        return results
+
     def run(self):
         """Main conversion process"""
         print("=" * 70)
@@ -705,6 +824,8 @@ class QwenAudiobookConverter:
         print(f"Output folder: {AUDIOBOOKS_FOLDER}")
         print(f"Device: {self.device} (dtype: {self.dtype})")
         print(f"Model: {MODEL_ID}")
+        if self.workers > 1:
+            print(f"Workers: {self.workers} processes")
         print(f"Voice mode: {self.voice_mode}")
         if self.voice_mode == "custom_voice":
             print(f"Speaker: {CUSTOM_VOICE_SPEAKER}")
@@ -743,16 +864,19 @@ class QwenAudiobookConverter:
 
         # Convert each book
         results = {}
-        for book_file in book_files:
-            try:
-                success = self.convert_book(book_file)
-                results[book_file.name] = success
-            except KeyboardInterrupt:
-                print("\n[WARNING] Conversion interrupted by user")
-                break
-            except Exception as e:
-                self.logger.error(f"Unexpected error: {e}")
-                results[book_file.name] = False
+        try:
+            for book_file in book_files:
+                try:
+                    success = self.convert_book(book_file)
+                    results[book_file.name] = success
+                except KeyboardInterrupt:
+                    print("\n[WARNING] Conversion interrupted by user")
+                    break
+                except Exception as e:
+                    self.logger.error(f"Unexpected error: {e}")
+                    results[book_file.name] = False
+        finally:
+            self.shutdown_workers()
 
         # Print summary
         successful = sum(results.values())
@@ -784,6 +908,9 @@ Examples:
 
   # Use voice cloning with reference audio
   python audiobook_converter.py --voice-clone --voice-sample path/to/reference.wav
+
+  # Shard chunks across 4 CPU worker processes
+  python audiobook_converter.py --workers 4
         """
     )
     
@@ -798,6 +925,13 @@ Examples:
         type=str,
         help="Path to reference audio file for voice cloning (WAV format). Audio will be automatically transcribed."
     )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help="Number of synthesis processes; CPU threads are split evenly between them (default: 1)"
+    )
     
     args = parser.parse_args()
     
@@ -816,7 +950,8 @@ Examples:
     try:
         converter = QwenAudiobookConverter(
             voice_mode=voice_mode,
-            voice_clone_ref_audio=voice_clone_ref_audio
+            voice_clone_ref_audio=voice_clone_ref_audio,
+            workers=args.workers
         )
         converter.run()
     except KeyboardInterrupt:
@@ -0,0 +1,125 @@
+"""
+Persistent, content-addressed cache of synthesized chunk audio.
+
+Entries are keyed on every parameter that affects the audio (text, voice
+mode, model, language, speaker, instruct, reference clip content and
+transcript), stored as 16-bit FLAC, and bounded by a size limit with
+least-recently-used eviction. Reads refresh an entry's mtime, which is
+what eviction orders by.
+
+A second, smaller instance under ``cache/phrases/`` holds short phrases that
+recur across books (chapter announcements, intro/outro, title lines), keyed
+on the normalized phrase and the voice.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("cache/audio_chunks")
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+# Short, repeated phrases (chapter announcements, intro/outro, titles)
+PHRASE_CACHE_DIR = Path("cache/phrases")
+PHRASE_CACHE_MAX_BYTES = 512 * 1024 ** 2
+
+
+def normalize_phrase(text: str) -> str:
+    """Canonical form of a phrase for cache keys (Unicode form, whitespace)."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class ChunkAudioCache:
+    """Size-bounded LRU cache of chunk audio on disk."""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refresh_size()
+
+    def refresh_size(self):
+        """Re-read the cache's size from disk (e.g. after other processes wrote to it)."""
+        self._size = sum(e.stat().st_size for e in os.scandir(self.cache_dir) if e.name.endswith('.flac'))
+
+    @staticmethod
+    def key(**params: Any) -> str:
+        """Stable key over all synthesis parameters."""
+        blob = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.flac"
+
+    def load(self, key: str, dtype: str = 'float32') -> Optional[Tuple[np.ndarray, int]]:
+        """Return (audio, sample_rate) cached under key, or None on a miss."""
+        path = self._path(key)
+        try:
+            audio, sr = sf.read(str(path), dtype=dtype)
+        except Exception:
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return audio, sr
+
+    def get(self, key: str, dest_path: Path) -> bool:
+        """Write the cached audio for key to dest_path (WAV); False on a miss."""
+        cached = self.load(key, dtype='int16')
+        if cached is None:
+            return False
+        sf.write(str(dest_path), cached[0], cached[1], subtype='PCM_16')
+        return True
+
+    def put(self, key: str, audio: np.ndarray, sample_rate: int):
+        """Store audio under key, then evict old entries if over the limit."""
+        path = self._path(key)
+        try:
+            # Overwriting an entry replaces its size rather than adding to it
+            self._size -= path.stat().st_size
+        except FileNotFoundError:
+            pass
+        # Per-process name: synthesis workers share the cache directory
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        sf.write(str(tmp), audio, sample_rate, format='FLAC', subtype='PCM_16')
+        os.replace(tmp, path)
+        self._size += path.stat().st_size
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until under max_bytes."""
+        entries = sorted(
+            (e for e in os.scandir(self.cache_dir) if e.name.endswith('.flac')),
+            key=lambda e: e.stat().st_mtime,
+        )
+        self._size = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            if self._size <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            Path(entry.path).unlink(missing_ok=True)
+            self._size -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'evictions': self.evictions,
+            'size_mb': round(self._size / 1024 ** 2, 1),
+        }
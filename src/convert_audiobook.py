@@ -29,7 +29,7 @@ import zipfile
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from html import unescape
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -37,23 +37,30 @@ import numpy as np
 import psutil
 import soundfile as sf
 import torch
-import whisper
 import yaml
 from pydub import AudioSegment
 from qwen_tts import Qwen3TTSModel
 from tqdm import tqdm
 
-try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
+from audio_post import ChunkPostProcessor
+from audio_sink import BLOCK_FRAMES, AudioSink, FFmpegPipeSink, audio_info
+from chunk_cache import PHRASE_CACHE_DIR, PHRASE_CACHE_MAX_BYTES, ChunkAudioCache, normalize_phrase
+from html_text import html_to_text, html_to_texts
+from loudness import LoudnessMeter, normalization_gain
+from parallel_encode import (
+    concat_copy_cmd, encode_segments, encoded_duration, gain_args, write_concat_list,
+)
+from text_normalizer import TextNormalizer, get_normalizer
+from transcript_cache import load_cached_transcript, load_whisper_model, save_cached_transcript
+from voice_prompt_cache import VoicePromptCache
 
 
 # ============================================================
 # CONSTANTS
 # ============================================================
 
+MODEL_ID = "Qwen/Qwen3-TTS-12Hz-1.7B-Base"
+
 DEFAULT_CONFIG = {
     'intro_text': None,
     'title_announcement': None,
@@ -76,12 +83,23 @@ DEFAULT_CONFIG = {
     'text_cleaning': {
         'fix_spaced_capitals': True,
         'remove_footnotes': True,
-        'normalize_special_chars': True
+        'normalize_special_chars': True,
+        'html_backend': 'auto'
     },
     'output': {
         'format': 'm4b',
         'bitrate': '128k',
-        'embed_cover': True
+        'embed_cover': True,
+        'encode_workers': 1,
+        'sample_dtype': 'float32',
+        'loudness_target': None
+    },
+    'postprocess': {
+        'enabled': False,
+        'trim_db': -50.0,
+        'keep_ms': 150,
+        'crossfade_ms': 15,
+        'peak_ceiling_db': -1.0
     },
     'memory': {
         'clear_cache_per_chapter': True,
@@ -140,6 +158,11 @@ class ConversionState:
     chapters_total: int = 0
     chapters_completed: List[str] = field(default_factory=list)
     chapter_audio_files: Dict[str, str] = field(default_factory=dict)
+    # Durations recorded when audio is generated, so resume needn't read files
+    chapter_durations: Dict[str, float] = field(default_factory=dict)
+    sample_rate: int = 0
+    # Running loudness measurement per chapter (LoudnessMeter.to_dict())
+    chapter_loudness: Dict[str, dict] = field(default_factory=dict)
     started_at: str = ""
     updated_at: str = ""
     completed: bool = False
@@ -157,6 +180,27 @@ class ConversionState:
             data = json.load(f)
         return cls(**data)
 
+    def record_audio(
+        self, chapter_id: str, audio_path: str, loudness: Optional[dict] = None
+    ) -> Tuple[float, int]:
+        """Mark a chapter done and record its duration from the file header."""
+        duration, self.sample_rate = audio_info(audio_path)
+        self.chapters_completed.append(chapter_id)
+        self.chapter_audio_files[chapter_id] = audio_path
+        self.chapter_durations[chapter_id] = duration
+        if loudness:
+            self.chapter_loudness[chapter_id] = loudness
+        return duration, self.sample_rate
+
+    def audio_info(self, chapter_id: str) -> Tuple[float, int]:
+        """Duration and sample rate of a completed chapter's audio."""
+        if chapter_id in self.chapter_durations and self.sample_rate:
+            return self.chapter_durations[chapter_id], self.sample_rate
+        # Checkpoints from older versions: read the header (no decoding)
+        duration, self.sample_rate = audio_info(self.chapter_audio_files[chapter_id])
+        self.chapter_durations[chapter_id] = duration
+        return duration, self.sample_rate
+
 
 # ============================================================
 # EPUB PARSER
@@ -301,10 +345,11 @@ class EPUBParser:
         self,
         include_ids: List[str] = None,
         exclude_ids: List[str] = None,
-        text_cleaner: callable = None
+        text_cleaner: callable = None,
+        html_backend: str = 'auto'
     ) -> List[Chapter]:
         """Get chapters in reading order with optional filtering."""
-        chapters = []
+        items = []
 
         with zipfile.ZipFile(self.epub_path, 'r') as z:
             for item_id in self.spine:
@@ -320,92 +365,41 @@ class EPUBParser:
 
                 try:
                     content = z.read(file_path).decode('utf-8', errors='ignore')
-                    clean_content = clean_html(content)
-                    if text_cleaner:
-                        clean_content = text_cleaner(clean_content)
-
-                    if clean_content.strip():
-                        chapters.append(Chapter(
-                            id=item_id,
-                            title=title,
-                            file_path=file_path,
-                            content=clean_content
-                        ))
+                    items.append((item_id, title, file_path, content))
                 except Exception:
                     continue
 
-        return chapters
+        # HTML to text; large books are spread over several processes
+        texts = html_to_texts([content for *_, content in items], html_backend)
+        if isinstance(text_cleaner, TextNormalizer):
+            # Cleans the chapters on several processes when the book is large
+            texts = text_cleaner.map(texts)
+        elif text_cleaner:
+            texts = [text_cleaner(text) for text in texts]
+
+        return [
+            Chapter(id=item_id, title=title, file_path=file_path, content=text)
+            for (item_id, title, file_path, _), text in zip(items, texts)
+            if text.strip()
+        ]
 
 
 # ============================================================
 # TEXT CLEANING
 # ============================================================
 
-def clean_html(html_content: str) -> str:
-    """Clean HTML content to plain text."""
-    if not html_content:
-        return ""
-
-    if BS4_AVAILABLE:
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            for script in soup(["script", "style"]):
-                script.decompose()
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            return ' '.join(chunk for chunk in chunks if chunk)
-        except Exception:
-            pass
-
-    # Fallback
-    html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-    html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-    html_content = re.sub(r'<[^>]+>', ' ', html_content)
-    html_content = unescape(html_content)
-    return re.sub(r'\s+', ' ', html_content).strip()
-
-
-def fix_spaced_capitals(text: str) -> str:
-    """Convert 'A H OUSE D IVIDED' to 'A House Divided'."""
-    def fix_word(match):
-        chars = match.group(0).replace(' ', '')
-        if len(chars) >= 2:
-            return chars[0] + chars[1:].lower()
-        return chars
-
-    pattern = r'\b([A-Z]\s+){2,}[A-Z]+\b'
-    return re.sub(pattern, fix_word, text)
-
-
-def remove_footnote_markers(text: str) -> str:
-    """Remove footnote symbols."""
-    markers = r'[*\u2020\u2021\u00a7\u00b6\u2016\u00b9\u00b2\u00b3\u2074\u2075\u2076\u2077\u2078\u2079\u2070]+'
-    text = re.sub(r'\s*' + markers + r'\s*', ' ', text)
-    return re.sub(r'\s+', ' ', text)
+def clean_html(html_content: str, backend: str = 'auto') -> str:
+    """Clean HTML content to plain text (see html_text for the backends)."""
+    return html_to_text(html_content, backend)
 
 
-def normalize_special_chars(text: str) -> str:
-    """Normalize special characters for better TTS."""
-    text = text.replace('\u2014', ' - ')  # em-dash
-    text = text.replace('\u2013', ' - ')  # en-dash
-    text = text.replace('\u201c', '"').replace('\u201d', '"')  # curly quotes
-    text = text.replace('\u2018', "'").replace('\u2019', "'")
-    text = text.replace('\u2026', '...')  # ellipsis
-    return text
-
-
-def create_text_cleaner(config: dict):
+def create_text_cleaner(config: dict) -> TextNormalizer:
     """Create a text cleaning function based on config."""
-    def cleaner(text: str) -> str:
-        if config.get('fix_spaced_capitals', True):
-            text = fix_spaced_capitals(text)
-        if config.get('remove_footnotes', True):
-            text = remove_footnote_markers(text)
-        if config.get('normalize_special_chars', True):
-            text = normalize_special_chars(text)
-        return re.sub(r'\s+', ' ', text).strip()
-    return cleaner
+    return get_normalizer(
+        config.get('fix_spaced_capitals', True),
+        config.get('remove_footnotes', True),
+        config.get('normalize_special_chars', True)
+    )
 
 
 # ============================================================
@@ -485,11 +479,17 @@ class AudiobookConverter:
         # Create temp directory for chapter audio
         self.temp_dir = self.output_dir / ".temp"
         self.temp_dir.mkdir(exist_ok=True)
+        # int16 keeps chapter audio 16-bit from model output to the encoder
+        self.sample_dtype = self.config['output'].get('sample_dtype', 'float32')
+        # Loudness meters of files being written, keyed by path
+        self._meters: Dict[str, LoudnessMeter] = {}
 
         self.device, self.dtype = get_device_and_dtype()
         self.tts_model = None
         self.whisper_model = None
         self.ref_text = None
+        self.voice_prompts = None
+        self.phrase_cache = ChunkAudioCache(PHRASE_CACHE_DIR, PHRASE_CACHE_MAX_BYTES)
         self.sample_rate = 24000
 
         # Graceful shutdown
@@ -503,21 +503,18 @@ class AudiobookConverter:
         self._shutdown_requested = True
 
     def load_models(self):
-        """Load TTS and Whisper models."""
+        """Load the TTS model (and Whisper only if a transcript is missing)."""
         print(f"[*] Device: {self.device} ({self.dtype})")
         print(f"[*] Available memory: {get_available_memory_gb():.1f} GB")
 
-        print("[*] Loading Whisper model...")
-        self.whisper_model = whisper.load_model("base")
-        print("[+] Whisper loaded")
-
         print("[*] Loading Qwen3-TTS model (~6GB)...")
         self.tts_model = Qwen3TTSModel.from_pretrained(
-            "Qwen/Qwen3-TTS-12Hz-1.7B-Base",
+            MODEL_ID,
             device_map=self.device,
             torch_dtype=self.dtype
         )
         print("[+] Qwen3-TTS loaded")
+        self.voice_prompts = VoicePromptCache(self.tts_model, MODEL_ID, device=self.device)
 
         # Get reference text
         if self.transcript_path and Path(self.transcript_path).exists():
@@ -525,29 +522,99 @@ class AudiobookConverter:
                 self.ref_text = f.read().strip()
             print(f"[+] Transcript loaded: {self.ref_text[:80]}...")
         else:
-            print("[*] Transcribing voice sample with Whisper...")
-            result = self.whisper_model.transcribe(self.voice_path)
-            self.ref_text = result["text"].strip()
-            print(f"[+] Auto-transcription: {self.ref_text}")
+            self.ref_text = load_cached_transcript(self.voice_path)
+            if self.ref_text:
+                print(f"[+] Cached transcript: {self.ref_text[:80]}...")
+            else:
+                print("[*] Loading Whisper model...")
+                self.whisper_model = load_whisper_model()
+                print("[+] Whisper loaded")
+                print("[*] Transcribing voice sample with Whisper...")
+                result = self.whisper_model.transcribe(self.voice_path)
+                self.ref_text = result["text"].strip()
+                save_cached_transcript(self.voice_path, self.ref_text)
+                print(f"[+] Auto-transcription: {self.ref_text}")
+                # Whisper is not needed again for this run
+                self.whisper_model = None
+                clear_mps_cache()
+
+        # Encode the reference clip once (or load it from cache/voice_prompts)
+        if self.voice_prompts.get(self.voice_path, self.ref_text) is not None:
+            print(f"[+] Voice prompt ready (encode cost {self.voice_prompts.encode_seconds:.2f}s, reused per chunk)")
 
         print(f"[*] Available memory after loading: {get_available_memory_gb():.1f} GB")
 
     def _generate_audio(self, text: str) -> Tuple[np.ndarray, int]:
         """Generate audio using TTS model."""
-        wavs, sr = self.tts_model.generate_voice_clone(
-            text=text,
-            language="English",
-            ref_audio=self.voice_path,
-            ref_text=self.ref_text,
-            x_vector_only_mode=False,
-            non_streaming_mode=True
-        )
+        prompt = self.voice_prompts.get(self.voice_path, self.ref_text)
+        if prompt is not None:
+            wavs, sr = self.tts_model.generate_voice_clone(
+                text=text,
+                language="English",
+                voice_clone_prompt=prompt,
+                non_streaming_mode=True
+            )
+            self.voice_prompts.record_use()
+        else:
+            wavs, sr = self.tts_model.generate_voice_clone(
+                text=text,
+                language="English",
+                ref_audio=self.voice_path,
+                ref_text=self.ref_text,
+                x_vector_only_mode=False,
+                non_streaming_mode=True
+            )
         self.sample_rate = sr
         return wavs[0], sr
 
-    def _create_silence(self, duration_sec: float) -> np.ndarray:
-        """Create silence array."""
-        return np.zeros(int(duration_sec * self.sample_rate), dtype=np.float32)
+    def _generate_phrase_audio(self, text: str) -> Tuple[np.ndarray, int]:
+        """Generate audio for a short recurring phrase, reusing it across books."""
+        key = ChunkAudioCache.key(
+            text=normalize_phrase(text),
+            voice=self.voice_prompts.key(self.voice_path, self.ref_text, False),
+            model=MODEL_ID,
+            language="English",
+        )
+        cached = self.phrase_cache.load(key)
+        if cached is not None:
+            audio, sr = cached
+            self.sample_rate = sr
+            return audio, sr
+        audio, sr = self._generate_audio(text)
+        self.phrase_cache.put(key, audio, sr)
+        return audio, sr
+
+    def _chunk_sink(self, path: Path):
+        """Sink for synthesized chunks, post-processed unless disabled in config."""
+        meter = self._meters[str(path)] = LoudnessMeter()
+        sink = AudioSink(path, dtype=self.sample_dtype, meter=meter)
+        post = dict(self.config['postprocess'])
+        if not post.pop('enabled', False):
+            return sink
+        return ChunkPostProcessor(sink, **post)
+
+    def _take_loudness(self, path: str) -> Optional[dict]:
+        """Loudness measured while writing path, for the checkpoint."""
+        meter = self._meters.pop(str(path), None)
+        return meter.to_dict() if meter and meter.blocks else None
+
+    def _loudness_gain(self, loudness: List[Optional[dict]]) -> float:
+        """Single gain (dB) that brings the book to output.loudness_target."""
+        target = self.config['output'].get('loudness_target')
+        measured = [m for m in loudness if m]
+        if not measured:
+            return 0.0
+        meter = LoudnessMeter.combined(measured)
+        if meter.integrated is None:
+            return 0.0
+        if target is None:
+            print(f"[*] Loudness: {meter.integrated:.1f} LUFS (no loudness_target, level unchanged)")
+            return 0.0
+        gain = normalization_gain(meter, target)
+        print(f"[*] Loudness: {meter.integrated:.1f} LUFS, applying {gain:+.1f} dB (target {target} LUFS)")
+        if len(measured) < len(loudness):
+            print(f"    [!] {len(loudness) - len(measured)} section(s) have no measurement")
+        return gain
 
     def _generate_chunk_with_retry(
         self,
@@ -607,61 +674,73 @@ class AudiobookConverter:
     ) -> Optional[str]:
         """Generate audio for a single chapter and save to file."""
         conv_config = self.config['conversion']
-        audio_parts = []
-
-        # Generate chapter announcement
-        if conv_config.get('announce_chapters', True):
-            try:
-                ann_audio, _ = self._generate_audio(chapter.title)
-                audio_parts.append(ann_audio)
-                audio_parts.append(self._create_silence(1.0))
-            except Exception as e:
-                print(f"  [!] Announcement failed: {e}")
-
-        # Generate content in chunks
-        chunk_size = conv_config.get('chunk_size', 1500)
-        min_chunk_size = conv_config.get('min_chunk_size', 200)
-        max_retries = conv_config.get('max_retries', 3)
-
-        chunks = split_into_chunks(chapter.content, chunk_size)
-
-        for i, chunk in enumerate(tqdm(chunks, desc=f"  {chapter.title[:25]}", leave=False)):
-            if self._shutdown_requested:
-                break
-
-            audio = self._generate_chunk_with_retry(chunk, chunk_size, min_chunk_size, max_retries)
-            if audio is not None:
-                audio_parts.append(audio)
-
-            if progress_callback:
-                progress_callback(i + 1, len(chunks))
-
-        if not audio_parts:
+        output_path = self.temp_dir / f"{chapter.id}.wav"
+        try:
+            # Chunks are appended to the chapter file as they finish; the sink is
+            # closed even if generation raises
+            with self._chunk_sink(output_path) as sink:
+                # Generate chapter announcement
+                if conv_config.get('announce_chapters', True):
+                    try:
+                        ann_audio, sr = self._generate_phrase_audio(chapter.title)
+                        sink.write(ann_audio, sr)
+                        sink.write_silence(1.0)
+                    except Exception as e:
+                        print(f"  [!] Announcement failed: {e}")
+
+                # Generate content in chunks
+                chunk_size = conv_config.get('chunk_size', 1500)
+                min_chunk_size = conv_config.get('min_chunk_size', 200)
+                max_retries = conv_config.get('max_retries', 3)
+
+                chunks = split_into_chunks(chapter.content, chunk_size)
+
+                progress = tqdm(chunks, desc=f"  {chapter.title[:25]}", leave=False)
+                for i, chunk in enumerate(progress):
+                    if self._shutdown_requested:
+                        break
+
+                    audio = self._generate_chunk_with_retry(chunk, chunk_size, min_chunk_size, max_retries)
+                    if audio is not None:
+                        sink.write(audio, self.sample_rate)
+                    if self.voice_prompts and self.voice_prompts.supported:
+                        progress.set_postfix(prompt_saved=f"{self.voice_prompts.encode_seconds:.2f}s/chunk")
+
+                    if progress_callback:
+                        progress_callback(i + 1, len(chunks))
+
+                if sink.frames:
+                    # Add pause after chapter
+                    pause_duration = conv_config.get('chapter_pause', 2.5)
+                    sink.write_silence(pause_duration)
+        except BaseException:
+            # No loudness will be taken for a chapter that failed
+            self._meters.pop(str(output_path), None)
+            raise
+
+        if not sink.frames:
+            self._meters.pop(str(output_path), None)
+            output_path.unlink(missing_ok=True)
             return None
 
-        # Add pause after chapter
-        pause_duration = conv_config.get('chapter_pause', 2.5)
-        audio_parts.append(self._create_silence(pause_duration))
-
-        # Concatenate and save
-        full_audio = np.concatenate(audio_parts)
-        output_path = self.temp_dir / f"{chapter.id}.wav"
-        sf.write(str(output_path), full_audio, self.sample_rate)
+        if self.voice_prompts and self.voice_prompts.total_saved:
+            print(f"    Voice prompt reuse saved {self.voice_prompts.total_saved:.1f}s so far")
 
         return str(output_path)
 
     def _generate_simple_audio(self, text: str, output_id: str) -> Optional[str]:
         """Generate audio for simple text (intro/outro) and save to file."""
+        output_path = self.temp_dir / f"{output_id}.wav"
         try:
             print(f"  Generating: {text[:50]}...")
-            audio, _ = self._generate_audio(text)
-            # Add pause after
-            audio_with_pause = np.concatenate([audio, self._create_silence(2.0)])
-            output_path = self.temp_dir / f"{output_id}.wav"
-            sf.write(str(output_path), audio_with_pause, self.sample_rate)
+            audio, _ = self._generate_phrase_audio(text)
+            with self._chunk_sink(output_path) as sink:
+                sink.write(audio, self.sample_rate)
+                sink.write_silence(2.0)
             return str(output_path)
         except Exception as e:
             print(f"  [!] Failed to generate {output_id}: {e}")
+            self._meters.pop(str(output_path), None)
             return None
 
     def convert_epub(
@@ -716,7 +795,8 @@ class AudiobookConverter:
         chapters = parser.get_chapters(
             include_ids=include_ids,
             exclude_ids=exclude_ids,
-            text_cleaner=text_cleaner
+            text_cleaner=text_cleaner,
+            html_backend=self.config.get('text_cleaning', {}).get('html_backend', 'auto')
         )
 
         if not chapters:
@@ -751,8 +831,7 @@ class AudiobookConverter:
             print("\n[INTRO]")
             audio_path = self._generate_simple_audio(intro_text, '_intro')
             if audio_path:
-                audio_data, sr = sf.read(audio_path)
-                duration = len(audio_data) / sr
+                duration, sr = state.record_audio('_intro', audio_path, self._take_loudness(audio_path))
                 chapter_audios.append(ChapterAudio(
                     id='_intro',
                     title='Introduction',
@@ -762,8 +841,6 @@ class AudiobookConverter:
                     duration=duration
                 ))
                 current_time += duration
-                state.chapters_completed.append('_intro')
-                state.chapter_audio_files['_intro'] = audio_path
                 state.save(state_file)
                 print(f"    [+] Duration: {duration:.1f} sec")
 
@@ -771,8 +848,7 @@ class AudiobookConverter:
             print("\n[TITLE]")
             audio_path = self._generate_simple_audio(title_announcement, '_title')
             if audio_path:
-                audio_data, sr = sf.read(audio_path)
-                duration = len(audio_data) / sr
+                duration, sr = state.record_audio('_title', audio_path, self._take_loudness(audio_path))
                 chapter_audios.append(ChapterAudio(
                     id='_title',
                     title='Title',
@@ -782,8 +858,6 @@ class AudiobookConverter:
                     duration=duration
                 ))
                 current_time += duration
-                state.chapters_completed.append('_title')
-                state.chapter_audio_files['_title'] = audio_path
                 state.save(state_file)
                 print(f"    [+] Duration: {duration:.1f} sec")
 
@@ -798,8 +872,7 @@ class AudiobookConverter:
                 # Load existing audio info
                 audio_path = state.chapter_audio_files.get(chapter.id)
                 if audio_path and Path(audio_path).exists():
-                    audio_data, sr = sf.read(audio_path)
-                    duration = len(audio_data) / sr
+                    duration, sr = state.audio_info(chapter.id)
                     chapter_audios.append(ChapterAudio(
                         id=chapter.id,
                         title=chapter.title,
@@ -820,9 +893,7 @@ class AudiobookConverter:
                 audio_path = self._generate_chapter_audio(chapter)
 
                 if audio_path:
-                    # Get duration
-                    audio_data, sr = sf.read(audio_path)
-                    duration = len(audio_data) / sr
+                    duration, sr = state.record_audio(chapter.id, audio_path, self._take_loudness(audio_path))
 
                     chapter_audios.append(ChapterAudio(
                         id=chapter.id,
@@ -833,10 +904,6 @@ class AudiobookConverter:
                         duration=duration
                     ))
                     current_time += duration
-
-                    # Update state
-                    state.chapters_completed.append(chapter.id)
-                    state.chapter_audio_files[chapter.id] = audio_path
                     state.save(state_file)
 
                     print(f"    [+] Duration: {duration/60:.1f} min")
@@ -856,8 +923,7 @@ class AudiobookConverter:
             print("\n[OUTRO]")
             audio_path = self._generate_simple_audio(outro_text, '_outro')
             if audio_path:
-                audio_data, sr = sf.read(audio_path)
-                duration = len(audio_data) / sr
+                duration, sr = state.record_audio('_outro', audio_path, self._take_loudness(audio_path))
                 chapter_audios.append(ChapterAudio(
                     id='_outro',
                     title='Closing',
@@ -867,8 +933,6 @@ class AudiobookConverter:
                     duration=duration
                 ))
                 current_time += duration
-                state.chapters_completed.append('_outro')
-                state.chapter_audio_files['_outro'] = audio_path
                 state.save(state_file)
                 print(f"    [+] Duration: {duration:.1f} sec")
 
@@ -885,13 +949,16 @@ class AudiobookConverter:
             chapter_audios,
             str(output_path),
             parser.metadata,
-            parser.cover_path
+            parser.cover_path,
+            [state.chapter_loudness.get(ca.id) for ca in chapter_audios]
         )
 
         if final_path:
             total_duration = sum(ca.duration for ca in chapter_audios)
             print(f"\n[+] Total duration: {total_duration/60:.1f} minutes")
             print(f"[+] Output: {final_path}")
+            stats = self.phrase_cache.stats()
+            print(f"[+] Phrase cache: {stats['hits']} reused, {stats['misses']} generated")
 
             # Mark complete
             state.completed = True
@@ -907,91 +974,130 @@ class AudiobookConverter:
         chapter_audios: List[ChapterAudio],
         output_path: str,
         metadata: dict,
-        cover_path: str = None
+        cover_path: str = None,
+        loudness: Optional[List[Optional[dict]]] = None
     ) -> Optional[str]:
-        """Save audiobook with chapter markers."""
-        output_format = self.config['output'].get('format', 'm4b')
+        """Save audiobook with chapter markers.
 
-        # Concatenate all audio
-        print("[*] Combining chapter audio...")
-        all_audio_parts = []
-        for ca in tqdm(chapter_audios, desc="Loading chapters"):
-            audio_data, _ = sf.read(ca.audio_path)
-            all_audio_parts.append(audio_data)
-
-        all_audio = np.concatenate(all_audio_parts)
-        sample_rate = chapter_audios[0].sample_rate
-
-        # Save as WAV first
-        wav_path = str(self.temp_dir / "combined.wav")
-        sf.write(wav_path, all_audio, sample_rate)
+        The loudness measured during synthesis sets one gain for the
+        output (encoded or WAV), so no separate analysis pass is needed.
+        """
+        output_format = self.config['output'].get('format', 'm4b')
+        gain_db = self._loudness_gain(loudness or [])
 
         if output_format == 'wav':
-            import shutil
-            shutil.move(wav_path, output_path)
+            print("[*] Combining chapter audio...")
+            self._write_combined_wav(chapter_audios, output_path, gain_db)
             return output_path
 
-        # Create M4B with chapters
+        wav_output = output_path.replace(f'.{output_format}', '.wav')
         try:
-            metadata_path = self._create_ffmetadata(chapter_audios, metadata)
             bitrate = self.config['output'].get('bitrate', '128k')
-
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", wav_path,
-                "-i", metadata_path,
-                "-map", "0:a",
-                "-map_metadata", "1",
-                "-c:a", "aac",
-                "-b:a", bitrate,
-            ]
+            workers = self.config['output'].get('encode_workers', 1)
+            # Separately encoded chapters each carry AAC priming/padding, which
+            # moves every later chapter start; their lengths follow from the
+            # sample counts, so nothing has to be probed after encoding
+            durations = [
+                encoded_duration(round(ca.duration * ca.sample_rate), ca.sample_rate)
+                for ca in chapter_audios
+            ] if workers > 1 else None
+            metadata_path = self._create_ffmetadata(chapter_audios, metadata, durations)
+
+            args = ["-i", metadata_path]
 
             # Add cover if available
-            if cover_path and self.config['output'].get('embed_cover', True):
-                if Path(cover_path).exists():
-                    cmd.extend([
-                        "-i", cover_path,
-                        "-map", "2:v",
-                        "-c:v", "mjpeg",
-                        "-disposition:v:0", "attached_pic"
-                    ])
-
-            cmd.append(output_path)
+            has_cover = cover_path and self.config['output'].get('embed_cover', True) and Path(cover_path).exists()
+            if has_cover:
+                args.extend(["-i", cover_path])
+
+            args.extend(["-map", "0:a", "-map_metadata", "1"])
+            if has_cover:
+                args.extend([
+                    "-map", "2:v",
+                    "-c:v", "mjpeg",
+                    "-disposition:v:0", "attached_pic"
+                ])
 
             print(f"[*] Creating {output_format.upper()} with chapters...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode != 0:
+            if workers > 1:
+                # Encode chapters concurrently, then join them without re-encoding
+                try:
+                    parts = encode_segments(
+                        [ca.audio_path for ca in chapter_audios],
+                        self.temp_dir / "aac", bitrate, workers, gain_db
+                    )
+                    concat_list = write_concat_list(parts, self.temp_dir / "concat.txt", durations)
+                    result = subprocess.run(
+                        concat_copy_cmd(concat_list) + args + ["-c:a", "copy", output_path],
+                        capture_output=True, text=True
+                    )
+                    ok, error = result.returncode == 0, result.stderr.strip()
+                except RuntimeError as e:
+                    ok, error = False, str(e)
+            else:
+                # PCM is piped into ffmpeg, so no combined WAV is written
+                sample_rate = sf.info(chapter_audios[0].audio_path).samplerate
+                encode_args = args + gain_args(gain_db) + ["-c:a", "aac", "-b:a", bitrate, output_path]
+                with FFmpegPipeSink(encode_args, sample_rate,
+                                    dtype=self.sample_dtype) as encoder:
+                    for ca in tqdm(chapter_audios, desc="Encoding chapters"):
+                        encoder.append_file(ca.audio_path)
+                ok, error = encoder.returncode == 0, encoder.error
+
+            if not ok:
                 print(f"[!] FFmpeg error - saving as WAV")
-                import shutil
-                wav_output = output_path.replace(f'.{output_format}', '.wav')
-                shutil.move(wav_path, wav_output)
+                if error:
+                    print(f"    {error.splitlines()[-1]}")
+                self._write_combined_wav(chapter_audios, wav_output, gain_db)
                 return wav_output
 
             # Cleanup
-            Path(wav_path).unlink(missing_ok=True)
             Path(metadata_path).unlink(missing_ok=True)
 
             return output_path
 
         except FileNotFoundError:
             print("[!] FFmpeg not found - saving as WAV")
-            import shutil
-            wav_output = output_path.replace(f'.{output_format}', '.wav')
-            shutil.move(wav_path, wav_output)
+            self._write_combined_wav(chapter_audios, wav_output, gain_db)
             return wav_output
 
-    def _create_ffmetadata(self, chapter_audios: List[ChapterAudio], metadata: dict) -> str:
-        """Create FFMETADATA file for chapter markers."""
+    def _write_combined_wav(
+        self, chapter_audios: List[ChapterAudio], path: str, gain_db: float = 0.0
+    ):
+        """Stream all chapter WAVs into one file without loading the book."""
+        scale = 10 ** (gain_db / 20)
+        with AudioSink(path, dtype=self.sample_dtype) as sink:
+            for ca in tqdm(chapter_audios, desc="Combining chapters"):
+                if not gain_db:
+                    sink.append_file(ca.audio_path)
+                    continue
+                sample_rate = sf.info(ca.audio_path).samplerate
+                for block in sf.blocks(ca.audio_path, blocksize=BLOCK_FRAMES, dtype='float32'):
+                    sink.write(block * scale, sample_rate)
+
+    def _create_ffmetadata(
+        self, chapter_audios: List[ChapterAudio], metadata: dict,
+        durations: Optional[List[float]] = None
+    ) -> str:
+        """Create FFMETADATA file for chapter markers.
+
+        With ``durations`` (e.g. of separately encoded chapters) the chapters
+        are laid end to end with those lengths instead of their PCM times.
+        """
         lines = [";FFMETADATA1"]
         lines.append(f"title={metadata.get('title', 'Audiobook')}")
         lines.append(f"artist={metadata.get('author', 'Unknown')}")
         lines.append(f"album={metadata.get('title', 'Audiobook')}")
         lines.append("")
 
-        for ca in chapter_audios:
-            start_ms = int(ca.start_time * 1000)
-            end_ms = int((ca.start_time + ca.duration) * 1000)
+        if durations is None:
+            spans = [(ca.start_time, ca.duration) for ca in chapter_audios]
+        else:
+            spans = list(zip(accumulate(durations[:-1], initial=0.0), durations))
+
+        for ca, (start_time, duration) in zip(chapter_audios, spans):
+            start_ms = int(start_time * 1000)
+            end_ms = int((start_time + duration) * 1000)
 
             lines.append("[CHAPTER]")
             lines.append("TIMEBASE=1/1000")
@@ -1062,7 +1168,8 @@ class AudiobookConverter:
         chapters = parser.get_chapters(
             include_ids=include_ids,
             exclude_ids=exclude_ids,
-            text_cleaner=text_cleaner
+            text_cleaner=text_cleaner,
+            html_backend=self.config.get('text_cleaning', {}).get('html_backend', 'auto')
         )
 
         total_words = 0
@@ -0,0 +1,130 @@
+"""
+HTML-to-text extraction for EPUB spine items, with pluggable backends.
+
+Every EPUB path used to build a full BeautifulSoup tree with the
+pure-Python ``html.parser`` for each spine item, one item after another.
+This module picks the fastest backend that is installed:
+
+  lxml  - libxml2's HTML parser (C), text gathered with ``itertext``
+  bs4   - BeautifulSoup with ``html.parser`` (the previous behaviour)
+  regex - tag stripping, used when neither is installed
+
+All backends drop ``<script>`` / ``<style>`` and return the text with
+whitespace collapsed to single spaces. ``html_to_texts`` converts many
+documents at once and fans them out over a process pool when there is
+enough markup to be worth it. Extra backends can be added with
+``register_backend``.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html import unescape
+from typing import Callable, Dict, List, Optional
+
+try:
+    from lxml import etree as _etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+# Below this much markup a single process is faster than a pool
+PARALLEL_MIN_CHARS = 4_000_000
+
+_BACKENDS: Dict[str, Callable[[str], str]] = {}
+
+
+def register_backend(name: str):
+    """Decorator registering an extractor: html -> whitespace-collapsed text."""
+    def wrap(fn: Callable[[str], str]) -> Callable[[str], str]:
+        _BACKENDS[name] = fn
+        return fn
+    return wrap
+
+
+def _collapse(text: str) -> str:
+    return ' '.join(text.split())
+
+
+if LXML_AVAILABLE:
+    _LXML_PARSER = _etree.HTMLParser(
+        encoding='utf-8', remove_comments=True, remove_pis=True, no_network=True
+    )
+
+    @register_backend('lxml')
+    def _lxml_text(html: str) -> str:
+        # Bytes, because lxml rejects str input that carries an XML encoding declaration
+        root = _etree.fromstring(html.encode('utf-8'), _LXML_PARSER)
+        if root is None:
+            return ''
+        _etree.strip_elements(root, 'script', 'style', with_tail=False)
+        return _collapse(''.join(root.itertext()))
+
+
+if BS4_AVAILABLE:
+    @register_backend('bs4')
+    def _bs4_text(html: str) -> str:
+        soup = BeautifulSoup(html, 'html.parser')
+        for tag in soup(['script', 'style']):
+            tag.decompose()
+        return _collapse(soup.get_text())
+
+
+@register_backend('regex')
+def _regex_text(html: str) -> str:
+    html = re.sub(r'<(style|script)[^>]*>.*?</\1>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    html = re.sub(r'<[^>]+>', ' ', html)
+    return _collapse(unescape(html))
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first."""
+    return list(_BACKENDS)
+
+
+def get_backend(name: str = 'auto') -> Callable[[str], str]:
+    """Extractor by name; 'auto' is the fastest installed one."""
+    if name == 'auto':
+        name = next(iter(_BACKENDS))
+    if name not in _BACKENDS:
+        raise ValueError(f"HTML backend '{name}' not available (have: {', '.join(_BACKENDS)})")
+    return _BACKENDS[name]
+
+
+def html_to_text(html: str, backend: str = 'auto') -> str:
+    """Plain text of one HTML document; falls back to regex if the parser fails."""
+    if not html:
+        return ''
+    extract = get_backend(backend)
+    try:
+        return extract(html)
+    except Exception:
+        return _regex_text(html)
+
+
+def _convert(job):
+    html, backend = job
+    return html_to_text(html, backend)
+
+
+def html_to_texts(
+    htmls: List[str], backend: str = 'auto', workers: Optional[int] = None
+) -> List[str]:
+    """Plain text of several documents (e.g. spine items), in order.
+
+    Uses a process pool when there are several documents and more than
+    PARALLEL_MIN_CHARS of markup in total.
+    """
+    get_backend(backend)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(htmls) < 2 or sum(len(h) for h in htmls) < PARALLEL_MIN_CHARS:
+        return [html_to_text(h, backend) for h in htmls]
+    jobs = [(h, backend) for h in htmls]
+    with ProcessPoolExecutor(max_workers=min(workers, len(htmls))) as pool:
+        return list(pool.map(_convert, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
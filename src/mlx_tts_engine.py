@@ -3,23 +3,33 @@ TTS engines: MLX (local, Apple Silicon) and OpenAI API (cloud).
 """
 
 import base64
-import io
+import hashlib
 import json
 import logging
 import os
+import queue
 import re
 import shutil
 import tempfile
+import threading
+import time
 import xml.etree.ElementTree as ET
 import zipfile
+import zlib
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from html import unescape
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
-import soundfile as sf
+
+from audio_post import ChunkPostProcessor
+from audio_sink import AudioSink, to_int16
+from html_text import html_to_texts
+import pdf_text
+from text_normalizer import get_normalizer
+from voice_prompt_cache import hash_file
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +46,12 @@ MLX_MODEL_IDS = {
     "voice_clone":  "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16",
     "voice_design": "mlx-community/Qwen3-TTS-12Hz-1.7B-VoiceDesign-bf16",
 }
+# Approximate resident size of each model (GB), used for the memory budget
+MLX_MODEL_SIZES_GB = {
+    "mlx-community/Qwen3-TTS-12Hz-1.7B-CustomVoice-8bit": 2.0,
+    "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16": 3.5,
+    "mlx-community/Qwen3-TTS-12Hz-1.7B-VoiceDesign-bf16": 3.5,
+}
 
 # OpenAI API
 OPENAI_VOICES = [
@@ -48,17 +64,7 @@ OPENAI_MODELS = ["gpt-4o-mini-tts", "tts-1", "tts-1-hd"]
 # Text extraction (standalone, no PyTorch)
 # ---------------------------------------------------------------------------
 
-try:
-    from bs4 import BeautifulSoup
-    _BS4 = True
-except ImportError:
-    _BS4 = False
-
-try:
-    import PyPDF2
-    _PDF = True
-except ImportError:
-    _PDF = False
+_PDF = bool(pdf_text.available_backends())
 
 try:
     import ebooklib
@@ -68,22 +74,6 @@ except ImportError:
     _EPUB = False
 
 
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    if _BS4:
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            for t in soup(["script", "style"]):
-                t.decompose()
-            return " ".join(soup.get_text().split())
-        except Exception:
-            pass
-    html = re.sub(r"<(style|script)[^>]*>.*?</\1>", "", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<[^>]+>", " ", html)
-    return " ".join(unescape(html).split())
-
-
 def _clean_text(text: str) -> str:
     if not text:
         return ""
@@ -92,6 +82,11 @@ def _clean_text(text: str) -> str:
     return text.strip()
 
 
+def clean_extracted_text(text: str, fmt: str) -> str:
+    """The cleanup extract_text_from_file applies to a whole book of format fmt."""
+    return _clean_text(text) if fmt in ("txt", "pdf") else text
+
+
 def extract_text_from_file(file_path: Path) -> str:
     ext = file_path.suffix.lower()
 
@@ -104,22 +99,15 @@ def extract_text_from_file(file_path: Path) -> str:
         raise ValueError("Could not decode text file")
 
     if ext == ".pdf":
-        if not _PDF:
-            raise ImportError("PyPDF2 required for PDF")
-        parts = []
-        with open(file_path, "rb") as f:
-            for page in PyPDF2.PdfReader(f).pages:
-                t = page.extract_text()
-                if t and t.strip():
-                    parts.append(t)
-        return _clean_text("\n\n".join(parts))
+        # PyMuPDF when installed; long documents are split across processes
+        return _clean_text(pdf_text.extract_text(file_path))
 
     if ext == ".epub":
         if not _EPUB:
             raise ImportError("ebooklib required for EPUB")
         try:
             book = epub.read_epub(str(file_path))
-            parts = []
+            contents = []
             for item_id, _ in book.spine:
                 item = book.get_item_by_id(item_id)
                 if item and isinstance(item, ebooklib.ITEM_DOCUMENT):
@@ -127,25 +115,22 @@ def extract_text_from_file(file_path: Path) -> str:
                     if content:
                         if isinstance(content, bytes):
                             content = content.decode("utf-8", errors="ignore")
-                        clean = _clean_html(str(content))
-                        if clean.strip():
-                            parts.append(clean)
+                        contents.append(str(content))
+            parts = [clean for clean in html_to_texts(contents) if clean.strip()]
             if parts:
                 return "\n\n".join(parts)
         except Exception:
             pass
         # Zipfile fallback
-        parts = []
+        contents = []
         with zipfile.ZipFile(file_path, "r") as zf:
             for name in zf.namelist():
                 if name.lower().endswith((".html", ".xhtml", ".htm")):
                     try:
-                        clean = _clean_html(zf.read(name).decode("utf-8", errors="ignore"))
-                        if clean.strip():
-                            parts.append(clean)
+                        contents.append(zf.read(name).decode("utf-8", errors="ignore"))
                     except Exception:
                         continue
-        return "\n\n".join(parts)
+        return "\n\n".join(clean for clean in html_to_texts(contents) if clean.strip())
 
     raise ValueError(f"Unsupported format: {ext}")
 
@@ -199,47 +184,66 @@ def split_into_chunks(
     return [c for c in chunks if c.strip()]
 
 
-# ---------------------------------------------------------------------------
-# Text cleaning utilities
-# ---------------------------------------------------------------------------
-
-def fix_spaced_capitals(text: str) -> str:
-    """Convert 'A H OUSE D IVIDED' to 'A House Divided'."""
-    def fix_word(match):
-        chars = match.group(0).replace(' ', '')
-        if len(chars) >= 2:
-            return chars[0] + chars[1:].lower()
-        return chars
-    pattern = r'\b([A-Z]\s+){2,}[A-Z]+\b'
-    return re.sub(pattern, fix_word, text)
+def split_into_stable_chunks(
+    text: str, chunk_size: int = 1500, max_chars: Optional[int] = None,
+    anchor_every: int = 4,
+) -> List[str]:
+    """Split text at content-defined sentence boundaries.
+
+    Like split_into_chunks, but once a chunk reaches 3/4 of its limit it only
+    ends after an "anchor" sentence (one whose CRC32 is divisible by
+    anchor_every), or when the hard limit is hit. Boundaries then depend on
+    nearby sentences rather than on everything before them, so an edit only
+    moves the boundaries around it and later chunks keep identical text
+    (and identical content hashes) across revisions of a book.
+    """
+    if not text.strip():
+        return []
+    min_words = max(1, chunk_size * 3 // 4)
+    min_chars = max_chars * 3 // 4 if max_chars else None
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    chunks, current, words = [], "", 0
+    for s in sentences:
+        if max_chars and len(s) > max_chars:
+            if current:
+                chunks.append(current.strip())
+                current, words = "", 0
+            chunks.extend(_break_long_text(s, max_chars))
+            continue
 
+        sw = len(s.split())
+        would_exceed_words = words + sw > chunk_size
+        would_exceed_chars = max_chars and len(current) + len(s) + 1 > max_chars
+        if (would_exceed_words or would_exceed_chars) and current:
+            chunks.append(current.strip())
+            current, words = "", 0
+        current += s + " "
+        words += sw
+
+        long_enough = words >= min_words or (min_chars and len(current) >= min_chars)
+        if long_enough and zlib.crc32(s.strip().encode("utf-8")) % anchor_every == 0:
+            chunks.append(current.strip())
+            current, words = "", 0
+    if current.strip():
+        chunks.append(current.strip())
+    return [c for c in chunks if c.strip()]
 
-def remove_footnote_markers(text: str) -> str:
-    """Remove footnote symbols like *, †, ‡, §, etc."""
-    markers = r'[*\u2020\u2021\u00a7\u00b6\u2016\u00b9\u00b2\u00b3\u2074\u2075\u2076\u2077\u2078\u2079\u2070]+'
-    text = re.sub(r'\s*' + markers + r'\s*', ' ', text)
-    return re.sub(r'\s+', ' ', text)
 
+def chunk_manifest(chunks: List[str], fingerprint: str) -> List[str]:
+    """Content hash per chunk, over its text and the voice settings."""
+    return [
+        hashlib.sha256(f"{fingerprint}\0{c}".encode("utf-8")).hexdigest()[:16]
+        for c in chunks
+    ]
 
-def normalize_special_chars(text: str) -> str:
-    """Normalize special characters for better TTS output."""
-    text = text.replace('\u2014', ' - ')
-    text = text.replace('\u2013', ' - ')
-    text = text.replace('\u201c', '"').replace('\u201d', '"')
-    text = text.replace('\u2018', "'").replace('\u2019', "'")
-    text = text.replace('\u2026', '...')
-    return text
 
+# ---------------------------------------------------------------------------
+# Text cleaning utilities
+# ---------------------------------------------------------------------------
 
 def apply_text_cleaning(text: str, fix_capitals: bool = True, remove_footnotes: bool = True, normalize_chars: bool = True) -> str:
-    """Apply all text cleaning steps based on toggles."""
-    if fix_capitals:
-        text = fix_spaced_capitals(text)
-    if remove_footnotes:
-        text = remove_footnote_markers(text)
-    if normalize_chars:
-        text = normalize_special_chars(text)
-    return re.sub(r'\s+', ' ', text).strip()
+    """Apply all text cleaning steps based on toggles (one fused pass, see text_normalizer)."""
+    return get_normalizer(fix_capitals, remove_footnotes, normalize_chars).clean(text)
 
 
 # ---------------------------------------------------------------------------
@@ -301,6 +305,7 @@ class BookMetadata:
         self.title: str = "Unknown"
         self.author: str = "Unknown"
         self.chapters: List[dict] = []  # [{"id": str, "title": str, "word_count": int}]
+        self.chapter_texts: Dict[str, str] = {}  # chapter id -> extracted text
         self.total_words: int = 0
         self.cover_image: Optional[str] = None  # base64 data URI or None
         self.format: str = ""
@@ -413,20 +418,21 @@ def extract_book_metadata(file_path: Path) -> BookMetadata:
                         break
 
                 # Build chapter list with word counts
-                total_words = 0
+                contents = []
                 for item_id in spine:
-                    item = manifest[item_id]
-                    href = item['href']
+                    href = manifest[item_id]['href']
                     file_p = f"{opf_dir}/{href}" if opf_dir else href
-                    title = ncx_titles.get(href, item_id)
                     try:
-                        content = z.read(file_p).decode('utf-8', errors='ignore')
-                        clean = _clean_html(content)
-                        wc = len(clean.split()) if clean.strip() else 0
+                        contents.append(z.read(file_p).decode('utf-8', errors='ignore'))
                     except Exception:
-                        wc = 0
+                        contents.append("")
+                total_words = 0
+                for item_id, clean in zip(spine, html_to_texts(contents)):
+                    title = ncx_titles.get(manifest[item_id]['href'], item_id)
+                    wc = len(clean.split())
                     if wc > 0:
                         meta.chapters.append({"id": item_id, "title": title, "word_count": wc})
+                        meta.chapter_texts[item_id] = clean
                         total_words += wc
                 meta.total_words = total_words
         except Exception as e:
@@ -434,20 +440,17 @@ def extract_book_metadata(file_path: Path) -> BookMetadata:
 
     elif ext == ".pdf" and _PDF:
         try:
-            with open(file_path, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                info = reader.metadata
-                if info:
-                    meta.title = info.get('/Title', 'Unknown') or 'Unknown'
-                    meta.author = info.get('/Author', 'Unknown') or 'Unknown'
-                total_words = 0
-                for i, page in enumerate(reader.pages):
-                    t = page.extract_text()
-                    wc = len(t.split()) if t else 0
-                    if wc > 0:
-                        meta.chapters.append({"id": f"page_{i+1}", "title": f"Page {i+1}", "word_count": wc})
-                        total_words += wc
-                meta.total_words = total_words
+            info = pdf_text.get_backend().metadata(str(file_path))
+            meta.title = info['title'] or 'Unknown'
+            meta.author = info['author'] or 'Unknown'
+            total_words = 0
+            for i, t in enumerate(pdf_text.extract_pages(file_path)):
+                wc = len(t.split())
+                if wc > 0:
+                    meta.chapters.append({"id": f"page_{i+1}", "title": f"Page {i+1}", "word_count": wc})
+                    meta.chapter_texts[f"page_{i+1}"] = t
+                    total_words += wc
+            meta.total_words = total_words
         except Exception as e:
             logger.warning(f"Failed to parse PDF metadata: {e}")
 
@@ -458,6 +461,7 @@ def extract_book_metadata(file_path: Path) -> BookMetadata:
             wc = len(text.split())
             meta.total_words = wc
             meta.chapters.append({"id": "full_text", "title": "Full Text", "word_count": wc})
+            meta.chapter_texts["full_text"] = text
         except Exception:
             pass
 
@@ -479,6 +483,10 @@ class ConversionProgress:
     started_at: str = ""
     updated_at: str = ""
     completed: bool = False
+    stage_utilization: Dict[str, float] = field(default_factory=dict)
+    # Content hash per chunk; audio is stored as chunk_<hash>.npy
+    chunk_hashes: List[str] = field(default_factory=list)
+    reused_chunks: int = 0
 
     def save(self, path: Path):
         self.updated_at = datetime.now().isoformat()
@@ -498,6 +506,224 @@ class ConversionProgress:
         return self.completed_chunks / self.total_chunks
 
 
+def _start_chunk_run(
+    fp: Path, out: Path, chunks: List[str], fingerprint: str,
+) -> Tuple[Path, Path, ConversionProgress]:
+    """Set up the chunk directory and a fresh progress file for this manifest.
+
+    Chunk audio is keyed by content hash, so anything already rendered for an
+    unchanged chunk (by an interrupted run or a previous revision of the
+    book) is reused and only new or edited chunks are synthesized.
+    """
+    chunks_dir = out.parent / f".{out.stem}_chunks"
+    chunks_dir.mkdir(parents=True, exist_ok=True)
+    progress_file = out.parent / f".{out.stem}.progress.json"
+
+    hashes = chunk_manifest(chunks, fingerprint)
+    unique = set(hashes)
+    reused = sum(1 for h in unique if (chunks_dir / f"chunk_{h}.npy").exists())
+    progress = ConversionProgress(
+        file_path=str(fp), output_path=str(out),
+        total_chunks=len(chunks), started_at=datetime.now().isoformat(),
+        chunk_hashes=hashes, reused_chunks=reused,
+    )
+    progress.save(progress_file)
+    logger.info(
+        f"Manifest: {len(chunks)} chunks, {reused} reused, {len(unique) - reused} to render"
+    )
+    return chunks_dir, progress_file, progress
+
+
+def _write_chunks(
+    out: Path, pipeline: "ChunkPipeline", total: int, sample_rate: int, dtype: str = "float32",
+    postprocess: bool = False,
+):
+    """Stream saved chunks into the output file one at a time, in order.
+
+    With ``postprocess``, each chunk is trimmed, peak-normalized and
+    crossfaded into the previous one on the way (see ``audio_post``).
+    """
+    sink = AudioSink(out, sample_rate, dtype=dtype)
+    if postprocess:
+        sink = ChunkPostProcessor(sink)
+    with sink:
+        for i in range(total):
+            chunk_file = pipeline.chunk_file(i)
+            if chunk_file.exists():
+                sink.write(np.load(str(chunk_file), mmap_mode="r"))
+    if not sink.frames:
+        out.unlink(missing_ok=True)
+        raise RuntimeError("All chunks failed")
+
+
+def _prune_chunk_files(chunks_dir: Path, hashes: List[str]):
+    """Delete chunk audio that is no longer part of the manifest."""
+    keep = {f"chunk_{h}.npy" for h in hashes}
+    for f in chunks_dir.glob("chunk_*.npy"):
+        if f.name not in keep:
+            f.unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Pipelined chunk synthesis
+# ---------------------------------------------------------------------------
+
+class ChunkPipeline:
+    """Three-stage chunk synthesis: prepare -> synthesize -> persist.
+
+    Preparation (skipping chunks already on disk) and persistence
+    (``np.save`` plus the progress checkpoint) run on their own threads
+    behind bounded queues, so the synthesizer never waits on disk or JSON
+    serialization. Synthesis stays on the calling thread, which owns the
+    model.
+    """
+
+    STAGES = ("prepare", "synthesize", "persist")
+
+    def __init__(
+        self, chunks_dir: Path, progress: ConversionProgress,
+        progress_file: Path, queue_size: int = 4,
+    ):
+        self.chunks_dir = chunks_dir
+        self.progress = progress
+        self.progress_file = progress_file
+        self.queue_size = queue_size
+        self.utilization: Dict[str, float] = {}
+        self._busy = {name: 0.0 for name in self.STAGES}
+
+    def chunk_file(self, i: int) -> Path:
+        if self.progress.chunk_hashes:
+            return self.chunks_dir / f"chunk_{self.progress.chunk_hashes[i]}.npy"
+        return self.chunks_dir / f"chunk_{i:05d}.npy"
+
+    def run(
+        self,
+        chunks: List[str],
+        synthesize: Callable[[List[str]], List[Tuple[np.ndarray, int]]],
+        progress_callback=None,
+    ) -> Dict[str, float]:
+        """Synthesize every missing chunk; return per-stage utilization.
+
+        ``synthesize`` maps a list of texts to ``(audio, sample_rate)`` pairs
+        in the same order. Chunks that fail are recorded in
+        ``progress.failed_chunks`` and skipped, as before.
+        """
+        total = len(chunks)
+        work_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        persist_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def _put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    work_q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def prepare():
+            t0 = time.perf_counter()
+            cached, pending, seen = [], [], set()
+            for i in range(total):
+                path = self.chunk_file(i)
+                # Repeated chunks share one file; render it only once
+                if path.exists() or path in seen:
+                    cached.append(i)
+                else:
+                    pending.append(i)
+                    seen.add(path)
+            items = [([i], True) for i in cached] + [([i], False) for i in pending]
+            self._busy["prepare"] += time.perf_counter() - t0
+            for item in items:
+                if not _put(item):
+                    return
+            _put(None)
+
+        def persist():
+            while True:
+                item = persist_q.get()
+                if item is None:
+                    break
+                i, audio = item
+                t0 = time.perf_counter()
+                try:
+                    if audio is None:
+                        self.progress.failed_chunks.append(i)
+                    else:
+                        np.save(str(self.chunk_file(i)), audio)
+                        self.progress.completed_chunks += 1
+                        if i in self.progress.failed_chunks:
+                            self.progress.failed_chunks.remove(i)
+                    self.progress.save(self.progress_file)
+                except Exception as e:
+                    logger.error(f"Failed to persist chunk {i + 1}/{total}: {e}")
+                self._busy["persist"] += time.perf_counter() - t0
+
+        self.progress.completed_chunks = sum(
+            1 for i in range(total) if self.chunk_file(i).exists()
+        )
+        preparer = threading.Thread(target=prepare, name="chunk-prepare", daemon=True)
+        persister = threading.Thread(target=persist, name="chunk-persist", daemon=True)
+        wall_start = time.perf_counter()
+        preparer.start()
+        persister.start()
+
+        done = 0
+        try:
+            while True:
+                item = work_q.get()
+                if item is None:
+                    break
+                indices, cached = item
+                if cached:
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done / total, f"Chunk {indices[0] + 1}/{total} (cached)")
+                    continue
+                if progress_callback:
+                    progress_callback(done / total, f"Chunk {indices[0] + 1}/{total}")
+                t0 = time.perf_counter()
+                results = self._synthesize(indices, chunks, synthesize, total)
+                self._busy["synthesize"] += time.perf_counter() - t0
+                for i, result in zip(indices, results):
+                    persist_q.put((i, result[0] if result is not None else None))
+                done += len(indices)
+        finally:
+            stop.set()
+            persist_q.put(None)
+            persister.join()
+            preparer.join()
+
+        wall = max(time.perf_counter() - wall_start, 1e-9)
+        self.utilization = {
+            name: round(min(busy / wall, 1.0), 3) for name, busy in self._busy.items()
+        }
+        self.progress.stage_utilization = self.utilization
+        # Recount so repeated chunks sharing one file are included
+        self.progress.completed_chunks = sum(
+            1 for i in range(total) if self.chunk_file(i).exists()
+        )
+        self.progress.save(self.progress_file)
+        logger.info(
+            "Pipeline utilization over %.1fs: %s", wall,
+            ", ".join(f"{k} {v:.0%}" for k, v in self.utilization.items()),
+        )
+        return self.utilization
+
+    @staticmethod
+    def _synthesize(indices, chunks, synthesize, total) -> list:
+        """Run one work item; a failed chunk yields None."""
+        results = []
+        for i in indices:
+            try:
+                results.extend(synthesize([chunks[i]]))
+            except Exception as e:
+                logger.error(f"Chunk {i + 1}/{total} failed: {e}")
+                results.append(None)
+        return results
+
+
 # ---------------------------------------------------------------------------
 # Output format constants
 # ---------------------------------------------------------------------------
@@ -514,28 +740,104 @@ OUTPUT_FORMATS = {
 # ---------------------------------------------------------------------------
 
 class MLXTTSEngine:
-    def __init__(self):
-        self.model = None
+    """Local Qwen3-TTS engine with a pool of resident models.
+
+    With no ``memory_budget_gb`` only one model is kept loaded (switching
+    voice mode unloads the previous one). With a budget, models stay
+    resident until loading another would exceed it, at which point the
+    least recently used ones are evicted. ``idle_ttl`` (seconds) lets
+    ``unload_idle()`` drop models nobody has used for a while.
+
+    ``sample_dtype="int16"`` stores audiobook chunks as dithered 16-bit
+    audio, halving checkpoint disk and the memory of the final pass.
+    """
+
+    def __init__(
+        self, memory_budget_gb: Optional[float] = None, idle_ttl: Optional[float] = None,
+        sample_dtype: str = "float32",
+    ):
+        # model_id -> model, least recently used first
+        self._pool: "OrderedDict[str, object]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
         self._current_id: Optional[str] = None
+        self.memory_budget_gb = memory_budget_gb
+        self.idle_ttl = idle_ttl
+        self.sample_dtype = np.dtype(sample_dtype)
+
+    @property
+    def model(self):
+        return self._pool.get(self._current_id) if self._current_id else None
 
     def load_model(self, voice_mode: str) -> str:
         model_id = MLX_MODEL_IDS[voice_mode]
-        if self._current_id == model_id and self.model is not None:
-            return model_id
-        self.unload_model()
-        logger.info(f"Loading {model_id}...")
-        from mlx_audio.tts.utils import load_model
-        self.model = load_model(model_id)
+        self.unload_idle()
+        if model_id in self._pool:
+            self._pool.move_to_end(model_id)
+        else:
+            self._make_room(model_id)
+            logger.info(f"Loading {model_id}...")
+            from mlx_audio.tts.utils import load_model
+            self._pool[model_id] = load_model(model_id)
         self._current_id = model_id
+        self._touch()
         return model_id
 
-    def unload_model(self):
-        if self.model is not None:
-            import mlx.core as mx
-            del self.model
-            self.model = None
+    def _touch(self):
+        if self._current_id:
+            self._last_used[self._current_id] = time.monotonic()
+
+    def _make_room(self, model_id: str):
+        """Evict least recently used models until model_id fits the budget."""
+        if self.memory_budget_gb is None:
+            self.unload_model()
+            return
+        needed = MLX_MODEL_SIZES_GB.get(model_id, 4.0)
+        while self._pool and self.resident_gb + needed > self.memory_budget_gb:
+            self._evict(next(iter(self._pool)))
+
+    def _evict(self, model_id: str):
+        import mlx.core as mx
+        logger.info(f"Unloading {model_id}")
+        del self._pool[model_id]
+        self._last_used.pop(model_id, None)
+        if self._current_id == model_id:
             self._current_id = None
-            mx.metal.clear_cache()
+        mx.metal.clear_cache()
+
+    def unload_model(self):
+        """Unload every resident model."""
+        for model_id in list(self._pool):
+            self._evict(model_id)
+
+    def unload_idle(self) -> List[str]:
+        """Unload models idle for longer than idle_ttl; return their ids."""
+        if not self.idle_ttl:
+            return []
+        now = time.monotonic()
+        idle = [
+            model_id for model_id in self._pool
+            if now - self._last_used.get(model_id, now) > self.idle_ttl
+        ]
+        for model_id in idle:
+            self._evict(model_id)
+        return idle
+
+    @property
+    def resident_gb(self) -> float:
+        return sum(MLX_MODEL_SIZES_GB.get(m, 4.0) for m in self._pool)
+
+    def resident_models(self) -> List[dict]:
+        """Residency report, least recently used first."""
+        now = time.monotonic()
+        return [
+            {
+                "model_id": model_id,
+                "size_gb": MLX_MODEL_SIZES_GB.get(model_id, 4.0),
+                "idle_seconds": round(now - self._last_used.get(model_id, now), 1),
+                "active": model_id == self._current_id,
+            }
+            for model_id in self._pool
+        ]
 
     @property
     def is_loaded(self) -> bool:
@@ -545,6 +847,31 @@ class MLXTTSEngine:
     def current_model_id(self) -> Optional[str]:
         return self._current_id
 
+    @staticmethod
+    def _generation_call(
+        voice_mode: str, speaker: str, language: str,
+        instruct: Optional[str], ref_audio: Optional[str],
+        ref_text: Optional[str], voice_description: Optional[str],
+    ) -> Tuple[str, dict]:
+        """Return the model method name and keyword args for a voice mode."""
+        if voice_mode == "custom_voice":
+            return "generate_custom_voice", dict(
+                speaker=speaker, language=language, instruct=instruct or "",
+            )
+        if voice_mode == "voice_clone":
+            if not ref_audio:
+                raise ValueError("Voice clone requires reference audio")
+            return "generate", dict(
+                ref_audio=ref_audio, ref_text=ref_text or "", lang_code=language,
+            )
+        if voice_mode == "voice_design":
+            if not voice_description:
+                raise ValueError("Voice design requires a description")
+            return "generate_voice_design", dict(
+                instruct=voice_description, language=language,
+            )
+        raise ValueError(f"Unknown voice mode: {voice_mode}")
+
     def generate_speech(
         self,
         text: str,
@@ -563,26 +890,11 @@ class MLXTTSEngine:
         if progress_callback:
             progress_callback(0.15, "Model ready, generating...")
 
-        if voice_mode == "custom_voice":
-            gen = self.model.generate_custom_voice(
-                text=text, speaker=speaker, language=language,
-                instruct=instruct or "",
-            )
-        elif voice_mode == "voice_clone":
-            if not ref_audio:
-                raise ValueError("Voice clone requires reference audio")
-            gen = self.model.generate(
-                text=text, ref_audio=ref_audio,
-                ref_text=ref_text or "", lang_code=language,
-            )
-        elif voice_mode == "voice_design":
-            if not voice_description:
-                raise ValueError("Voice design requires a description")
-            gen = self.model.generate_voice_design(
-                text=text, instruct=voice_description, language=language,
-            )
-        else:
-            raise ValueError(f"Unknown voice mode: {voice_mode}")
+        method, kwargs = self._generation_call(
+            voice_mode, speaker, language, instruct,
+            ref_audio, ref_text, voice_description,
+        )
+        gen = getattr(self.model, method)(text=text, **kwargs)
 
         # Iterate generator manually to report progress per segment
         results = []
@@ -602,10 +914,75 @@ class MLXTTSEngine:
 
         import mlx.core as mx
         audio = mx.concatenate([r.audio for r in results], axis=0)
+        self._touch()
         if progress_callback:
             progress_callback(0.97, "Finalizing...")
         return np.array(audio), SAMPLE_RATE
 
+    def iter_speech(
+        self,
+        text: str,
+        voice_mode: str = "custom_voice",
+        speaker: str = "Ryan",
+        language: str = "english",
+        instruct: Optional[str] = None,
+        ref_audio: Optional[str] = None,
+        ref_text: Optional[str] = None,
+        voice_description: Optional[str] = None,
+    ) -> Iterator[np.ndarray]:
+        """Yield float32 PCM frames at SAMPLE_RATE as each segment finishes."""
+        self.load_model(voice_mode)
+        method, kwargs = self._generation_call(
+            voice_mode, speaker, language, instruct,
+            ref_audio, ref_text, voice_description,
+        )
+        produced = False
+        for result in getattr(self.model, method)(text=text, **kwargs):
+            produced = True
+            yield np.asarray(result.audio, dtype=np.float32)
+        self._touch()
+        if not produced:
+            raise RuntimeError("No audio generated")
+
+    def generate_speech_many(
+        self,
+        texts: List[str],
+        voice_mode: str = "custom_voice",
+        speaker: str = "Ryan",
+        language: str = "english",
+        instruct: Optional[str] = None,
+        ref_audio: Optional[str] = None,
+        ref_text: Optional[str] = None,
+        voice_description: Optional[str] = None,
+    ) -> List[Tuple[np.ndarray, int]]:
+        """Generate several texts one after another, results in input order.
+
+        Saves callers the per-call setup (model load, voice arguments).
+        """
+        if not texts:
+            return []
+        self.load_model(voice_mode)
+        method, kwargs = self._generation_call(
+            voice_mode, speaker, language, instruct,
+            ref_audio, ref_text, voice_description,
+        )
+
+        import mlx.core as mx
+        outputs = []
+        for text in texts:
+            segments = [r.audio for r in getattr(self.model, method)(text=text, **kwargs)]
+            if not segments:
+                raise RuntimeError("No audio generated")
+            outputs.append((np.array(mx.concatenate(segments, axis=0)), SAMPLE_RATE))
+        self._touch()
+        return outputs
+
+    def _to_sample_dtype(self, audio: np.ndarray) -> np.ndarray:
+        """Model output is float; quantize (and dither) it once for int16 runs."""
+        if self.sample_dtype == np.int16:
+            return to_int16(audio)
+        return audio
+
     def generate_audiobook(
         self, file_path: str, voice_mode: str = "custom_voice",
         output_path: str = "audiobooks/output.wav",
@@ -614,6 +991,8 @@ class MLXTTSEngine:
         ref_audio: Optional[str] = None, ref_text: Optional[str] = None,
         voice_description: Optional[str] = None,
         progress_callback=None,
+        keep_chunks: bool = True,
+        postprocess: bool = False,
     ) -> str:
         fp = Path(file_path)
         out = Path(output_path)
@@ -622,73 +1001,44 @@ class MLXTTSEngine:
         text = extract_text_from_file(fp)
         if not text.strip():
             raise ValueError("No text extracted")
-        chunks = split_into_chunks(text)
+        chunks = split_into_stable_chunks(text)
         total = len(chunks)
         if total == 0:
             raise ValueError("No chunks created")
 
-        # Resume / checkpoint setup
-        chunks_dir = out.parent / f".{out.stem}_chunks"
-        chunks_dir.mkdir(parents=True, exist_ok=True)
-        progress_file = out.parent / f".{out.stem}.progress.json"
-
-        if progress_file.exists():
-            try:
-                progress = ConversionProgress.load(progress_file)
-                if progress.completed or progress.total_chunks != total:
-                    progress = ConversionProgress(
-                        file_path=str(fp), output_path=str(out),
-                        total_chunks=total, started_at=datetime.now().isoformat(),
-                    )
-            except Exception:
-                progress = ConversionProgress(
-                    file_path=str(fp), output_path=str(out),
-                    total_chunks=total, started_at=datetime.now().isoformat(),
-                )
-        else:
-            progress = ConversionProgress(
-                file_path=str(fp), output_path=str(out),
-                total_chunks=total, started_at=datetime.now().isoformat(),
-            )
-        progress.save(progress_file)
+        # Resume / checkpoint setup (per-chunk content-hash manifest). The
+        # reference clip counts by content, so replacing it re-renders
+        fingerprint = json.dumps([
+            MLX_MODEL_IDS[voice_mode], voice_mode, speaker, language, instruct,
+            hash_file(ref_audio) if ref_audio else None, ref_text, voice_description,
+            self.sample_dtype.name,
+        ])
+        chunks_dir, progress_file, progress = _start_chunk_run(fp, out, chunks, fingerprint)
 
         self.load_model(voice_mode)
 
-        for i, chunk in enumerate(chunks):
-            chunk_file = chunks_dir / f"chunk_{i:05d}.npy"
-            if chunk_file.exists():
-                if progress_callback:
-                    progress_callback((i + 1) / total, f"Chunk {i + 1}/{total} (cached)")
-                continue
-            if progress_callback:
-                progress_callback(i / total, f"Chunk {i + 1}/{total}")
-            try:
-                audio, _ = self.generate_speech(
-                    text=chunk, voice_mode=voice_mode, speaker=speaker,
+        pipeline = ChunkPipeline(chunks_dir, progress, progress_file)
+        pipeline.run(
+            chunks,
+            synthesize=lambda texts: [
+                (self._to_sample_dtype(audio), sr)
+                for audio, sr in self.generate_speech_many(
+                    texts, voice_mode=voice_mode, speaker=speaker,
                     language=language, instruct=instruct, ref_audio=ref_audio,
                     ref_text=ref_text, voice_description=voice_description,
                 )
-                np.save(str(chunk_file), audio)
-                progress.completed_chunks = i + 1
-                progress.save(progress_file)
-            except Exception as e:
-                logger.error(f"Chunk {i + 1}/{total} failed: {e}")
-                continue
+            ],
+            progress_callback=progress_callback,
+        )
 
-        # Concatenate all saved chunks
-        parts: List[np.ndarray] = []
-        for i in range(total):
-            chunk_file = chunks_dir / f"chunk_{i:05d}.npy"
-            if chunk_file.exists():
-                parts.append(np.load(str(chunk_file)))
-
-        if not parts:
-            raise RuntimeError("All chunks failed")
-
-        sf.write(str(out), np.concatenate(parts), SAMPLE_RATE)
+        _write_chunks(out, pipeline, total, SAMPLE_RATE, self.sample_dtype.name, postprocess)
         progress.completed = True
         progress.save(progress_file)
-        shutil.rmtree(str(chunks_dir))
+        if keep_chunks:
+            # Keep chunk audio so a revised book only re-renders edited chunks
+            _prune_chunk_files(chunks_dir, progress.chunk_hashes)
+        else:
+            shutil.rmtree(str(chunks_dir))
         if progress_callback:
             progress_callback(1.0, "Done!")
         return str(out)
@@ -703,9 +1053,15 @@ def _get_openai_api_key() -> Optional[str]:
     return os.environ.get("OPENAI_API_KEY")
 
 
+# response_format="pcm" is headerless 16-bit little-endian mono at 24 kHz
+OPENAI_PCM_SAMPLE_RATE = 24000
+
+
 class OpenAITTSEngine:
-    def __init__(self):
+    def __init__(self, sample_dtype: str = "float32"):
+        """``sample_dtype="int16"`` keeps the API's PCM as-is, with no conversion."""
         self._client = None
+        self.sample_dtype = np.dtype(sample_dtype)
 
     def _ensure_client(self):
         if self._client is None:
@@ -724,13 +1080,25 @@ class OpenAITTSEngine:
     def _call_api(
         self, text: str, voice: str, model: str, instructions: Optional[str],
     ) -> Tuple[np.ndarray, int]:
-        """Single API call for text that fits within the token limit."""
-        kwargs = dict(model=model, voice=voice, input=text, response_format="wav")
+        """Single API call for text that fits within the token limit.
+
+        Raw PCM is wrapped with ``np.frombuffer`` (no copy); float32 output
+        costs one scaled copy instead of WAV parsing into float64 and back.
+        The int16 array is a read-only view of the response body; callers
+        only save, concatenate or scale it, never modify it in place.
+        """
+        kwargs = dict(model=model, voice=voice, input=text, response_format="pcm")
         if instructions and model == "gpt-4o-mini-tts":
             kwargs["instructions"] = instructions
         response = self._client.audio.speech.create(**kwargs)
-        audio_data, sr = sf.read(io.BytesIO(response.content))
-        return audio_data.astype(np.float32), sr
+        content = response.content
+        if len(content) & 1:
+            # A truncated response can end mid-sample; drop the odd byte
+            content = content[:len(content) & ~1]
+        pcm = np.frombuffer(content, dtype="<i2")
+        if self.sample_dtype == np.int16:
+            return pcm, OPENAI_PCM_SAMPLE_RATE
+        return np.multiply(pcm, 1.0 / 32768, dtype=np.float32), OPENAI_PCM_SAMPLE_RATE
 
     def generate_speech(
         self,
@@ -758,18 +1126,15 @@ class OpenAITTSEngine:
         if progress_callback:
             progress_callback(0.10, f"Split into {total} chunks...")
         parts: List[np.ndarray] = []
-        target_sr = None
         for i, chunk in enumerate(chunks):
             if progress_callback:
                 progress_callback(0.10 + 0.80 * (i / total), f"Chunk {i + 1}/{total}...")
-            audio, sr = self._call_api(chunk, voice, model, instructions)
+            audio, _ = self._call_api(chunk, voice, model, instructions)
             parts.append(audio)
-            if target_sr is None:
-                target_sr = sr
 
         if progress_callback:
             progress_callback(0.95, "Stitching audio...")
-        return np.concatenate(parts), target_sr or 24000
+        return np.concatenate(parts), OPENAI_PCM_SAMPLE_RATE
 
     def generate_audiobook(
         self,
@@ -779,6 +1144,8 @@ class OpenAITTSEngine:
         model: str = "gpt-4o-mini-tts",
         instructions: Optional[str] = None,
         progress_callback=None,
+        keep_chunks: bool = True,
+        postprocess: bool = False,
     ) -> str:
         fp = Path(file_path)
         out = Path(output_path)
@@ -789,78 +1156,37 @@ class OpenAITTSEngine:
             raise ValueError("No text extracted")
 
         # OpenAI TTS API has a 2000-token input limit (~4 chars/token)
-        chunks = split_into_chunks(text, chunk_size=300, max_chars=4000)
+        chunks = split_into_stable_chunks(text, chunk_size=300, max_chars=4000)
         total = len(chunks)
         if total == 0:
             raise ValueError("No chunks created")
 
-        # Resume / checkpoint setup
-        chunks_dir = out.parent / f".{out.stem}_chunks"
-        chunks_dir.mkdir(parents=True, exist_ok=True)
-        progress_file = out.parent / f".{out.stem}.progress.json"
-
-        if progress_file.exists():
-            try:
-                progress = ConversionProgress.load(progress_file)
-                if progress.completed or progress.total_chunks != total:
-                    progress = ConversionProgress(
-                        file_path=str(fp), output_path=str(out),
-                        total_chunks=total, started_at=datetime.now().isoformat(),
-                    )
-            except Exception:
-                progress = ConversionProgress(
-                    file_path=str(fp), output_path=str(out),
-                    total_chunks=total, started_at=datetime.now().isoformat(),
-                )
-        else:
-            progress = ConversionProgress(
-                file_path=str(fp), output_path=str(out),
-                total_chunks=total, started_at=datetime.now().isoformat(),
-            )
-        progress.save(progress_file)
-
-        target_sr = None
+        # Resume / checkpoint setup (per-chunk content-hash manifest)
+        fingerprint = json.dumps(["openai", model, voice, instructions, self.sample_dtype.name])
+        chunks_dir, progress_file, progress = _start_chunk_run(fp, out, chunks, fingerprint)
 
-        for i, chunk in enumerate(chunks):
-            chunk_file = chunks_dir / f"chunk_{i:05d}.npy"
-            if chunk_file.exists():
-                if target_sr is None:
-                    # Recover sample rate from the first available chunk
-                    _cached = np.load(str(chunk_file))
-                    # We can't recover sr from npy; will get it from next generate call or default
-                if progress_callback:
-                    progress_callback((i + 1) / total, f"Chunk {i + 1}/{total} (cached)")
-                continue
-            if progress_callback:
-                progress_callback(i / total, f"Chunk {i + 1}/{total}")
-            try:
-                audio, sr = self.generate_speech(
-                    text=chunk, voice=voice, model=model,
-                    instructions=instructions,
+        pipeline = ChunkPipeline(chunks_dir, progress, progress_file)
+        pipeline.run(
+            chunks,
+            synthesize=lambda texts: [
+                self.generate_speech(
+                    text=t, voice=voice, model=model, instructions=instructions,
                 )
-                np.save(str(chunk_file), audio)
-                if target_sr is None:
-                    target_sr = sr
-                progress.completed_chunks = i + 1
-                progress.save(progress_file)
-            except Exception as e:
-                logger.error(f"Chunk {i + 1}/{total} failed: {e}")
-                continue
-
-        # Concatenate all saved chunks
-        parts: List[np.ndarray] = []
-        for i in range(total):
-            chunk_file = chunks_dir / f"chunk_{i:05d}.npy"
-            if chunk_file.exists():
-                parts.append(np.load(str(chunk_file)))
-
-        if not parts:
-            raise RuntimeError("All chunks failed")
-
-        sf.write(str(out), np.concatenate(parts), target_sr or 24000)
+                for t in texts
+            ],
+            progress_callback=progress_callback,
+        )
+        # Known up front, so runs where every chunk was cached get it right too
+        _write_chunks(
+            out, pipeline, total, OPENAI_PCM_SAMPLE_RATE, self.sample_dtype.name, postprocess,
+        )
         progress.completed = True
         progress.save(progress_file)
-        shutil.rmtree(str(chunks_dir))
+        if keep_chunks:
+            # Keep chunk audio so a revised book only re-renders edited chunks
+            _prune_chunk_files(chunks_dir, progress.chunk_hashes)
+        else:
+            shutil.rmtree(str(chunks_dir))
         if progress_callback:
             progress_callback(1.0, "Done!")
         return str(out)
@@ -0,0 +1,81 @@
+"""
+Parallel per-chapter AAC encoding for M4B output.
+
+A single ffmpeg process encodes AAC on roughly one core, which takes tens of
+minutes for a long book. Chapters are independent, so each one is encoded to
+its own ``.m4a`` concurrently (every worker is a separate ffmpeg process),
+and the pieces are then joined with the concat demuxer and ``-c copy``,
+which only remuxes. Chapter boundaries are the split points. Each piece
+carries its own encoder priming and padding, so it is a little longer than
+the chapter's PCM; chapter markers must be placed with ``encoded_duration``
+of each piece or they drift further off with every chapter. The same
+durations go into the concat list, so the demuxer lays the pieces out
+exactly where the markers say.
+"""
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+# ffmpeg's native AAC encoder: 1024-sample frames, one frame of priming
+AAC_FRAME = 1024
+AAC_PRIMING = 1024
+
+
+def gain_args(gain_db: float) -> List[str]:
+    """ffmpeg audio filter arguments for a fixed gain (none for 0 dB)."""
+    return ["-af", f"volume={gain_db:.2f}dB"] if gain_db else []
+
+
+def encode_segment(src: str, dest: Path, bitrate: str, gain_db: float = 0.0) -> Path:
+    """Encode one audio file to AAC in an .m4a container."""
+    result = subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", str(src), "-vn"]
+        + gain_args(gain_db) + ["-c:a", "aac", "-b:a", bitrate, str(dest)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed on {Path(src).name}: {result.stderr.strip()}")
+    return dest
+
+
+def encode_segments(
+    paths: List[str], out_dir: Path, bitrate: str, workers: int, gain_db: float = 0.0,
+) -> List[Path]:
+    """Encode every file concurrently; return the .m4a paths in input order."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    dests = [out_dir / f"segment_{i:04d}.m4a" for i in range(len(paths))]
+    # Threads only wait on the ffmpeg processes, which do the actual work
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(lambda args: encode_segment(*args, bitrate, gain_db), zip(paths, dests)))
+
+
+def encoded_duration(frames: int, sample_rate: int) -> float:
+    """Length of a frames-long file once encoded to AAC, priming and padding included.
+
+    The encoder prepends AAC_PRIMING samples and fills the last frame, so
+    the piece spans whole AAC frames; that is the time it takes up when
+    joined with ``-c copy``.
+    """
+    packets = -(-(frames + AAC_PRIMING) // AAC_FRAME)
+    return packets * AAC_FRAME / sample_rate
+
+
+def write_concat_list(
+    paths: List[Path], list_path: Path, durations: Optional[List[float]] = None,
+) -> Path:
+    """Write a concat demuxer file list, with each file's duration if given."""
+    with open(list_path, 'w', encoding='utf-8') as f:
+        for i, path in enumerate(paths):
+            safe_path = str(Path(path).resolve()).replace("'", "'\\''")
+            f.write(f"file '{safe_path}'\n")
+            if durations is not None:
+                f.write(f"duration {durations[i]:.6f}\n")
+    return list_path
+
+
+def concat_copy_cmd(list_path: Path) -> List[str]:
+    """ffmpeg input arguments that read the encoded segments as one stream."""
+    return ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(list_path)]
@@ -0,0 +1,174 @@
+"""
+PDF text extraction with pluggable backends and parallel page ranges.
+
+PDFs used to be read page by page with PyPDF2 (pure Python) in a single
+process. Backends implement ``PDFTextBackend``; the fastest installed one
+is used:
+
+  pymupdf - PyMuPDF (MuPDF, C)
+  pypdf2  - PyPDF2, the previous behaviour
+
+``extract_pages`` splits long documents into contiguous page ranges, lets
+worker processes open the file and extract one range each, and returns
+the page texts in order so callers can join them once.
+"""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+try:
+    import pymupdf as fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    try:
+        import fitz  # PyMuPDF before 1.24.3
+        PYMUPDF_AVAILABLE = True
+    except ImportError:
+        PYMUPDF_AVAILABLE = False
+
+try:
+    import PyPDF2
+    PYPDF2_AVAILABLE = True
+except ImportError:
+    PYPDF2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Below this many pages a single process is faster than a pool
+PARALLEL_MIN_PAGES = 64
+
+
+class PDFTextBackend(ABC):
+    """Extraction interface. Methods take a path and open the file
+    themselves, so a range can be extracted in any process."""
+
+    name = ''
+
+    @abstractmethod
+    def page_count(self, path: str) -> int:
+        """Number of pages."""
+
+    @abstractmethod
+    def metadata(self, path: str) -> Dict[str, str]:
+        """Document title and author ('' when missing)."""
+
+    @abstractmethod
+    def extract_range(self, path: str, start: int, stop: int) -> List[str]:
+        """Text of pages [start, stop); '' (and a logged warning) for a page that fails."""
+
+
+class PyMuPDFBackend(PDFTextBackend):
+    name = 'pymupdf'
+
+    def page_count(self, path: str) -> int:
+        with fitz.open(path) as doc:
+            return doc.page_count
+
+    def metadata(self, path: str) -> Dict[str, str]:
+        with fitz.open(path) as doc:
+            meta = doc.metadata or {}
+        return {'title': meta.get('title') or '', 'author': meta.get('author') or ''}
+
+    def extract_range(self, path: str, start: int, stop: int) -> List[str]:
+        texts = []
+        with fitz.open(path) as doc:
+            for i in range(start, stop):
+                try:
+                    texts.append(doc[i].get_text())
+                except Exception as e:
+                    logger.warning(f"{self.name}: page {i + 1} of {path} failed: {e}")
+                    texts.append('')
+        return texts
+
+
+class PyPDF2Backend(PDFTextBackend):
+    name = 'pypdf2'
+
+    def page_count(self, path: str) -> int:
+        with open(path, 'rb') as f:
+            return len(PyPDF2.PdfReader(f).pages)
+
+    def metadata(self, path: str) -> Dict[str, str]:
+        with open(path, 'rb') as f:
+            info = PyPDF2.PdfReader(f).metadata or {}
+        return {'title': info.get('/Title') or '', 'author': info.get('/Author') or ''}
+
+    def extract_range(self, path: str, start: int, stop: int) -> List[str]:
+        texts = []
+        with open(path, 'rb') as f:
+            pages = PyPDF2.PdfReader(f).pages
+            for i in range(start, stop):
+                try:
+                    texts.append(pages[i].extract_text() or '')
+                except Exception as e:
+                    logger.warning(f"{self.name}: page {i + 1} of {path} failed: {e}")
+                    texts.append('')
+        return texts
+
+
+_BACKENDS: Dict[str, PDFTextBackend] = {}
+if PYMUPDF_AVAILABLE:
+    _BACKENDS['pymupdf'] = PyMuPDFBackend()
+if PYPDF2_AVAILABLE:
+    _BACKENDS['pypdf2'] = PyPDF2Backend()
+
+
+def register_backend(backend: PDFTextBackend, first: bool = False):
+    """Add a backend; with first=True it becomes the 'auto' choice."""
+    global _BACKENDS
+    if first:
+        _BACKENDS = {backend.name: backend, **_BACKENDS}
+    else:
+        _BACKENDS[backend.name] = backend
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first."""
+    return list(_BACKENDS)
+
+
+def get_backend(name: str = 'auto') -> PDFTextBackend:
+    """Backend by name; 'auto' is the fastest installed one."""
+    if not _BACKENDS:
+        raise ImportError("PyMuPDF or PyPDF2 required for PDF")
+    if name == 'auto':
+        name = next(iter(_BACKENDS))
+    if name not in _BACKENDS:
+        raise ValueError(f"PDF backend '{name}' not available (have: {', '.join(_BACKENDS)})")
+    return _BACKENDS[name]
+
+
+def _extract_job(job) -> List[str]:
+    path, backend, start, stop = job
+    return backend.extract_range(path, start, stop)
+
+
+def extract_pages(path, backend: str = 'auto', workers: Optional[int] = None) -> List[str]:
+    """Text of every page, in order.
+
+    Documents of PARALLEL_MIN_PAGES or more are split into contiguous
+    page ranges extracted by worker processes.
+    """
+    path = str(path)
+    impl = get_backend(backend)
+    pages = impl.page_count(path)
+    workers = min(workers or os.cpu_count() or 1, pages)
+    if workers <= 1 or pages < PARALLEL_MIN_PAGES:
+        return impl.extract_range(path, 0, pages)
+
+    # A few ranges per worker evens out pages of uneven cost
+    n = min(workers * 4, pages)
+    bounds = [pages * i // n for i in range(n + 1)]
+    jobs = [(path, impl, bounds[i], bounds[i + 1]) for i in range(n)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [text for chunk in pool.map(_extract_job, jobs) for text in chunk]
+
+
+def extract_text(
+    path, backend: str = 'auto', workers: Optional[int] = None, separator: str = '\n\n'
+) -> str:
+    """Non-empty page texts joined once with separator."""
+    return separator.join(t for t in extract_pages(path, backend, workers) if t.strip())
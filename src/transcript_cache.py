@@ -0,0 +1,51 @@
+"""
+Reference-audio transcripts, cached on disk by audio content.
+
+Voice cloning needs the text spoken in the reference clip. Transcribing it
+means loading Whisper and running it over the clip, which is the same work
+on every run. Transcripts are stored as plain ``.txt`` files (like the ones
+``find_transcript`` picks up next to a voice sample) under
+``cache/transcripts/<sha256 of audio>.txt``, and Whisper is only imported and
+loaded when no transcript exists yet.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from voice_prompt_cache import hash_file
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("cache/transcripts")
+WHISPER_MODEL = "base"
+
+
+def cached_transcript_path(audio_path: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> Path:
+    """Location of the cached transcript for an audio file's content."""
+    return Path(cache_dir) / f"{hash_file(audio_path)}.txt"
+
+
+def load_cached_transcript(audio_path: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> Optional[str]:
+    """Return the cached transcript for this audio content, if any."""
+    path = cached_transcript_path(audio_path, cache_dir)
+    if path.exists():
+        text = path.read_text(encoding='utf-8').strip()
+        if text:
+            return text
+    return None
+
+
+def save_cached_transcript(audio_path: str, text: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> Path:
+    """Store a transcript under the audio file's content hash."""
+    path = cached_transcript_path(audio_path, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def load_whisper_model(name: str = WHISPER_MODEL):
+    """Import and load Whisper on demand."""
+    import whisper
+    logger.info(f"Loading Whisper model '{name}'")
+    return whisper.load_model(name)
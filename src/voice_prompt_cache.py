@@ -0,0 +1,131 @@
+"""
+Persistent cache for Qwen3-TTS voice-clone prompts.
+
+Passing ``ref_audio``/``ref_text`` to ``generate_voice_clone`` makes the model
+decode and encode the reference clip on every call. The prompt it builds
+depends only on the clip, its transcript and the model, so we build it once
+with ``create_voice_clone_prompt`` and keep it in memory and on disk under
+``cache/voice_prompts/``. Later chunks, runs and books reuse it directly.
+
+On disk each prompt item is a plain dict of tensors, flags and the
+transcript, so files are read back with ``torch.load(weights_only=True)``
+and never unpickle arbitrary objects.
+"""
+
+import dataclasses
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import torch
+except ImportError:
+    # hash_file is also used by the MLX engine, which runs without torch
+    torch = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("cache/voice_prompts")
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class VoicePromptCache:
+    """Build each voice-clone prompt once per (clip, transcript, model)."""
+
+    def __init__(self, model, model_id: str, device: str = "cpu", cache_dir: Path = DEFAULT_CACHE_DIR):
+        self.model = model
+        self.model_id = model_id
+        self.device = device
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory = {}
+        self._file_hashes = {}
+        self.encode_seconds = 0.0  # cost of encoding the current prompt
+        self.total_saved = 0.0
+        self._built_now = False
+
+    @property
+    def supported(self) -> bool:
+        """Older qwen-tts releases cannot build reusable prompts."""
+        return hasattr(self.model, 'create_voice_clone_prompt')
+
+    def key(self, ref_audio: str, ref_text: str, x_vector_only_mode: bool) -> str:
+        """Cache key over the clip's content, transcript, mode and model."""
+        stat = Path(ref_audio).stat()
+        file_key = (str(ref_audio), stat.st_size, stat.st_mtime)
+        if file_key not in self._file_hashes:
+            self._file_hashes[file_key] = hash_file(ref_audio)
+        h = hashlib.sha256()
+        for part in (self._file_hashes[file_key], ref_text or '', str(x_vector_only_mode), self.model_id):
+            h.update(part.encode('utf-8'))
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def get(self, ref_audio: str, ref_text: str, x_vector_only_mode: bool = False) -> Optional[Any]:
+        """Return the prompt for a reference clip, building it on first use.
+
+        Returns None when the model cannot build reusable prompts; callers
+        then fall back to passing ``ref_audio``/``ref_text`` directly.
+        """
+        if not self.supported:
+            return None
+
+        key = self.key(ref_audio, ref_text, x_vector_only_mode)
+        if key in self._memory:
+            return self._memory[key]
+
+        path = self.cache_dir / f"{key}.pt"
+        if path.exists():
+            try:
+                from qwen_tts import VoiceClonePromptItem
+                data = torch.load(path, map_location=self.device, weights_only=True)
+                prompt = [VoiceClonePromptItem(**fields) for fields in data['prompt']]
+                self.encode_seconds = data.get('encode_seconds', 0.0)
+                self._memory[key] = prompt
+                logger.info(f"Loaded cached voice prompt {path.name}")
+                return prompt
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable voice prompt cache {path}: {e}")
+
+        start = time.time()
+        prompt = self.model.create_voice_clone_prompt(
+            ref_audio=ref_audio,
+            ref_text=ref_text,
+            x_vector_only_mode=x_vector_only_mode,
+        )
+        self.encode_seconds = time.time() - start
+        try:
+            # Per-process temp name: synthesis workers may build the same prompt
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            items = [
+                {f.name: getattr(item, f.name) for f in dataclasses.fields(item)}
+                for item in prompt
+            ]
+            torch.save({'prompt': items, 'encode_seconds': self.encode_seconds}, tmp)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Could not persist voice prompt to {path}: {e}")
+        self._memory[key] = prompt
+        logger.info(f"Encoded voice prompt in {self.encode_seconds:.2f}s")
+        self._built_now = True
+        return prompt
+
+    def record_use(self) -> float:
+        """Account for one chunk using the prompt; return seconds saved."""
+        if self._built_now:
+            # This chunk paid for the encode
+            self._built_now = False
+            return 0.0
+        self.total_saved += self.encode_seconds
+        return self.encode_seconds
@@ -0,0 +1,71 @@
+"""
+audiobook_converter.combine_chunks streams chunk WAVs into ffmpeg.
+
+ffmpeg is replaced by a script that copies its PCM input to the output
+path, so the test checks that every chunk reaches the encoder and that the
+encoder's exit status is read.
+"""
+
+import logging
+import os
+import stat
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+pytest.importorskip("torch")
+pytest.importorskip("ebooklib")
+pytest.importorskip("qwen_tts")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import audiobook_converter  # noqa: E402
+from audiobook_converter import QwenAudiobookConverter  # noqa: E402
+
+FAKE_FFMPEG = f"""#!{sys.executable}
+import shutil, sys
+with open(sys.argv[-1], "wb") as out:
+    shutil.copyfileobj(sys.stdin.buffer, out)
+sys.exit(int(__import__("os").environ.get("FAKE_FFMPEG_STATUS", "0")))
+"""
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    ffmpeg = bin_dir / "ffmpeg"
+    ffmpeg.write_text(FAKE_FFMPEG)
+    ffmpeg.chmod(ffmpeg.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.chdir(tmp_path)
+
+    Path("chunks").mkdir()
+    for i, frames in ((1, 2400), (2, 1200)):
+        sf.write(f"chunks/chunk_{i:04d}.wav", np.full(frames, 0.25, dtype=np.float32), 24000)
+
+    # Only what combine_chunks uses; no model is loaded
+    conv = QwenAudiobookConverter.__new__(QwenAudiobookConverter)
+    conv.logger = logging.getLogger("test")
+    return conv
+
+
+def test_combine_chunks_streams_every_chunk(converter, tmp_path):
+    out = tmp_path / "book.mp3"
+    assert converter.combine_chunks(2, out, {1: True, 2: True})
+    pcm = np.frombuffer(out.read_bytes(), dtype="<i2")
+    assert len(pcm) == 3600
+
+
+def test_combine_chunks_reports_encoder_failure(converter, tmp_path, monkeypatch):
+    monkeypatch.setenv("FAKE_FFMPEG_STATUS", "1")
+    assert not converter.combine_chunks(2, tmp_path / "book.mp3", {1: True, 2: True})
+
+
+def test_combine_chunks_with_postprocessing(converter, tmp_path, monkeypatch):
+    monkeypatch.setattr(audiobook_converter, "POSTPROCESS", True)
+    out = tmp_path / "book.mp3"
+    assert converter.combine_chunks(2, out, {1: True, 2: True})
+    assert out.stat().st_size > 0
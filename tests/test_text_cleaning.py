@@ -0,0 +1,101 @@
+"""
+The compiled text cleaners must match the cleaning chains they replaced.
+
+src/text_normalizer.TextNormalizer is checked against the old
+apply_text_cleaning chain, openai-audiobook/text_cleaner.TextCleaner
+against the parsers' old footnote removal, on hand-picked cases and on
+random token soup.
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "openai-audiobook"))
+
+from text_normalizer import TextNormalizer  # noqa: E402
+from text_cleaner import TextCleaner  # noqa: E402
+
+
+def chained(text: str, fix_capitals=True, remove_footnotes=True, normalize_chars=True) -> str:
+    """The pre-fusion apply_text_cleaning chain."""
+    if fix_capitals:
+        def fix_word(match):
+            chars = match.group(0).replace(' ', '')
+            return chars[0] + chars[1:].lower() if len(chars) >= 2 else chars
+        text = re.sub(r'\b([A-Z]\s+){2,}[A-Z]+\b', fix_word, text)
+    if remove_footnotes:
+        text = re.sub(r'\s*[*†‡§¶‖¹²³⁴⁵⁶⁷⁸⁹⁰]+\s*', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    if normalize_chars:
+        text = text.replace('—', ' - ').replace('–', ' - ')
+        text = text.replace('“', '"').replace('”', '"')
+        text = text.replace('‘', "'").replace('’', "'")
+        text = text.replace('…', '...')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def old_epub_footnotes(text: str) -> str:
+    """EPUBParser._remove_footnotes before TextCleaner."""
+    for marker in ['*', '†', '‡', '§', '¶', '‖']:
+        text = text.replace(marker, '')
+    text = re.sub(r'\[\d+\]', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def old_pdf_footnotes(text: str) -> str:
+    """PDFParser._remove_footnotes before TextCleaner."""
+    text = re.sub(r'\[\d+\]', '', text)
+    text = re.sub(r'\d+\s*$', '', text, flags=re.MULTILINE)
+    for marker in ['*', '†', '‡', '§', '¶', '‖']:
+        text = text.replace(marker, '')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+CASES = [
+    "a claim.* † Next",
+    "a claim.*†‡ Next",
+    "word¹ ² ³ and more",
+    "A†   †word",
+    "T H E  END\n\nof it.[1] [2]  Then",
+    "“Quoted” — dash – and… more*",
+    "  * leading and trailing †  ",
+    "page text 42 [12]\nnext line 7\n",
+]
+
+TOKENS = [
+    'word', 'T', 'H', 'E', 'A', '*', '†', '¹', '²', '[12]', '—', '“', '”', '’',
+    '…', ' ', '  ', '\n', '\n\n', '\t', 'x.', 'C H A P', '42', '3.14',
+]
+
+
+def random_texts(n: int = 2000, seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield ''.join(rng.choice(TOKENS) + rng.choice(['', ' ', ' ', '\n']) for _ in range(30))
+
+
+OPTIONS = [(True, True, True), (False, True, False), (True, False, True), (False, False, True)]
+
+
+@pytest.mark.parametrize("options", OPTIONS)
+def test_normalizer_matches_chain(options):
+    normalizer = TextNormalizer(*options)
+    for text in [*CASES, *random_texts()]:
+        assert normalizer(text) == chained(text, *options), repr(text)
+
+
+def test_normalizer_collapses_marker_runs():
+    assert TextNormalizer()("a claim.* † Next") == "a claim. Next"
+
+
+@pytest.mark.parametrize("pdf, old", [(False, old_epub_footnotes), (True, old_pdf_footnotes)])
+def test_cleaner_matches_old_footnote_removal(pdf, old):
+    cleaner = TextCleaner(remove_footnotes=True, pdf=pdf)
+    for text in [*CASES, *random_texts()]:
+        assert cleaner(text) == old(text), repr(text)
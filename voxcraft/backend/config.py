@@ -24,6 +24,8 @@ class Settings(BaseSettings):
     audio_dir: Path = data_dir / "audio"
     projects_dir: Path = data_dir / "projects"
     voices_dir: Path = data_dir / "voices"
+    # Parsed books (metadata + chapter text), keyed by file content hash
+    book_store_db: Path = data_dir / "books.db"
 
     # CORS
     cors_origins: list[str] = ["http://localhost:5173", "http://127.0.0.1:5173"]
@@ -31,6 +33,14 @@ class Settings(BaseSettings):
     # Engine - auto-detect MLX availability
     default_engine: str = _detect_default_engine()  # "mlx" or "openai"
 
+    # MLX model pool: GB of weights kept resident (None = half of system RAM),
+    # and seconds a model may sit unused before it is unloaded (0 = never)
+    mlx_model_budget_gb: float | None = None
+    mlx_model_idle_ttl: int = 0
+
+    # Sample type of audiobook chunks and output: "float32" or "int16"
+    audiobook_sample_dtype: str = "float32"
+
     # Deployment
     deployment_mode: str = "local"  # "local" or "cloud"
     license_required: bool = False
@@ -12,6 +12,8 @@ import os
 import sys
 from pathlib import Path
 
+from backend.config import settings
+
 # Add the project src/ directory to the path
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 _SRC_DIR = _PROJECT_ROOT / "src"
@@ -25,6 +27,7 @@ try:
         MLX_SPEAKERS,
         MLX_LANGUAGES,
         MLX_MODEL_IDS,
+        MLX_MODEL_SIZES_GB,
     )
     _MLX_AVAILABLE = True
 except ImportError as e:
@@ -32,15 +35,26 @@ except ImportError as e:
     _MLX_AVAILABLE = False
     # Create dummy classes/values for when MLX is not available
     class MLXTTSEngine:
-        def __init__(self):
+        def __init__(self, *args, **kwargs):
             self.is_loaded = False
             self.current_model_id = None
+            self.memory_budget_gb = None
+            self.resident_gb = 0.0
+
+        def resident_models(self):
+            return []
+
+        def unload_idle(self):
+            return []
         
         def load_model(self, *args, **kwargs):
             raise RuntimeError("MLX TTS is not available. Install mlx-audio or use OpenAI engine.")
         
         def generate_speech(self, *args, **kwargs):
             raise RuntimeError("MLX TTS is not available. Install mlx-audio or use OpenAI engine.")
+
+        def iter_speech(self, *args, **kwargs):
+            raise RuntimeError("MLX TTS is not available. Install mlx-audio or use OpenAI engine.")
         
         def generate_audiobook(self, *args, **kwargs):
             raise RuntimeError("MLX TTS is not available. Install mlx-audio or use OpenAI engine.")
@@ -48,6 +62,7 @@ except ImportError as e:
     MLX_SPEAKERS = []
     MLX_LANGUAGES = []
     MLX_MODEL_IDS = {}
+    MLX_MODEL_SIZES_GB = {}
 
 # Always import OpenAI engine (should work without MLX)
 from mlx_tts_engine import (  # noqa: E402
@@ -57,6 +72,7 @@ from mlx_tts_engine import (  # noqa: E402
     SAMPLE_RATE,
     extract_text_from_file,
     extract_book_metadata,
+    clean_extracted_text,
     split_into_chunks,
     apply_text_cleaning,
     estimate_openai_cost,
@@ -65,9 +81,26 @@ from mlx_tts_engine import (  # noqa: E402
     BookMetadata,
 )
 
+def _default_model_budget_gb() -> float | None:
+    """Half of physical memory, or None (single resident model) if unknown."""
+    try:
+        import psutil
+        return round(psutil.virtual_memory().total / (1024 ** 3) / 2, 1)
+    except ImportError:
+        return None
+
+
 # Singletons
-mlx_engine = MLXTTSEngine()
-openai_engine = OpenAITTSEngine()
+mlx_engine = MLXTTSEngine(
+    memory_budget_gb=(
+        settings.mlx_model_budget_gb
+        if settings.mlx_model_budget_gb is not None
+        else _default_model_budget_gb()
+    ),
+    idle_ttl=settings.mlx_model_idle_ttl or None,
+    sample_dtype=settings.audiobook_sample_dtype,
+)
+openai_engine = OpenAITTSEngine(sample_dtype=settings.audiobook_sample_dtype)
 
 # Async locks — MLX is not thread-safe
 mlx_lock = asyncio.Lock()
@@ -81,7 +114,7 @@ def get_openai_engine(api_key: str | None = None) -> OpenAITTSEngine:
     Otherwise falls back to the singleton (uses OPENAI_API_KEY env var).
     """
     if api_key:
-        engine = OpenAITTSEngine()
+        engine = OpenAITTSEngine(sample_dtype=settings.audiobook_sample_dtype)
         # Directly inject a pre-configured client
         from openai import OpenAI
         engine._client = OpenAI(api_key=api_key)
@@ -11,6 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from backend.config import settings
+from backend.engine import mlx_engine, mlx_lock
 from backend.middleware.session import SessionMiddleware
 from backend.routers import system, tts, books, audiobook, casting, audio, export, license, cleaning, voices, url_reader, queue
 from backend.models.queue import init_database
@@ -32,13 +33,26 @@ async def _cleanup_expired_sessions():
                     shutil.rmtree(child, ignore_errors=True)
 
 
+async def _unload_idle_models():
+    """Periodically drop MLX models unused for longer than the idle TTL."""
+    while True:
+        await asyncio.sleep(max(30, settings.mlx_model_idle_ttl // 4))
+        async with mlx_lock:
+            await asyncio.to_thread(mlx_engine.unload_idle)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     settings.ensure_dirs()
     init_database("data/queue.db")
     cleanup_task = asyncio.create_task(_cleanup_expired_sessions())
+    idle_task = None
+    if settings.mlx_model_idle_ttl:
+        idle_task = asyncio.create_task(_unload_idle_models())
     yield
     cleanup_task.cancel()
+    if idle_task:
+        idle_task.cancel()
 
 
 app = FastAPI(
@@ -54,6 +68,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Task-Id", "X-Sample-Rate"],
 )
 
 app.include_router(system.router)
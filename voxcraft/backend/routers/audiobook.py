@@ -39,8 +39,9 @@ async def convert(req: ConvertRequest, request: Request):
 
             # If specific chapters selected, extract only those to a temp file
             if req.chapter_ids:
-                text = extract_chapter_text(book_path, req.chapter_ids)
-                text = apply_text_cleaning(
+                text = await asyncio.to_thread(extract_chapter_text, book_path, req.chapter_ids)
+                text = await asyncio.to_thread(
+                    apply_text_cleaning,
                     text,
                     fix_capitals=req.fix_capitals,
                     remove_footnotes=req.remove_footnotes,
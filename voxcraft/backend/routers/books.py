@@ -1,13 +1,14 @@
 """Book upload and metadata endpoints."""
 
+import asyncio
 import json
 import shutil
 import uuid
 
 from fastapi import APIRouter, HTTPException, Request, UploadFile, File
 
-from backend.engine import extract_book_metadata
 from backend.schemas.book import BookUploadResponse, BookMetadataResponse, ChapterInfo
+from backend.services.book_store import book_store
 
 router = APIRouter(prefix="/api/books", tags=["books"])
 
@@ -28,7 +29,8 @@ async def upload_book(request: Request, file: UploadFile = File(...)):
     with open(dest, "wb") as f:
         shutil.copyfileobj(file.file, f)
 
-    meta = extract_book_metadata(dest)
+    # Parsed once per distinct file; later reads come from the store
+    meta = await asyncio.to_thread(book_store.load, dest)
 
     chapters = [
         ChapterInfo(id=ch["id"], title=ch["title"], word_count=ch["word_count"])
@@ -8,10 +8,13 @@ from fastapi import APIRouter, Request
 from sse_starlette.sse import EventSourceResponse
 
 from backend.config import settings
-from backend.engine import mlx_engine, mlx_lock, openai_engine, get_device_info, is_openai_key_valid, MLX_MODEL_IDS
+from backend.engine import (
+    mlx_engine, mlx_lock, openai_engine, get_device_info, is_openai_key_valid,
+    MLX_MODEL_IDS, MLX_MODEL_SIZES_GB,
+)
 from backend.schemas.system import (
     HealthResponse, DeviceInfo, EngineStatus, ModeResponse, ValidateKeyResponse,
-    ModelCacheStatus, PreloadRequest,
+    ModelCacheStatus, PreloadRequest, ResidentModel,
 )
 from backend.utils.sse import sse_manager
 
@@ -37,6 +40,9 @@ async def engine_status():
         mlx_loaded=mlx_engine.is_loaded,
         mlx_model_id=mlx_engine.current_model_id,
         openai_available=openai_engine.api_key_available(),
+        mlx_resident_models=[ResidentModel(**m) for m in mlx_engine.resident_models()],
+        mlx_resident_gb=mlx_engine.resident_gb,
+        mlx_memory_budget_gb=mlx_engine.memory_budget_gb,
     )
 
 
@@ -63,14 +69,6 @@ async def validate_openai_key(request: Request):
     return ValidateKeyResponse(valid=valid, error=error)
 
 
-# Model size estimates (approximate download sizes in GB)
-_MODEL_SIZES: dict[str, float] = {
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-CustomVoice-8bit": 2.0,
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16": 3.5,
-    "mlx-community/Qwen3-TTS-12Hz-1.7B-VoiceDesign-bf16": 3.5,
-}
-
-
 def _is_model_cached(model_id: str) -> bool:
     """Check if a HuggingFace model is already cached locally."""
     try:
@@ -94,7 +92,7 @@ async def model_cached(voice_mode: str):
     return ModelCacheStatus(
         cached=cached,
         model_id=model_id,
-        size_gb=_MODEL_SIZES.get(model_id, 4.0),
+        size_gb=MLX_MODEL_SIZES_GB.get(model_id, 4.0),
     )
 
 
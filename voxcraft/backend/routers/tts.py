@@ -1,11 +1,16 @@
 """TTS generation endpoints."""
 
 import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
 import uuid
 
 import numpy as np
 import soundfile as sf
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
 from backend.engine import (
@@ -19,8 +24,16 @@ from backend.schemas.tts import (
 from backend.routers.voices import resolve_voice_audio_path
 from backend.utils.sse import sse_manager
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/tts", tags=["tts"])
 
+# Frames buffered between the model thread and a slow client
+STREAM_QUEUE_FRAMES = 8
+# Seconds the model thread waits for the client to take a frame before it
+# gives up, so a stalled client cannot hold mlx_lock indefinitely
+STREAM_STALL_TIMEOUT = 30.0
+
 
 @router.post("/generate", response_model=TTSTaskResponse)
 async def generate(req: TTSRequest, request: Request):
@@ -29,7 +42,8 @@ async def generate(req: TTSRequest, request: Request):
     audio_dir = request.state.audio_dir
 
     # Clean text
-    text = apply_text_cleaning(
+    text = await asyncio.to_thread(
+        apply_text_cleaning,
         req.text,
         fix_capitals=req.fix_capitals,
         remove_footnotes=req.remove_footnotes,
@@ -83,6 +97,128 @@ async def generate(req: TTSRequest, request: Request):
     return TTSTaskResponse(task_id=task_id)
 
 
+def _to_pcm16(frame: np.ndarray) -> bytes:
+    """Convert a float PCM frame to little-endian 16-bit bytes."""
+    return (np.clip(frame, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+@router.post("/generate-stream")
+async def generate_stream(req: TTSRequest):
+    """Stream raw 16-bit mono PCM as the MLX model produces each segment.
+
+    Progress and the time-to-first-audio metric are published on the SSE
+    channel named in the X-Task-Id header (``first_audio``, then
+    ``complete`` or ``error``, also when the client disconnects); the
+    channel expires if nobody subscribes to it. Generation is paced by the
+    client: the model thread blocks while STREAM_QUEUE_FRAMES frames are
+    waiting to be sent, and gives up (releasing mlx_lock) if none is taken
+    for STREAM_STALL_TIMEOUT seconds.
+    """
+    if req.engine != "mlx":
+        raise HTTPException(status_code=400, detail="Streaming is only available for the MLX engine")
+
+    task_id = uuid.uuid4().hex[:12]
+    text = await asyncio.to_thread(
+        apply_text_cleaning,
+        req.text,
+        fix_capitals=req.fix_capitals,
+        remove_footnotes=req.remove_footnotes,
+        normalize_chars=req.normalize_chars,
+    )
+    ref_audio = resolve_voice_audio_path(req.ref_audio)
+    loop = asyncio.get_running_loop()
+    frames: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_FRAMES)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        # Block the model thread until there is room, giving up once the
+        # consumer stops or has not taken a frame within the stall timeout
+        future = asyncio.run_coroutine_threadsafe(frames.put(item), loop)
+        deadline = time.monotonic() + STREAM_STALL_TIMEOUT
+        while True:
+            try:
+                future.result(timeout=0.1)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop.is_set() or time.monotonic() > deadline:
+                    future.cancel()
+                    return False
+
+    def _produce():
+        for frame in mlx_engine.iter_speech(
+            text=text,
+            voice_mode=req.voice_mode,
+            speaker=req.speaker,
+            language=req.language,
+            instruct=req.instruct,
+            ref_audio=ref_audio,
+            ref_text=req.ref_text,
+            voice_description=req.voice_description,
+        ):
+            if stop.is_set():
+                return
+            if not _put(frame):
+                if not stop.is_set():
+                    raise RuntimeError(f"Client read nothing for {STREAM_STALL_TIMEOUT:.0f} s")
+                return
+
+    async def _run():
+        # mlx_lock is held while the model runs, not while the client reads
+        # what is already queued
+        end = None
+        try:
+            async with mlx_lock:
+                if not stop.is_set():
+                    await asyncio.to_thread(_produce)
+        except Exception as e:
+            end = e
+        if not stop.is_set():
+            await frames.put(end)
+
+    async def _body():
+        started = time.perf_counter()
+        first_audio = None
+        samples = 0
+        terminal = ("error", {"message": "Client disconnected"})
+        runner = asyncio.create_task(_run())
+        try:
+            while True:
+                item = await frames.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    terminal = ("error", {"message": str(item)})
+                    return
+                if first_audio is None:
+                    first_audio = time.perf_counter() - started
+                    logger.info(f"TTS stream {task_id}: first audio after {first_audio * 1000:.0f} ms")
+                    sse_manager.publish(task_id, "first_audio", {
+                        "time_to_first_audio_ms": round(first_audio * 1000),
+                    })
+                samples += len(item)
+                yield _to_pcm16(item)
+            terminal = ("complete", {
+                "time_to_first_audio_ms": round((first_audio or 0) * 1000),
+                "total_ms": round((time.perf_counter() - started) * 1000),
+                "duration": round(samples / SAMPLE_RATE, 2),
+                "sample_rate": SAMPLE_RATE,
+            })
+        finally:
+            # Always end the channel, so subscribers finish and it can expire
+            sse_manager.publish(task_id, *terminal)
+            stop.set()
+            # Free a final put that may be waiting on a full queue
+            while not frames.empty():
+                frames.get_nowait()
+            await runner
+
+    return StreamingResponse(
+        _body(),
+        media_type=f"audio/L16; rate={SAMPLE_RATE}; channels=1",
+        headers={"X-Task-Id": task_id, "X-Sample-Rate": str(SAMPLE_RATE)},
+    )
+
+
 @router.get("/stream/{task_id}")
 async def stream(task_id: str):
     return EventSourceResponse(sse_manager.subscribe(task_id), ping=15)
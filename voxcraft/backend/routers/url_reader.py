@@ -98,7 +98,8 @@ async def convert_url(req: URLConvertRequest, request: Request):
                 text = content_processor.create_full_reading(fetched)
 
             text = content_processor.format_for_audio(text)
-            text = apply_text_cleaning(
+            text = await asyncio.to_thread(
+                apply_text_cleaning,
                 text,
                 fix_capitals=req.fix_capitals,
                 remove_footnotes=req.remove_footnotes,
@@ -12,10 +12,20 @@ class DeviceInfo(BaseModel):
     accelerator: str | None
 
 
+class ResidentModel(BaseModel):
+    model_id: str
+    size_gb: float
+    idle_seconds: float
+    active: bool
+
+
 class EngineStatus(BaseModel):
     mlx_loaded: bool
     mlx_model_id: str | None
     openai_available: bool
+    mlx_resident_models: list[ResidentModel] = []
+    mlx_resident_gb: float = 0.0
+    mlx_memory_budget_gb: float | None = None
 
 
 class ModeResponse(BaseModel):
@@ -0,0 +1,204 @@
+"""Parse-once store of uploaded books, keyed by file content hash.
+
+Upload, chapter selection and casting used to parse the same book file
+independently (metadata pass, a second zip/BeautifulSoup pass over the
+selected spine items, a third full-text pass). The store parses a book once
+with extract_book_metadata, saves its metadata and every chapter's extracted
+text (zlib-compressed) and word count in SQLite, and all of them read from
+there. Re-uploading an identical file skips parsing entirely.
+
+Text is stored as extracted. full_text applies the cleanup
+extract_text_from_file did for whole books (clean_extracted_text), and
+per-request cleaning (apply_text_cleaning) still runs on what is read back.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+
+from backend.config import settings
+from backend.engine import extract_book_metadata, clean_extracted_text, BookMetadata
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction changes so stored books are parsed again
+PARSER_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    hash TEXT PRIMARY KEY,
+    parser_version INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    total_words INTEGER NOT NULL,
+    cover_image TEXT
+);
+CREATE TABLE IF NOT EXISTS chapters (
+    hash TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    word_count INTEGER NOT NULL,
+    text BLOB NOT NULL,
+    PRIMARY KEY (hash, position)
+);
+"""
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's content."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class BookStore:
+    """SQLite-backed parsed-book store. Safe to use from worker threads."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._ready = False
+        self._lock = threading.Lock()
+        # path -> (mtime_ns, size, hash), so unchanged files are hashed once
+        self._hashes: dict[str, tuple[int, int, str]] = {}
+        # (hash, PARSER_VERSION) -> metadata of books that parsed to no
+        # chapters. Kept in memory only, so a restart (e.g. after installing
+        # a missing parser dependency) tries them again.
+        self._empty: dict[tuple[str, int], BookMetadata] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    self._ready = True
+        return conn
+
+    def content_hash(self, file_path: str | Path) -> str:
+        path = Path(file_path)
+        st = path.stat()
+        with self._lock:
+            cached = self._hashes.get(str(path))
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        digest = file_hash(path)
+        with self._lock:
+            self._hashes[str(path)] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+    def _load_metadata(self, conn: sqlite3.Connection, digest: str) -> BookMetadata | None:
+        row = conn.execute(
+            "SELECT format, title, author, total_words, cover_image FROM books "
+            "WHERE hash = ? AND parser_version = ?",
+            (digest, PARSER_VERSION),
+        ).fetchone()
+        if row is None:
+            return None
+        meta = BookMetadata()
+        meta.format, meta.title, meta.author, meta.total_words, meta.cover_image = row
+        meta.chapters = [
+            {"id": cid, "title": title, "word_count": wc}
+            for cid, title, wc in conn.execute(
+                "SELECT id, title, word_count FROM chapters WHERE hash = ? ORDER BY position",
+                (digest,),
+            )
+        ]
+        return meta
+
+    def _save(self, conn: sqlite3.Connection, digest: str, meta: BookMetadata):
+        with conn:
+            conn.execute("DELETE FROM chapters WHERE hash = ?", (digest,))
+            conn.execute(
+                "INSERT OR REPLACE INTO books VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (digest, PARSER_VERSION, meta.format, meta.title, meta.author,
+                 meta.total_words, meta.cover_image),
+            )
+            conn.executemany(
+                "INSERT INTO chapters VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (digest, i, ch["id"], ch["title"], ch["word_count"],
+                     zlib.compress(meta.chapter_texts.get(ch["id"], "").encode("utf-8")))
+                    for i, ch in enumerate(meta.chapters)
+                ],
+            )
+
+    def load(self, file_path: str | Path) -> BookMetadata:
+        """Metadata and chapter list of a book, parsing it on first sight."""
+        digest = self.content_hash(file_path)
+        with self._lock:
+            empty = self._empty.get((digest, PARSER_VERSION))
+        if empty is not None:
+            return empty
+        conn = self._connect()
+        try:
+            meta = self._load_metadata(conn, digest)
+            if meta is None:
+                meta = extract_book_metadata(Path(file_path))
+                if not meta.chapters:
+                    # Likely a failed parse; don't persist it, but don't
+                    # parse it again on every request either
+                    logger.warning(f"No chapters found in {Path(file_path).name}; not storing it")
+                    with self._lock:
+                        self._empty[(digest, PARSER_VERSION)] = meta
+                    return meta
+                self._save(conn, digest, meta)
+                logger.info(f"Parsed {Path(file_path).name}: {len(meta.chapters)} chapters")
+            return meta
+        finally:
+            conn.close()
+
+    def chapter_texts(
+        self, file_path: str | Path, chapter_ids: list[str] | None = None,
+        max_chars: int | None = None,
+    ) -> list[str]:
+        """Stored text of the given chapters (all if None), in book order.
+
+        With max_chars, stops once that many characters have been read.
+        """
+        self.load(file_path)
+        digest = self.content_hash(file_path)
+        wanted = set(chapter_ids) if chapter_ids is not None else None
+        texts, size = [], 0
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT id, text FROM chapters WHERE hash = ? ORDER BY position", (digest,)
+            )
+            for cid, blob in rows:
+                if wanted is not None and cid not in wanted:
+                    continue
+                text = zlib.decompress(blob).decode("utf-8")
+                if not text.strip():
+                    continue
+                texts.append(text)
+                size += len(text)
+                if max_chars is not None and size >= max_chars:
+                    break
+        finally:
+            conn.close()
+        return texts
+
+    def book_text(
+        self, file_path: str | Path, chapter_ids: list[str] | None = None,
+        max_chars: int | None = None,
+    ) -> str:
+        """Chapter texts joined with blank lines."""
+        return "\n\n".join(self.chapter_texts(file_path, chapter_ids, max_chars))
+
+    def full_text(self, file_path: str | Path, max_chars: int | None = None) -> str:
+        """Whole-book text, cleaned as extract_text_from_file would return it."""
+        meta = self.load(file_path)
+        return clean_extracted_text(self.book_text(file_path, max_chars=max_chars), meta.format)
+
+
+book_store = BookStore(settings.book_store_db)
@@ -1,12 +1,13 @@
 """Casting Director service — GPT-4o powered character detection."""
 
+import asyncio
 import json
 import logging
 import os
-from pathlib import Path
 from typing import Optional
 
-from backend.engine import extract_text_from_file, split_into_chunks
+from backend.engine import split_into_chunks
+from backend.services.book_store import book_store
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +38,8 @@ async def analyze_characters(file_path: str, api_key: str | None = None) -> list
     from openai import AsyncOpenAI
     client = AsyncOpenAI(api_key=api_key)
 
-    text = extract_text_from_file(Path(file_path))
     # Sample ~10k chars from the beginning (usually has the most character introductions)
+    text = await asyncio.to_thread(book_store.full_text, file_path, max_chars=10_000)
     sample = text[:10_000]
 
     response = await client.chat.completions.create(
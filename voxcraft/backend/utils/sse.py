@@ -2,33 +2,58 @@
 
 import asyncio
 import json
+import time
 from collections import defaultdict
 from typing import Any
 
+# A finished channel nobody has subscribed to is dropped after this many seconds
+UNSUBSCRIBED_TTL = 300.0
+
 
 class SSEManager:
     """Publish / subscribe hub for SSE progress events."""
 
     def __init__(self):
         self._channels: dict[str, asyncio.Queue] = defaultdict(lambda: asyncio.Queue())
+        self._subscribed: set[str] = set()
+        # task_id -> when its final event was published with no subscriber
+        self._finished: dict[str, float] = {}
 
     def publish(self, task_id: str, event: str, data: dict[str, Any]):
         """Push an event onto the task's channel (non-blocking)."""
+        self._expire()
         msg = {"event": event, "data": json.dumps(data)}
         q = self._channels[task_id]
         q.put_nowait(msg)
+        if event in ("complete", "error") and task_id not in self._subscribed:
+            self._finished[task_id] = time.monotonic()
 
     async def subscribe(self, task_id: str):
         """Async generator that yields dicts for sse_starlette to encode."""
+        self._subscribed.add(task_id)
+        self._finished.pop(task_id, None)
         q = self._channels[task_id]
-        while True:
-            msg = await q.get()
-            yield msg
-            if msg["event"] in ("complete", "error"):
-                break
+        try:
+            while True:
+                msg = await q.get()
+                yield msg
+                if msg["event"] in ("complete", "error"):
+                    break
+        finally:
+            self._subscribed.discard(task_id)
         # Clean up after stream ends
         self._channels.pop(task_id, None)
 
+    def _expire(self):
+        """Drop finished channels that were never subscribed to within the TTL."""
+        if not self._finished:
+            return
+        cutoff = time.monotonic() - UNSUBSCRIBED_TTL
+        for task_id, finished in list(self._finished.items()):
+            if finished < cutoff:
+                del self._finished[task_id]
+                self._channels.pop(task_id, None)
+
     def make_progress_callback(self, task_id: str):
         """Return a sync callback(fraction, message) that publishes SSE events."""
         def callback(fraction: float, message: str):